@@ -1,9 +1,9 @@
 from typing import List
 
-import pandas_ta as ta  # noqa: F401
 from pydantic import Field, validator
 
 from hummingbot.client.config.config_data_types import ClientFieldData
+from hummingbot.data_feed.candles_feed.candles_indicators import BollingerBands, CandlesIndicators
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
 from hummingbot.strategy_v2.controllers.directional_trading_controller_base import (
     DirectionalTradingControllerBase,
@@ -69,6 +69,7 @@ class BollingerV1Controller(DirectionalTradingControllerBase):
     def __init__(self, config: BollingerV1ControllerConfig, *args, **kwargs):
         self.config = config
         self.max_records = self.config.bb_length
+        self.indicators = CandlesIndicators([BollingerBands(length=self.config.bb_length, std=self.config.bb_std)])
         if len(self.config.candles_config) == 0:
             self.config.candles_config = [CandlesConfig(
                 connector=config.candles_connector,
@@ -84,7 +85,7 @@ class BollingerV1Controller(DirectionalTradingControllerBase):
                                                       interval=self.config.interval,
                                                       max_records=self.max_records)
         # Add indicators
-        df.ta.bbands(length=self.config.bb_length, std=self.config.bb_std, append=True)
+        df = self.indicators.update(df)
         bbp = df[f"BBP_{self.config.bb_length}_{self.config.bb_std}"]
 
         # Generate signal
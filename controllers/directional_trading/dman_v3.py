@@ -1,12 +1,13 @@
 import time
 from decimal import Decimal
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
-import pandas_ta as ta  # noqa: F401
+import pandas as pd
 from pydantic import Field, validator
 
 from hummingbot.client.config.config_data_types import ClientFieldData
 from hummingbot.core.data_type.common import TradeType
+from hummingbot.data_feed.candles_feed.candles_indicators import BollingerBands, CandlesIndicators
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
 from hummingbot.strategy_v2.controllers.directional_trading_controller_base import (
     DirectionalTradingControllerBase,
@@ -154,6 +155,7 @@ class DManV3Controller(DirectionalTradingControllerBase):
     def __init__(self, config: DManV3ControllerConfig, *args, **kwargs):
         self.config = config
         self.max_records = config.bb_length
+        self.indicators = self.get_indicators(config)
         if len(self.config.candles_config) == 0:
             self.config.candles_config = [CandlesConfig(
                 connector=config.candles_connector,
@@ -163,26 +165,37 @@ class DManV3Controller(DirectionalTradingControllerBase):
             )]
         super().__init__(config, *args, **kwargs)
 
+    @staticmethod
+    def get_indicators(config: DManV3ControllerConfig) -> CandlesIndicators:
+        return CandlesIndicators([BollingerBands(length=config.bb_length, std=config.bb_std)])
+
+    def get_candles_windows(self) -> List[pd.DataFrame]:
+        return [self.market_data_provider.get_candles_df(connector_name=self.config.candles_connector,
+                                                         trading_pair=self.config.candles_trading_pair,
+                                                         interval=self.config.interval,
+                                                         max_records=self.max_records)]
+
     async def update_processed_data(self):
-        df = self.market_data_provider.get_candles_df(connector_name=self.config.candles_connector,
-                                                      trading_pair=self.config.candles_trading_pair,
-                                                      interval=self.config.interval,
-                                                      max_records=self.max_records)
+        df = self.get_candles_windows()[0]
         # Add indicators
-        df.ta.bbands(length=self.config.bb_length, std=self.config.bb_std, append=True)
+        df = self.indicators.update(df)
+        self.processed_data.update(self.get_processed_data(df, self.config))
 
-        # Generate signal
-        long_condition = df[f"BBP_{self.config.bb_length}_{self.config.bb_std}"] < self.config.bb_long_threshold
-        short_condition = df[f"BBP_{self.config.bb_length}_{self.config.bb_std}"] > self.config.bb_short_threshold
+    @staticmethod
+    def compute_processed_data(candles: List[pd.DataFrame], config: DManV3ControllerConfig) -> Dict[str, Any]:
+        df = DManV3Controller.get_indicators(config).update(candles[0])
+        return DManV3Controller.get_processed_data(df, config)
+
+    @staticmethod
+    def get_processed_data(df: pd.DataFrame, config: DManV3ControllerConfig) -> Dict[str, Any]:
+        long_condition = df[f"BBP_{config.bb_length}_{config.bb_std}"] < config.bb_long_threshold
+        short_condition = df[f"BBP_{config.bb_length}_{config.bb_std}"] > config.bb_short_threshold
 
         # Generate signal
         df["signal"] = 0
         df.loc[long_condition, "signal"] = 1
         df.loc[short_condition, "signal"] = -1
-
-        # Update processed data
-        self.processed_data["signal"] = df["signal"].iloc[-1]
-        self.processed_data["features"] = df
+        return {"signal": df["signal"].iloc[-1], "features": df}
 
     def get_spread_multiplier(self) -> Decimal:
         if self.config.dynamic_order_spread:
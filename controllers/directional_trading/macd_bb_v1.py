@@ -1,9 +1,10 @@
-from typing import List
+from typing import Any, Dict, List
 
-import pandas_ta as ta  # noqa: F401
+import pandas as pd
 from pydantic import Field, validator
 
 from hummingbot.client.config.config_data_types import ClientFieldData
+from hummingbot.data_feed.candles_feed.candles_indicators import MACD, BollingerBands, CandlesIndicators
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
 from hummingbot.strategy_v2.controllers.directional_trading_controller_base import (
     DirectionalTradingControllerBase,
@@ -85,6 +86,7 @@ class MACDBBV1Controller(DirectionalTradingControllerBase):
     def __init__(self, config: MACDBBV1ControllerConfig, *args, **kwargs):
         self.config = config
         self.max_records = max(config.macd_slow, config.macd_fast, config.macd_signal, config.bb_length)
+        self.indicators = self.get_indicators(config)
         if len(self.config.candles_config) == 0:
             self.config.candles_config = [CandlesConfig(
                 connector=config.candles_connector,
@@ -94,27 +96,41 @@ class MACDBBV1Controller(DirectionalTradingControllerBase):
             )]
         super().__init__(config, *args, **kwargs)
 
+    @staticmethod
+    def get_indicators(config: MACDBBV1ControllerConfig) -> CandlesIndicators:
+        return CandlesIndicators([
+            BollingerBands(length=config.bb_length, std=config.bb_std),
+            MACD(fast=config.macd_fast, slow=config.macd_slow, signal=config.macd_signal),
+        ])
+
+    def get_candles_windows(self) -> List[pd.DataFrame]:
+        return [self.market_data_provider.get_candles_df(connector_name=self.config.candles_connector,
+                                                         trading_pair=self.config.candles_trading_pair,
+                                                         interval=self.config.interval,
+                                                         max_records=self.max_records)]
+
     async def update_processed_data(self):
-        df = self.market_data_provider.get_candles_df(connector_name=self.config.candles_connector,
-                                                      trading_pair=self.config.candles_trading_pair,
-                                                      interval=self.config.interval,
-                                                      max_records=self.max_records)
+        df = self.get_candles_windows()[0]
         # Add indicators
-        df.ta.bbands(length=self.config.bb_length, std=self.config.bb_std, append=True)
-        df.ta.macd(fast=self.config.macd_fast, slow=self.config.macd_slow, signal=self.config.macd_signal, append=True)
+        df = self.indicators.update(df)
+        self.processed_data.update(self.get_processed_data(df, self.config))
 
-        bbp = df[f"BBP_{self.config.bb_length}_{self.config.bb_std}"]
-        macdh = df[f"MACDh_{self.config.macd_fast}_{self.config.macd_slow}_{self.config.macd_signal}"]
-        macd = df[f"MACD_{self.config.macd_fast}_{self.config.macd_slow}_{self.config.macd_signal}"]
+    @staticmethod
+    def compute_processed_data(candles: List[pd.DataFrame], config: MACDBBV1ControllerConfig) -> Dict[str, Any]:
+        df = MACDBBV1Controller.get_indicators(config).update(candles[0])
+        return MACDBBV1Controller.get_processed_data(df, config)
+
+    @staticmethod
+    def get_processed_data(df: pd.DataFrame, config: MACDBBV1ControllerConfig) -> Dict[str, Any]:
+        bbp = df[f"BBP_{config.bb_length}_{config.bb_std}"]
+        macdh = df[f"MACDh_{config.macd_fast}_{config.macd_slow}_{config.macd_signal}"]
+        macd = df[f"MACD_{config.macd_fast}_{config.macd_slow}_{config.macd_signal}"]
 
         # Generate signal
-        long_condition = (bbp < self.config.bb_long_threshold) & (macdh > 0) & (macd < 0)
-        short_condition = (bbp > self.config.bb_short_threshold) & (macdh < 0) & (macd > 0)
+        long_condition = (bbp < config.bb_long_threshold) & (macdh > 0) & (macd < 0)
+        short_condition = (bbp > config.bb_short_threshold) & (macdh < 0) & (macd > 0)
 
         df["signal"] = 0
         df.loc[long_condition, "signal"] = 1
         df.loc[short_condition, "signal"] = -1
-
-        # Update processed data
-        self.processed_data["signal"] = df["signal"].iloc[-1]
-        self.processed_data["features"] = df
+        return {"signal": df["signal"].iloc[-1], "features": df}
@@ -0,0 +1,52 @@
+from typing import Dict
+
+import numpy as np
+from pydantic import Field
+
+from hummingbot.client.config.config_data_types import ClientFieldData
+from hummingbot.data_feed.candles_feed.batched_indicators import rsi
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.strategy_v2.controllers.multi_pair_directional_controller_base import (
+    MultiPairDirectionalControllerBase,
+    MultiPairDirectionalControllerConfigBase,
+)
+
+
+class MultiPairRSIV1ControllerConfig(MultiPairDirectionalControllerConfigBase):
+    controller_name = "multi_pair_rsi_v1"
+    rsi_length: int = Field(
+        default=14,
+        gt=0,
+        client_data=ClientFieldData(
+            prompt=lambda mi: "Enter the RSI length: ",
+            prompt_on_new=True))
+    rsi_low: float = Field(
+        default=30,
+        client_data=ClientFieldData(
+            is_updatable=True,
+            prompt=lambda mi: "Enter the RSI lower bound to enter a long position (e.g. 30): ",
+            prompt_on_new=True))
+    rsi_high: float = Field(
+        default=70,
+        client_data=ClientFieldData(
+            is_updatable=True,
+            prompt=lambda mi: "Enter the RSI upper bound to enter a short position (e.g. 70): ",
+            prompt_on_new=True))
+
+
+class MultiPairRSIV1Controller(MultiPairDirectionalControllerBase):
+    """
+    RSI screener: goes long the trading pairs with an RSI below rsi_low and short the ones above rsi_high. The RSI of
+    all the trading pairs is computed in one pass over the candles array.
+    """
+    close_index = CandlesBase.columns.index("close")
+
+    def __init__(self, config: MultiPairRSIV1ControllerConfig, *args, **kwargs):
+        self.config = config
+        super().__init__(config, *args, **kwargs)
+
+    def compute_features(self, candles: np.ndarray) -> Dict[str, np.ndarray]:
+        close = candles[:, :, self.close_index]
+        last_rsi = rsi(close, self.config.rsi_length)[:, -1]
+        signal = np.where(last_rsi < self.config.rsi_low, 1, np.where(last_rsi > self.config.rsi_high, -1, 0))
+        return {"close": close[:, -1], f"RSI_{self.config.rsi_length}": last_rsi, "signal": signal}
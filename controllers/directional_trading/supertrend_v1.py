@@ -1,9 +1,9 @@
 from typing import List, Optional
 
-import pandas_ta as ta  # noqa: F401
 from pydantic import Field, validator
 
 from hummingbot.client.config.config_data_types import ClientFieldData
+from hummingbot.data_feed.candles_feed.candles_indicators import CandlesIndicators, Supertrend
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
 from hummingbot.strategy_v2.controllers.directional_trading_controller_base import (
     DirectionalTradingControllerBase,
@@ -38,6 +38,7 @@ class SuperTrend(DirectionalTradingControllerBase):
     def __init__(self, config: SuperTrendConfig, *args, **kwargs):
         self.config = config
         self.max_records = config.length + 10
+        self.indicators = CandlesIndicators([Supertrend(length=config.length, multiplier=config.multiplier)])
         if len(self.config.candles_config) == 0:
             self.config.candles_config = [CandlesConfig(
                 connector=config.candles_connector,
@@ -53,7 +54,7 @@ class SuperTrend(DirectionalTradingControllerBase):
                                                       interval=self.config.interval,
                                                       max_records=self.max_records)
         # Add indicators
-        df.ta.supertrend(length=self.config.length, multiplier=self.config.multiplier, append=True)
+        df = self.indicators.update(df)
         df["percentage_distance"] = abs(df["close"] - df[f"SUPERT_{self.config.length}_{self.config.multiplier}"]) / df["close"]
 
         # Generate long and short conditions
@@ -23,7 +23,6 @@ from hummingbot.core.clock import Clock, ClockMode
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.exceptions import InvalidScriptModule, OracleRateUnavailable
-from hummingbot.strategy.directional_strategy_base import DirectionalStrategyBase
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 from hummingbot.strategy.strategy_v2_base import StrategyV2Base, StrategyV2ConfigBase
 
@@ -211,11 +210,16 @@ class StartCommand(GatewayChainApiManager):
             script_module = importlib.reload(module)
         else:
             script_module = importlib.import_module(f".{script_name}", package=settings.SCRIPT_STRATEGIES_MODULE)
+        base_classes = [ScriptStrategyBase, StrategyV2Base]
+        # The directional strategy base, and pandas_ta with it, is only imported by the scripts that use it
+        directional_strategy_module = sys.modules.get("hummingbot.strategy.directional_strategy_base")
+        if directional_strategy_module is not None:
+            base_classes.append(directional_strategy_module.DirectionalStrategyBase)
         try:
             script_class = next((member for member_name, member in inspect.getmembers(script_module)
                                  if inspect.isclass(member) and
                                  issubclass(member, ScriptStrategyBase) and
-                                 member not in [ScriptStrategyBase, DirectionalStrategyBase, StrategyV2Base]))
+                                 member not in base_classes))
         except StopIteration:
             raise InvalidScriptModule(f"The module {script_name} does not contain any subclass of ScriptStrategyBase")
         if self.strategy_name != self.strategy_file_name:
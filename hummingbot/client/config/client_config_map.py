@@ -34,12 +34,12 @@ from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.core.rate_oracle.rate_oracle import RATE_ORACLE_SOURCES, RateOracle
 from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
 from hummingbot.core.utils.kill_switch import ActiveKillSwitch, KillSwitch, PassThroughKillSwitch
-from hummingbot.notifier.telegram_notifier import TelegramNotifier
 from hummingbot.pmm_script.pmm_script_iterator import PMMScriptIterator
 from hummingbot.strategy.strategy_base import StrategyBase
 
 if TYPE_CHECKING:
     from hummingbot.client.hummingbot_application import HummingbotApplication
+    from hummingbot.notifier.telegram_notifier import TelegramNotifier
 
 PMM_SCRIPT_ENABLED_KEY = "pmm_script_enabled"
 PMM_SCRIPT_FILE_PATH_KEY = "pmm_script_file_path"
@@ -326,6 +326,27 @@ class PaperTradeConfigMap(BaseClientModel):
             ),
         ),
     )
+    paper_trade_order_latency: float = Field(
+        default=0.0,
+        ge=0,
+        description="Seconds until the paper trade limit orders can be filled after they are created.",
+    )
+    paper_trade_cancel_latency: float = Field(
+        default=0.0,
+        ge=0,
+        description="Seconds until the cancels of paper trade limit orders take effect.",
+    )
+    paper_trade_track_queue_position: bool = Field(
+        default=False,
+        description=(
+            "Queue the paper trade limit orders behind the order book amount at their price, to be filled by the"
+            " part of the trades at their price past that amount, partially if the trades are smaller than the order."
+        ),
+    )
+    paper_trade_aggregate_market_order_fills: bool = Field(
+        default=False,
+        description="Report the paper trade market orders as a single fill at their average price.",
+    )
 
     @validator("paper_trade_account_balance", pre=True)
     def validate_paper_trade_account_balance(cls, v: Union[str, Dict[str, float]]):
@@ -389,7 +410,7 @@ class AutofillImportEnum(str, ClientConfigEnum):
 
 class TelegramMode(BaseClientModel, ABC):
     @abstractmethod
-    def get_notifiers(self, hb: "HummingbotApplication") -> List[TelegramNotifier]:
+    def get_notifiers(self, hb: "HummingbotApplication") -> List["TelegramNotifier"]:
         ...
 
 
@@ -406,7 +427,10 @@ class TelegramEnabledMode(TelegramMode):
     class Config:
         title = "telegram_enabled"
 
-    def get_notifiers(self, hb: "HummingbotApplication") -> List[TelegramNotifier]:
+    def get_notifiers(self, hb: "HummingbotApplication") -> List["TelegramNotifier"]:
+        # python-telegram-bot is only imported when the notifications are enabled
+        from hummingbot.notifier.telegram_notifier import TelegramNotifier
+
         notifiers = [
             TelegramNotifier(token=self.telegram_token, chat_id=self.telegram_chat_id, hb=hb)
         ]
@@ -417,7 +441,7 @@ class TelegramDisabledMode(TelegramMode):
     class Config:
         title = "telegram_disabled"
 
-    def get_notifiers(self, hb: "HummingbotApplication") -> List[TelegramNotifier]:
+    def get_notifiers(self, hb: "HummingbotApplication") -> List["TelegramNotifier"]:
         return []
 
 
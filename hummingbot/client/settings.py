@@ -1,15 +1,19 @@
+import hashlib
 import importlib
 import json
+import logging
+import sys
 from decimal import Decimal
 from enum import Enum
-from os import DirEntry, scandir
-from os.path import exists, join, realpath
+from os import DirEntry, scandir, stat, walk
+from os.path import dirname, exists, join, realpath
+from pathlib import Path
 from types import ModuleType
-from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Set, Union, cast
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Set, Tuple, Union, cast
 
 from pydantic import SecretStr
 
-from hummingbot import get_strategy_list, root_path
+from hummingbot import data_path, get_strategy_list, root_path
 from hummingbot.core.data_type.trade_fee import TradeFeeSchema
 from hummingbot.core.utils.gateway_config_utils import SUPPORTED_CHAINS
 
@@ -59,6 +63,11 @@ GATEAWAY_CLIENT_KEY_PATH = DEFAULT_GATEWAY_CERTS_PATH / "client_key.pem"
 
 CONNECTOR_SUBMODULES_THAT_ARE_NOT_CEX_TYPES = ["test_support", "utilities", "gateway"]
 
+# The connector manifest keeps the settings read from the connectors utils modules, so they are not imported at startup.
+# It is generated in the data directory.
+CONNECTOR_MANIFEST_VERSION = 1
+CONNECTOR_MANIFEST_FILE_NAME = "connector_manifest.json"
+
 
 class ConnectorType(Enum):
     """
@@ -359,6 +368,36 @@ class ConnectorSetting(NamedTuple):
         return self.type.name.lower()
 
 
+class ConnectorConfigKeysReference(NamedTuple):
+    """
+    Location of the config keys of a connector in its utils module.
+    """
+    module: str
+    attribute: str
+    domain: Optional[str] = None
+
+    def load(self) -> Optional["BaseConnectorConfigMap"]:
+        config_keys = getattr(importlib.import_module(self.module), self.attribute, None)
+        if self.domain is not None:
+            config_keys = config_keys[self.domain]
+        return config_keys
+
+
+class ManifestConnectorSetting(ConnectorSetting):
+    """
+    Connector setting created from the connector manifest. The config keys are a reference to the utils module of
+    the connector, that is only imported when the config keys are used.
+    """
+    __slots__ = ()
+
+    @property
+    def config_keys(self) -> Optional["BaseConnectorConfigMap"]:
+        config_keys = tuple.__getitem__(self, ConnectorSetting._fields.index("config_keys"))
+        if isinstance(config_keys, ConnectorConfigKeysReference):
+            config_keys = config_keys.load()
+        return config_keys
+
+
 class AllConnectorSettings:
     paper_trade_connectors_names: List[str] = []
     all_connector_settings: Dict[str, ConnectorSetting] = {}
@@ -366,69 +405,27 @@ class AllConnectorSettings:
     @classmethod
     def create_connector_settings(cls):
         """
-        Iterate over files in specific Python directories to create a dictionary of exchange names to ConnectorSetting.
+        Creates a dictionary of exchange names to ConnectorSetting from the connector manifest and the gateway
+        connections. The manifest is created from the utils modules of the connectors when it is missing or a file of
+        the connector packages changed.
         """
         cls.all_connector_settings = {}  # reset
-        connector_exceptions = ["mock_paper_exchange", "mock_pure_python_paper_exchange", "paper_trade"]
-
-        type_dirs: List[DirEntry] = [
-            cast(DirEntry, f) for f in scandir(f"{root_path() / 'hummingbot' / 'connector'}")
-            if f.is_dir() and f.name not in CONNECTOR_SUBMODULES_THAT_ARE_NOT_CEX_TYPES
-        ]
-        for type_dir in type_dirs:
-            if type_dir.name == 'gateway':
-                continue
-            connector_dirs: List[DirEntry] = [
-                cast(DirEntry, f) for f in scandir(type_dir.path)
-                if f.is_dir() and exists(join(f.path, "__init__.py"))
-            ]
-            for connector_dir in connector_dirs:
-                if connector_dir.name.startswith("_") or connector_dir.name in connector_exceptions:
-                    continue
-                if connector_dir.name in cls.all_connector_settings:
-                    raise Exception(f"Multiple connectors with the same {connector_dir.name} name.")
-                try:
-                    util_module_path: str = f"hummingbot.connector.{type_dir.name}." \
-                                            f"{connector_dir.name}.{connector_dir.name}_utils"
-                    util_module = importlib.import_module(util_module_path)
-                except ModuleNotFoundError:
-                    continue
-                trade_fee_settings: List[float] = getattr(util_module, "DEFAULT_FEES", None)
-                trade_fee_schema: TradeFeeSchema = cls._validate_trade_fee_schema(
-                    connector_dir.name, trade_fee_settings
-                )
-                cls.all_connector_settings[connector_dir.name] = ConnectorSetting(
-                    name=connector_dir.name,
-                    type=ConnectorType[type_dir.name.capitalize()],
-                    centralised=getattr(util_module, "CENTRALIZED", True),
-                    example_pair=getattr(util_module, "EXAMPLE_PAIR", ""),
-                    use_ethereum_wallet=getattr(util_module, "USE_ETHEREUM_WALLET", False),
-                    trade_fee_schema=trade_fee_schema,
-                    config_keys=getattr(util_module, "KEYS", None),
-                    is_sub_domain=False,
-                    parent_name=None,
-                    domain_parameter=None,
-                    use_eth_gas_lookup=getattr(util_module, "USE_ETH_GAS_LOOKUP", False),
-                )
-                # Adds other domains of connector
-                other_domains = getattr(util_module, "OTHER_DOMAINS", [])
-                for domain in other_domains:
-                    trade_fee_settings = getattr(util_module, "OTHER_DOMAINS_DEFAULT_FEES")[domain]
-                    trade_fee_schema = cls._validate_trade_fee_schema(domain, trade_fee_settings)
-                    parent = cls.all_connector_settings[connector_dir.name]
-                    cls.all_connector_settings[domain] = ConnectorSetting(
-                        name=domain,
-                        type=parent.type,
-                        centralised=parent.centralised,
-                        example_pair=getattr(util_module, "OTHER_DOMAINS_EXAMPLE_PAIR")[domain],
-                        use_ethereum_wallet=parent.use_ethereum_wallet,
-                        trade_fee_schema=trade_fee_schema,
-                        config_keys=getattr(util_module, "OTHER_DOMAINS_KEYS")[domain],
-                        is_sub_domain=True,
-                        parent_name=parent.name,
-                        domain_parameter=getattr(util_module, "OTHER_DOMAINS_PARAMETER")[domain],
-                        use_eth_gas_lookup=parent.use_eth_gas_lookup,
-                    )
+        for entry in cls._load_connector_manifest()["connectors"]:
+            cls.all_connector_settings[entry["name"]] = ManifestConnectorSetting(
+                name=entry["name"],
+                type=ConnectorType[entry["type"]],
+                centralised=entry["centralised"],
+                example_pair=entry["example_pair"],
+                use_ethereum_wallet=entry["use_ethereum_wallet"],
+                trade_fee_schema=TradeFeeSchema.from_json(entry["trade_fee_schema"]),
+                config_keys=(ConnectorConfigKeysReference(**entry["config_keys"])
+                             if entry["config_keys"] is not None
+                             else None),
+                is_sub_domain=entry["is_sub_domain"],
+                parent_name=entry["parent_name"],
+                domain_parameter=entry["domain_parameter"],
+                use_eth_gas_lookup=entry["use_eth_gas_lookup"],
+            )
 
         # add gateway connectors
         gateway_connections_conf: List[Dict[str, str]] = GatewayConnectionSetting.load()
@@ -453,24 +450,143 @@ class AllConnectorSettings:
 
         return cls.all_connector_settings
 
+    @classmethod
+    def _connector_utils_modules(cls) -> List[Tuple[str, str, str]]:
+        """
+        The type, name and utils module path of the connectors in the connector directories.
+        """
+        connector_exceptions = ["mock_paper_exchange", "mock_pure_python_paper_exchange", "paper_trade"]
+        utils_modules = []
+        connector_names = set()
+
+        type_dirs: List[DirEntry] = [
+            cast(DirEntry, f) for f in scandir(f"{root_path() / 'hummingbot' / 'connector'}")
+            if f.is_dir() and f.name not in CONNECTOR_SUBMODULES_THAT_ARE_NOT_CEX_TYPES
+        ]
+        for type_dir in type_dirs:
+            if type_dir.name == 'gateway':
+                continue
+            connector_dirs: List[DirEntry] = [
+                cast(DirEntry, f) for f in scandir(type_dir.path)
+                if f.is_dir() and exists(join(f.path, "__init__.py"))
+            ]
+            for connector_dir in connector_dirs:
+                if connector_dir.name.startswith("_") or connector_dir.name in connector_exceptions:
+                    continue
+                if connector_dir.name in connector_names:
+                    raise Exception(f"Multiple connectors with the same {connector_dir.name} name.")
+                connector_names.add(connector_dir.name)
+                utils_path = join(connector_dir.path, f"{connector_dir.name}_utils.py")
+                utils_modules.append((type_dir.name, connector_dir.name, utils_path))
+        return utils_modules
+
+    @classmethod
+    def _connector_manifest_path(cls) -> Path:
+        return Path(data_path()) / CONNECTOR_MANIFEST_FILE_NAME
+
+    @classmethod
+    def _connector_manifest_fingerprint(cls, utils_modules: List[Tuple[str, str, str]]) -> str:
+        """
+        Hash of the manifest version, the Python version, the files of the connector packages and the installed
+        packages directories, that change when a package is installed or removed. The settings can come from any
+        module imported by the utils module of a connector, so every file of its package is part of the hash.
+        """
+        sources = []
+        for _, _, utils_path in utils_modules:
+            for directory, directory_names, file_names in walk(dirname(utils_path)):
+                directory_names[:] = sorted(name for name in directory_names if name != "__pycache__")
+                for file_name in sorted(file_names):
+                    file_path = join(directory, file_name)
+                    file_stat = stat(file_path)
+                    sources.append([file_path, file_stat.st_mtime_ns, file_stat.st_size])
+        packages_dirs = [[path, stat(path).st_mtime_ns] for path in sys.path
+                         if path.endswith(("site-packages", "dist-packages")) and exists(path)]
+        fingerprint = [CONNECTOR_MANIFEST_VERSION, sys.version, sources, packages_dirs]
+        return hashlib.sha256(json.dumps(fingerprint).encode("utf-8")).hexdigest()
+
+    @classmethod
+    def _load_connector_manifest(cls) -> Dict[str, Any]:
+        utils_modules = cls._connector_utils_modules()
+        fingerprint = cls._connector_manifest_fingerprint(utils_modules)
+        manifest_path = cls._connector_manifest_path()
+        try:
+            with open(manifest_path) as fd:
+                manifest = json.load(fd)
+            if manifest.get("version") == CONNECTOR_MANIFEST_VERSION and manifest.get("fingerprint") == fingerprint:
+                return manifest
+        except (OSError, ValueError):
+            pass
+
+        manifest = cls._create_connector_manifest(utils_modules)
+        manifest["fingerprint"] = fingerprint
+        try:
+            with open(manifest_path, "w") as fd:
+                json.dump(manifest, fd, indent=1)
+        except OSError:
+            logging.getLogger(__name__).warning(f"Could not write the connector manifest to {manifest_path}.")
+        return manifest
+
+    @classmethod
+    def _create_connector_manifest(cls, utils_modules: List[Tuple[str, str, str]]) -> Dict[str, Any]:
+        """
+        Imports the utils module of every connector to read its settings.
+        """
+        connectors = []
+        for type_name, connector_name, _ in utils_modules:
+            util_module_path: str = f"hummingbot.connector.{type_name}.{connector_name}.{connector_name}_utils"
+            try:
+                util_module = importlib.import_module(util_module_path)
+            except ModuleNotFoundError:
+                continue
+            trade_fee_settings: List[float] = getattr(util_module, "DEFAULT_FEES", None)
+            parent = {
+                "name": connector_name,
+                "type": ConnectorType[type_name.capitalize()].name,
+                "centralised": getattr(util_module, "CENTRALIZED", True),
+                "example_pair": getattr(util_module, "EXAMPLE_PAIR", ""),
+                "use_ethereum_wallet": getattr(util_module, "USE_ETHEREUM_WALLET", False),
+                "trade_fee_schema": cls._validate_trade_fee_schema(connector_name, trade_fee_settings).to_json(),
+                "config_keys": (ConnectorConfigKeysReference(util_module_path, "KEYS")._asdict()
+                                if getattr(util_module, "KEYS", None) is not None
+                                else None),
+                "is_sub_domain": False,
+                "parent_name": None,
+                "domain_parameter": None,
+                "use_eth_gas_lookup": getattr(util_module, "USE_ETH_GAS_LOOKUP", False),
+            }
+            connectors.append(parent)
+            # Adds other domains of connector
+            other_domains = getattr(util_module, "OTHER_DOMAINS", [])
+            for domain in other_domains:
+                trade_fee_settings = getattr(util_module, "OTHER_DOMAINS_DEFAULT_FEES")[domain]
+                keys_reference = ConnectorConfigKeysReference(util_module_path, "OTHER_DOMAINS_KEYS", domain)
+                connectors.append({
+                    "name": domain,
+                    "type": parent["type"],
+                    "centralised": parent["centralised"],
+                    "example_pair": getattr(util_module, "OTHER_DOMAINS_EXAMPLE_PAIR")[domain],
+                    "use_ethereum_wallet": parent["use_ethereum_wallet"],
+                    "trade_fee_schema": cls._validate_trade_fee_schema(domain, trade_fee_settings).to_json(),
+                    "config_keys": keys_reference._asdict() if keys_reference.load() is not None else None,
+                    "is_sub_domain": True,
+                    "parent_name": connector_name,
+                    "domain_parameter": getattr(util_module, "OTHER_DOMAINS_PARAMETER")[domain],
+                    "use_eth_gas_lookup": parent["use_eth_gas_lookup"],
+                })
+        return {"version": CONNECTOR_MANIFEST_VERSION, "connectors": connectors}
+
     @classmethod
     def initialize_paper_trade_settings(cls, paper_trade_exchanges: List[str]):
         cls.paper_trade_connectors_names = paper_trade_exchanges
         for e in paper_trade_exchanges:
             base_connector_settings: Optional[ConnectorSetting] = cls.all_connector_settings.get(e, None)
             if base_connector_settings:
-                paper_trade_settings = ConnectorSetting(
+                # _replace keeps the config keys of the connectors created from the manifest unloaded
+                paper_trade_settings = base_connector_settings._replace(
                     name=f"{e}_paper_trade",
-                    type=base_connector_settings.type,
-                    centralised=base_connector_settings.centralised,
-                    example_pair=base_connector_settings.example_pair,
-                    use_ethereum_wallet=base_connector_settings.use_ethereum_wallet,
-                    trade_fee_schema=base_connector_settings.trade_fee_schema,
-                    config_keys=base_connector_settings.config_keys,
                     is_sub_domain=False,
                     parent_name=base_connector_settings.name,
                     domain_parameter=None,
-                    use_eth_gas_lookup=base_connector_settings.use_eth_gas_lookup,
                 )
                 cls.all_connector_settings.update({f"{e}_paper_trade": paper_trade_settings})
 
@@ -18,7 +18,12 @@ def get_order_book_tracker(connector_name: str, trading_pairs: List[str]) -> Ord
 
 def create_paper_trade_market(exchange_name: str, client_config_map: ClientConfigAdapter, trading_pairs: List[str]):
     tracker = get_order_book_tracker(connector_name=exchange_name, trading_pairs=trading_pairs)
+    paper_trade_config = client_config_map.paper_trade
     return PaperTradeExchange(client_config_map,
                               tracker,
                               get_connector_class(exchange_name),
-                              exchange_name=exchange_name)
+                              exchange_name=exchange_name,
+                              order_latency=paper_trade_config.paper_trade_order_latency,
+                              cancel_latency=paper_trade_config.paper_trade_cancel_latency,
+                              track_queue_position=paper_trade_config.paper_trade_track_queue_position,
+                              aggregate_market_order_fills=paper_trade_config.paper_trade_aggregate_market_order_fills)
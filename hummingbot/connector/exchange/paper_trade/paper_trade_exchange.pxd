@@ -40,10 +40,28 @@ cdef class PaperTradeExchange(ExchangeBase):
         LimitOrderExpirationSet _limit_order_expiration_set
         object _target_market
         str _exchange_name
+        double _order_latency
+        double _cancel_latency
+        bint _track_queue_position
+        dict _crossing_thresholds
+        dict _queue_positions
+        dict _limit_order_fills
+        object _pending_cancels
+        bint _aggregate_market_order_fills
+        dict _trade_fees
 
     cdef c_execute_buy(self, str order_id, str trading_pair, object amount)
     cdef c_execute_sell(self, str order_id, str trading_pair, object amount)
     cdef c_process_market_orders(self)
+    cdef object c_get_trade_fee(self, str trading_pair, bint is_maker, object order_side)
+    cdef object c_get_market_order_price(self, object amount, tuple fill)
+    cdef list c_get_market_order_filled_events(self,
+                                               str order_id,
+                                               str trading_pair,
+                                               object trade_type,
+                                               object amount,
+                                               object fee,
+                                               tuple fill)
     cdef c_set_balance(self, str currency, object amount)
     cdef object c_get_fee(self,
                           str base_asset,
@@ -57,24 +75,37 @@ cdef class PaperTradeExchange(ExchangeBase):
                               LimitOrders *limit_orders_map_ptr,
                               LimitOrdersIterator *map_it_ptr,
                               const SingleTradingPairLimitOrdersIterator orders_it)
+    cdef c_set_limit_order_filled_quantity(self,
+                                           LimitOrdersIterator *map_it_ptr,
+                                           SingleTradingPairLimitOrdersIterator orders_it,
+                                           object filled_quantity)
     cdef c_process_limit_order(self,
                                bint is_buy,
                                LimitOrders *limit_orders_map_ptr,
                                LimitOrdersIterator *map_it_ptr,
-                               SingleTradingPairLimitOrdersIterator orders_it)
+                               SingleTradingPairLimitOrdersIterator orders_it,
+                               object fill_quantity=*)
     cdef c_process_limit_bid_order(self,
                                    LimitOrders *limit_orders_map_ptr,
                                    LimitOrdersIterator *map_it_ptr,
-                                   SingleTradingPairLimitOrdersIterator orders_it)
+                                   SingleTradingPairLimitOrdersIterator orders_it,
+                                   object fill_quantity=*)
     cdef c_process_limit_ask_order(self,
                                    LimitOrders *limit_orders_map_ptr,
                                    LimitOrdersIterator *map_it_ptr,
-                                   SingleTradingPairLimitOrdersIterator orders_it)
+                                   SingleTradingPairLimitOrdersIterator orders_it,
+                                   object fill_quantity=*)
     cdef c_process_crossed_limit_orders_for_trading_pair(self,
                                                          bint is_buy,
                                                          LimitOrders *limit_orders_map_ptr,
                                                          LimitOrdersIterator *map_it_ptr)
     cdef c_process_crossed_limit_orders(self)
+    cdef double c_get_crossing_threshold(self, bint is_buy, str trading_pair, object best_order_price)
+    cdef bint c_is_limit_order_active(self, const CPPLimitOrder *cpp_limit_order_ptr)
+    cdef double c_get_queue_ahead(self, str trading_pair, bint is_buy, object price)
+    cdef object c_fill_from_queue(self, const CPPLimitOrder *cpp_limit_order_ptr, object trade_quantity)
+    cdef c_process_pending_cancels(self)
+    cdef c_cancel_limit_order(self, str trading_pair_str, str client_order_id)
     cdef c_match_trade_to_limit_orders(self, object order_book_trade_event)
     cdef object c_cancel_order_from_orders_map(self,
                                                LimitOrders *orders_map,
@@ -9,6 +9,7 @@ from typing import Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 from cpython cimport PyObject
 from cython.operator cimport address, dereference as deref, postincrement as inc
+from libc.math cimport INFINITY, isnan
 from libcpp cimport bool as cppbool
 from libcpp.vector cimport vector
 
@@ -141,7 +142,23 @@ cdef class OrderBookMarketOrderFillListener(EventListener):
 
 
 cdef class PaperTradeExchange(ExchangeBase):
+    """
+    Simulated exchange on top of the order books of a real exchange.
+
+    The limit orders are kept per trading pair in sets sorted by price. Every tick the best limit order of every
+    trading pair is compared with a crossing threshold, precomputed when the best order changes, so only the trading
+    pairs whose top of book is near their limit orders are matched. Limit orders can take `order_latency` seconds to
+    be matchable after they are created, and cancels `cancel_latency` seconds to take effect. With
+    `track_queue_position`, the amount in the order book at the price of a new limit order is queued ahead of it, and
+    the trades at that price fill the order once the queue ahead is consumed: the part of a trade past the queue
+    ahead partially fills the order, and the rest of the order keeps resting.
+
+    Market orders are filled with a single pass over the order book levels, emitting one fill per level, or a single
+    fill at the average price with `aggregate_market_order_fills`.
+    """
     TRADE_EXECUTION_DELAY = 5.0
+    # Relative margin of the crossing thresholds over the order price, larger than the rounding of the prices
+    CROSSING_THRESHOLD_MARGIN = 1e-6
     ORDER_FILLED_EVENT_TAG = MarketEvent.OrderFilled.value
     SELL_ORDER_COMPLETED_EVENT_TAG = MarketEvent.SellOrderCompleted.value
     BUY_ORDER_COMPLETED_EVENT_TAG = MarketEvent.BuyOrderCompleted.value
@@ -157,6 +174,10 @@ cdef class PaperTradeExchange(ExchangeBase):
         order_book_tracker: OrderBookTracker,
         target_market: Callable,
         exchange_name: str,
+        order_latency: float = 0.0,
+        cancel_latency: float = 0.0,
+        track_queue_position: bool = False,
+        aggregate_market_order_fills: bool = False,
     ):
         order_book_tracker.data_source.order_book_create_function = lambda: CompositeOrderBook()
         self._set_order_book_tracker(order_book_tracker)
@@ -173,6 +194,16 @@ cdef class PaperTradeExchange(ExchangeBase):
         self._target_market = target_market
         self._market_order_filled_listener = OrderBookMarketOrderFillListener(self)
         self.c_add_listener(self.ORDER_FILLED_EVENT_TAG, self._market_order_filled_listener)
+        self._order_latency = order_latency
+        self._cancel_latency = cancel_latency
+        self._track_queue_position = track_queue_position
+        self._crossing_thresholds = {}
+        self._queue_positions = {}
+        # Base and quote amounts of the partial fills of the limit orders, reported when they complete
+        self._limit_order_fills = {}
+        self._pending_cancels = deque()
+        self._aggregate_market_order_fills = aggregate_market_order_fills
+        self._trade_fees = {}
 
         # Trade volume metrics should never be gather for paper trade connector
         self._trade_volume_metric_collector = DummyMetricsCollector()
@@ -242,6 +273,25 @@ cdef class PaperTradeExchange(ExchangeBase):
     def queued_orders(self) -> List[QueuedOrder]:
         return self._queued_orders
 
+    @property
+    def order_latency(self) -> float:
+        return self._order_latency
+
+    @property
+    def cancel_latency(self) -> float:
+        return self._cancel_latency
+
+    @property
+    def aggregate_market_order_fills(self) -> bool:
+        return self._aggregate_market_order_fills
+
+    @property
+    def queue_positions(self) -> Dict[str, float]:
+        """
+        Amount queued ahead of every limit order at its price, when the queue positions are tracked
+        """
+        return self._queue_positions.copy()
+
     @property
     def limit_orders(self) -> List[LimitOrder]:
         cdef:
@@ -278,10 +328,11 @@ cdef class PaperTradeExchange(ExchangeBase):
     def on_hold_balances(self) -> Dict[str, Decimal]:
         _on_hold_balances = defaultdict(Decimal)
         for limit_order in self.limit_orders:
+            remaining_quantity = limit_order.quantity - (limit_order.filled_quantity or s_decimal_0)
             if limit_order.is_buy:
-                _on_hold_balances[limit_order.quote_currency] += limit_order.quantity * limit_order.price
+                _on_hold_balances[limit_order.quote_currency] += remaining_quantity * limit_order.price
             else:
-                _on_hold_balances[limit_order.base_currency] += limit_order.quantity
+                _on_hold_balances[limit_order.base_currency] += remaining_quantity
         return _on_hold_balances
 
     @property
@@ -317,6 +368,7 @@ cdef class PaperTradeExchange(ExchangeBase):
 
     cdef c_tick(self, double timestamp):
         ExchangeBase.c_tick(self, timestamp)
+        self.c_process_pending_cancels()
         self.c_process_market_orders()
         self.c_process_crossed_limit_orders()
 
@@ -370,6 +422,8 @@ cdef class PaperTradeExchange(ExchangeBase):
                 0,
                 cpp_position,
             ))
+            if self._track_queue_position:
+                self._queue_positions[order_id] = self.c_get_queue_ahead(trading_pair_str, True, quantized_price)
         safe_ensure_future(self.trigger_event_async(
             self.MARKET_BUY_ORDER_CREATED_EVENT_TAG,
             BuyOrderCreatedEvent(self._current_timestamp,
@@ -430,6 +484,8 @@ cdef class PaperTradeExchange(ExchangeBase):
                 0,
                 cpp_position,
             ))
+            if self._track_queue_position:
+                self._queue_positions[order_id] = self.c_get_queue_ahead(trading_pair_str, False, quantized_price)
         safe_ensure_future(self.trigger_event_async(
             self.MARKET_SELL_ORDER_CREATED_EVENT_TAG,
             SellOrderCreatedEvent(self._current_timestamp,
@@ -448,15 +504,8 @@ cdef class PaperTradeExchange(ExchangeBase):
             object quote_balance = self.c_get_balance(quote_asset)
             object base_balance = self.c_get_balance(base_asset)
 
-        order_book = self.order_books[trading_pair_str]
-
-        buy_entries = order_book.simulate_buy(amount)
-
-        # Get the weighted average price of the trade
-        avg_price = Decimal(0)
-        for entry in buy_entries:
-            avg_price += Decimal(entry.price) * Decimal(entry.amount)
-        avg_price = avg_price / amount
+        fill = (<OrderBook>self.order_books[trading_pair_str]).c_simulate_fill(True, float(amount))
+        avg_price = self.c_get_market_order_price(amount, fill)
 
         order_candidate = OrderCandidate(
             trading_pair=trading_pair_str,
@@ -493,22 +542,9 @@ cdef class PaperTradeExchange(ExchangeBase):
         self.c_set_balance(base_asset,
                            base_balance + acquired_amount)
 
-        # add fee
-        fees = build_trade_fee(
-            exchange=self.name,
-            is_maker=False,
-            base_currency="",
-            quote_currency="",
-            order_type=OrderType.LIMIT,
-            order_side=TradeType.BUY,
-            amount=Decimal("0"),
-            price=Decimal("0"),
-        )
-
-        order_filled_events = OrderFilledEvent.order_filled_events_from_order_book_rows(
-            self._current_timestamp, order_id, trading_pair_str, TradeType.BUY, OrderType.MARKET,
-            fees, buy_entries
-        )
+        fees = self.c_get_trade_fee(trading_pair_str, False, TradeType.BUY)
+        order_filled_events = self.c_get_market_order_filled_events(
+            order_id, trading_pair_str, TradeType.BUY, amount, fees, fill)
 
         for order_filled_event in order_filled_events:
             self.c_trigger_event(self.ORDER_FILLED_EVENT_TAG, order_filled_event)
@@ -530,15 +566,8 @@ cdef class PaperTradeExchange(ExchangeBase):
             object quote_balance = self.c_get_balance(quote_asset)
             object base_balance = self.c_get_balance(base_asset)
 
-        order_book = self.order_books[trading_pair_str]
-
-        sell_entries = order_book.simulate_sell(amount)
-
-        # Get the weighted average price of the trade
-        avg_price = Decimal(0)
-        for entry in sell_entries:
-            avg_price += Decimal(entry.price) * Decimal(entry.amount)
-        avg_price = avg_price / amount
+        fill = (<OrderBook>self.order_books[trading_pair_str]).c_simulate_fill(False, float(amount))
+        avg_price = self.c_get_market_order_price(amount, fill)
 
         order_candidate = OrderCandidate(
             trading_pair=trading_pair_str,
@@ -575,22 +604,10 @@ cdef class PaperTradeExchange(ExchangeBase):
         self.c_set_balance(base_asset,
                            base_balance - sold_amount)
 
-        # add fee
-        fees = build_trade_fee(
-            exchange=self.name,
-            is_maker=False,
-            base_currency="",
-            quote_currency="",
-            order_type=OrderType.LIMIT,
-            order_side=TradeType.BUY,
-            amount=Decimal("0"),
-            price=Decimal("0"),
-        )
-
-        order_filled_events = OrderFilledEvent.order_filled_events_from_order_book_rows(
-            self._current_timestamp, order_id, trading_pair_str, TradeType.SELL,
-            OrderType.MARKET, fees, sell_entries
-        )
+        # The fee of the market sells has always been built with the buy side
+        fees = self.c_get_trade_fee(trading_pair_str, False, TradeType.BUY)
+        order_filled_events = self.c_get_market_order_filled_events(
+            order_id, trading_pair_str, TradeType.SELL, amount, fees, fill)
 
         for order_filled_event in order_filled_events:
             self.c_trigger_event(self.ORDER_FILLED_EVENT_TAG, order_filled_event)
@@ -605,6 +622,71 @@ cdef class PaperTradeExchange(ExchangeBase):
                                     acquired_amount,
                                     OrderType.MARKET))
 
+    cdef object c_get_trade_fee(self, str trading_pair, bint is_maker, object order_side):
+        """
+        The fees of the paper trade fills only depend on the trading pair, the side and whether the order is a maker,
+        they are built once and reused for every fill.
+        """
+        key = (trading_pair, is_maker, order_side)
+        fee = self._trade_fees.get(key)
+        if fee is None:
+            fee = build_trade_fee(
+                exchange=self.name,
+                is_maker=is_maker,
+                base_currency="",
+                quote_currency="",
+                order_type=OrderType.LIMIT,
+                order_side=order_side,
+                amount=Decimal("0"),
+                price=Decimal("0"),
+            )
+            self._trade_fees[key] = fee
+        return fee
+
+    cdef object c_get_market_order_price(self, object amount, tuple fill):
+        """
+        The weighted average price of a market order, the levels missing from the order book count as filled at price
+        zero.
+        """
+        average_price, filled_amount = fill[0], fill[1]
+        if filled_amount <= 0:
+            return s_decimal_0
+        avg_price = Decimal(str(average_price))
+        if filled_amount < amount:
+            avg_price = avg_price * Decimal(str(filled_amount)) / amount
+        return avg_price
+
+    cdef list c_get_market_order_filled_events(self,
+                                               str order_id,
+                                               str trading_pair,
+                                               object trade_type,
+                                               object amount,
+                                               object fee,
+                                               tuple fill):
+        cdef:
+            double average_price = fill[0]
+            double filled_amount = fill[1]
+            list prices = fill[2].tolist()
+            list amounts = fill[3].tolist()
+            Py_ssize_t levels = len(prices)
+            Py_ssize_t i
+        if levels == 0:
+            return []
+        # The amount of a complete fill is the exact order amount, instead of the float sum of the levels
+        is_complete = filled_amount == float(amount)
+        if self._aggregate_market_order_fills:
+            return [OrderFilledEvent(self._current_timestamp, order_id, trading_pair, trade_type, OrderType.MARKET,
+                                     Decimal(str(average_price)), amount if is_complete else Decimal(filled_amount), fee,
+                                     exchange_trade_id=order_id)]
+        order_filled_events = []
+        level_amounts = [Decimal(amounts[i]) for i in range(levels - 1)]
+        level_amounts.append(amount - sum(level_amounts) if is_complete else Decimal(amounts[levels - 1]))
+        for i in range(levels):
+            order_filled_events.append(OrderFilledEvent(
+                self._current_timestamp, order_id, trading_pair, trade_type, OrderType.MARKET,
+                Decimal(prices[i]), level_amounts[i], fee, exchange_trade_id=f"{order_id}_{i}"))
+        return order_filled_events
+
     cdef c_process_market_orders(self):
         cdef:
             QueuedOrder front_order = None
@@ -629,6 +711,10 @@ cdef class PaperTradeExchange(ExchangeBase):
         cdef:
             SingleTradingPairLimitOrders *orders_collection_ptr = address(deref(deref(map_it_ptr)).second)
         try:
+            if self._queue_positions:
+                self._queue_positions.pop(deref(orders_it).getClientOrderID().decode("utf8"), None)
+            if self._limit_order_fills:
+                self._limit_order_fills.pop(deref(orders_it).getClientOrderID().decode("utf8"), None)
             orders_collection_ptr.erase(orders_it)
             if orders_collection_ptr.empty():
                 map_it_ptr[0] = limit_orders_map_ptr.erase(deref(map_it_ptr))
@@ -637,21 +723,58 @@ cdef class PaperTradeExchange(ExchangeBase):
             self.logger().error("Error deleting limit order.", exc_info=True)
             return False
 
+    cdef c_set_limit_order_filled_quantity(self,
+                                           LimitOrdersIterator *map_it_ptr,
+                                           SingleTradingPairLimitOrdersIterator orders_it,
+                                           object filled_quantity):
+        """
+        Replaces a partially filled limit order with a copy that has its filled quantity. The orders are sorted by price
+        and order id, so the copy keeps the position of the order in its collection.
+        """
+        cdef:
+            SingleTradingPairLimitOrders *orders_collection_ptr = address(deref(deref(map_it_ptr)).second)
+            CPPLimitOrder limit_order = deref(orders_it)
+        orders_collection_ptr.erase(orders_it)
+        orders_collection_ptr.insert(CPPLimitOrder(
+            limit_order.getClientOrderID(),
+            limit_order.getTradingPair(),
+            limit_order.getIsBuy(),
+            limit_order.getBaseCurrency(),
+            limit_order.getQuoteCurrency(),
+            limit_order.getPrice(),
+            limit_order.getQuantity(),
+            <PyObject *> filled_quantity,
+            limit_order.getCreationTimestamp(),
+            limit_order.getStatus(),
+            limit_order.getPosition(),
+        ))
+
     cdef c_process_limit_bid_order(self,
                                    LimitOrders *limit_orders_map_ptr,
                                    LimitOrdersIterator *map_it_ptr,
-                                   SingleTradingPairLimitOrdersIterator orders_it):
+                                   SingleTradingPairLimitOrdersIterator orders_it,
+                                   object fill_quantity=None):
+        """
+        Fills the rest of a limit bid order, or only fill_quantity of it as a partial fill when it is less.
+        """
         cdef:
             const CPPLimitOrder *cpp_limit_order_ptr = address(deref(orders_it))
             str trading_pair_str = cpp_limit_order_ptr.getTradingPair().decode("utf8")
             str quote_asset = cpp_limit_order_ptr.getQuoteCurrency().decode("utf8")
             str base_asset = cpp_limit_order_ptr.getBaseCurrency().decode("utf8")
             str order_id = cpp_limit_order_ptr.getClientOrderID().decode("utf8")
-            object amount = <object> cpp_limit_order_ptr.getQuantity()
+            object quantity = <object> cpp_limit_order_ptr.getQuantity()
+            object filled_quantity = <object> cpp_limit_order_ptr.getFilledQuantity() or s_decimal_0
+            object amount = quantity - filled_quantity
             object price = <object> cpp_limit_order_ptr.getPrice()
             object quote_balance = self.c_get_balance(quote_asset)
             object base_balance = self.c_get_balance(base_asset)
 
+        if fill_quantity is not None:
+            amount = min(amount, self.c_quantize_order_amount(trading_pair_str, fill_quantity))
+            if amount <= s_decimal_0:
+                return
+
         order_candidate = OrderCandidate(
             trading_pair=trading_pair_str,
             is_maker=True,
@@ -688,17 +811,7 @@ cdef class PaperTradeExchange(ExchangeBase):
         self.c_set_balance(base_asset,
                            base_balance + acquired_amount)
 
-        # add fee
-        fees = build_trade_fee(
-            exchange=self.name,
-            is_maker=True,
-            base_currency="",
-            quote_currency="",
-            order_type=OrderType.LIMIT,
-            order_side=TradeType.BUY,
-            amount=Decimal("0"),
-            price=Decimal("0"),
-        )
+        fees = self.c_get_trade_fee(trading_pair_str, True, TradeType.BUY)
 
         # Emit the trade and order completed events.
         self.c_trigger_event(
@@ -709,12 +822,21 @@ cdef class PaperTradeExchange(ExchangeBase):
                 trading_pair_str,
                 TradeType.BUY,
                 OrderType.LIMIT,
-                <object> cpp_limit_order_ptr.getPrice(),
-                <object> cpp_limit_order_ptr.getQuantity(),
+                price,
+                amount,
                 fees,
                 exchange_trade_id=str(int(self._time() * 1e6))
             ))
 
+        # The completed event reports the amounts of all the fills of the order
+        filled_acquired_amount, filled_paid_amount = self._limit_order_fills.pop(order_id, (s_decimal_0, s_decimal_0))
+        filled_acquired_amount += acquired_amount
+        filled_paid_amount += paid_amount
+        if filled_quantity + amount < quantity:
+            self._limit_order_fills[order_id] = (filled_acquired_amount, filled_paid_amount)
+            self.c_set_limit_order_filled_quantity(map_it_ptr, orders_it, filled_quantity + amount)
+            return
+
         self.c_trigger_event(
             self.BUY_ORDER_COMPLETED_EVENT_TAG,
             BuyOrderCompletedEvent(
@@ -722,8 +844,8 @@ cdef class PaperTradeExchange(ExchangeBase):
                 order_id,
                 base_asset,
                 quote_asset,
-                acquired_amount,
-                paid_amount,
+                filled_acquired_amount,
+                filled_paid_amount,
                 OrderType.LIMIT
             ))
         self.c_delete_limit_order(limit_orders_map_ptr, map_it_ptr, orders_it)
@@ -731,18 +853,29 @@ cdef class PaperTradeExchange(ExchangeBase):
     cdef c_process_limit_ask_order(self,
                                    LimitOrders *limit_orders_map_ptr,
                                    LimitOrdersIterator *map_it_ptr,
-                                   SingleTradingPairLimitOrdersIterator orders_it):
+                                   SingleTradingPairLimitOrdersIterator orders_it,
+                                   object fill_quantity=None):
+        """
+        Fills the rest of a limit ask order, or only fill_quantity of it as a partial fill when it is less.
+        """
         cdef:
             const CPPLimitOrder *cpp_limit_order_ptr = address(deref(orders_it))
             str trading_pair_str = cpp_limit_order_ptr.getTradingPair().decode("utf8")
             str quote_asset = cpp_limit_order_ptr.getQuoteCurrency().decode("utf8")
             str base_asset = cpp_limit_order_ptr.getBaseCurrency().decode("utf8")
             str order_id = cpp_limit_order_ptr.getClientOrderID().decode("utf8")
-            object amount = <object> cpp_limit_order_ptr.getQuantity()
+            object quantity = <object> cpp_limit_order_ptr.getQuantity()
+            object filled_quantity = <object> cpp_limit_order_ptr.getFilledQuantity() or s_decimal_0
+            object amount = quantity - filled_quantity
             object price = <object> cpp_limit_order_ptr.getPrice()
             object quote_balance = self.c_get_balance(quote_asset)
             object base_balance = self.c_get_balance(base_asset)
 
+        if fill_quantity is not None:
+            amount = min(amount, self.c_quantize_order_amount(trading_pair_str, fill_quantity))
+            if amount <= s_decimal_0:
+                return
+
         order_candidate = OrderCandidate(
             trading_pair=trading_pair_str,
             # Market orders are not maker orders
@@ -779,17 +912,7 @@ cdef class PaperTradeExchange(ExchangeBase):
         self.c_set_balance(base_asset,
                            base_balance - sold_amount)
 
-        # add fee
-        fees = build_trade_fee(
-            exchange=self.name,
-            is_maker=True,
-            base_currency="",
-            quote_currency="",
-            order_type=OrderType.LIMIT,
-            order_side=TradeType.SELL,
-            amount=Decimal("0"),
-            price=Decimal("0"),
-        )
+        fees = self.c_get_trade_fee(trading_pair_str, True, TradeType.SELL)
 
         # Emit the trade and order completed events.
         self.c_trigger_event(
@@ -800,12 +923,21 @@ cdef class PaperTradeExchange(ExchangeBase):
                 trading_pair_str,
                 TradeType.SELL,
                 OrderType.LIMIT,
-                <object> cpp_limit_order_ptr.getPrice(),
-                <object> cpp_limit_order_ptr.getQuantity(),
+                price,
+                amount,
                 fees,
                 exchange_trade_id=str(int(self._time() * 1e6))
             ))
 
+        # The completed event reports the amounts of all the fills of the order
+        filled_sold_amount, filled_acquired_amount = self._limit_order_fills.pop(order_id, (s_decimal_0, s_decimal_0))
+        filled_sold_amount += sold_amount
+        filled_acquired_amount += acquired_amount
+        if filled_quantity + amount < quantity:
+            self._limit_order_fills[order_id] = (filled_sold_amount, filled_acquired_amount)
+            self.c_set_limit_order_filled_quantity(map_it_ptr, orders_it, filled_quantity + amount)
+            return
+
         self.c_trigger_event(
             self.SELL_ORDER_COMPLETED_EVENT_TAG,
             SellOrderCompletedEvent(
@@ -813,8 +945,8 @@ cdef class PaperTradeExchange(ExchangeBase):
                 order_id,
                 base_asset,
                 quote_asset,
-                sold_amount,
-                acquired_amount,
+                filled_sold_amount,
+                filled_acquired_amount,
                 OrderType.LIMIT
             ))
         self.c_delete_limit_order(limit_orders_map_ptr, map_it_ptr, orders_it)
@@ -823,12 +955,13 @@ cdef class PaperTradeExchange(ExchangeBase):
                                bint is_buy,
                                LimitOrders *limit_orders_map_ptr,
                                LimitOrdersIterator *map_it_ptr,
-                               SingleTradingPairLimitOrdersIterator orders_it):
+                               SingleTradingPairLimitOrdersIterator orders_it,
+                               object fill_quantity=None):
         try:
             if is_buy:
-                self.c_process_limit_bid_order(limit_orders_map_ptr, map_it_ptr, orders_it)
+                self.c_process_limit_bid_order(limit_orders_map_ptr, map_it_ptr, orders_it, fill_quantity)
             else:
-                self.c_process_limit_ask_order(limit_orders_map_ptr, map_it_ptr, orders_it)
+                self.c_process_limit_ask_order(limit_orders_map_ptr, map_it_ptr, orders_it, fill_quantity)
         except Exception as e:
             self.logger().error(f"Error processing limit order.", exc_info=True)
 
@@ -846,32 +979,118 @@ cdef class PaperTradeExchange(ExchangeBase):
         """
         cdef:
             str trading_pair = deref(deref(map_it_ptr)).first.decode("utf8")
-            object opposite_order_book_price = self.c_get_price(trading_pair, is_buy)
+            object opposite_order_book_price
             SingleTradingPairLimitOrders *orders_collection_ptr = address(deref(deref(map_it_ptr)).second)
             SingleTradingPairLimitOrdersIterator orders_it = orders_collection_ptr.begin()
             SingleTradingPairLimitOrdersRIterator orders_rit = orders_collection_ptr.rbegin()
             vector[SingleTradingPairLimitOrdersIterator] process_order_its
             const CPPLimitOrder *cpp_limit_order_ptr = NULL
+            OrderBook order_book = self.c_get_order_book(trading_pair)
+            double top_price
+            double crossing_threshold
 
+        # The best limit order can only be crossed if the top of book is within its crossing threshold
+        if is_buy:
+            cpp_limit_order_ptr = address(deref(orders_rit))
+        else:
+            cpp_limit_order_ptr = address(deref(orders_it))
+        crossing_threshold = self.c_get_crossing_threshold(is_buy, trading_pair,
+                                                           <object>cpp_limit_order_ptr.getPrice())
+        try:
+            top_price = order_book.c_get_price(is_buy)
+            if (is_buy and top_price > crossing_threshold) or (not is_buy and top_price < crossing_threshold):
+                return
+        except EnvironmentError:
+            pass
+
+        opposite_order_book_price = self.c_get_price(trading_pair, is_buy)
         if is_buy:
             while orders_rit != orders_collection_ptr.rend():
                 cpp_limit_order_ptr = address(deref(orders_rit))
                 if opposite_order_book_price > <object>cpp_limit_order_ptr.getPrice():
                     break
-                process_order_its.push_back(getIteratorFromReverseIterator(
-                    <reverse_iterator[SingleTradingPairLimitOrdersIterator]>orders_rit))
+                if self.c_is_limit_order_active(cpp_limit_order_ptr):
+                    process_order_its.push_back(getIteratorFromReverseIterator(
+                        <reverse_iterator[SingleTradingPairLimitOrdersIterator]>orders_rit))
                 inc(orders_rit)
         else:
             while orders_it != orders_collection_ptr.end():
                 cpp_limit_order_ptr = address(deref(orders_it))
                 if opposite_order_book_price < <object>cpp_limit_order_ptr.getPrice():
                     break
-                process_order_its.push_back(orders_it)
+                if self.c_is_limit_order_active(cpp_limit_order_ptr):
+                    process_order_its.push_back(orders_it)
                 inc(orders_it)
 
         for orders_it in process_order_its:
             self.c_process_limit_order(is_buy, limit_orders_map_ptr, map_it_ptr, orders_it)
 
+    cdef double c_get_crossing_threshold(self, bint is_buy, str trading_pair, object best_order_price):
+        """
+        Top of book price beyond which the best limit order of a side can't be crossed: the quantized top of book
+        price is compared with the order price, so the threshold is a price past the order price whose quantized price
+        doesn't cross it. Since the quantization is monotonic, no price past the threshold crosses the order either.
+        The thresholds are computed when the best limit order changes.
+
+        :param is_buy: are the limit orders on the bid side?
+        :param trading_pair: the trading pair of the limit orders
+        :param best_order_price: the price of the highest bid or the lowest ask limit order
+        :return: the threshold, infinite (or minus infinite for asks) if none is found
+        """
+        cdef:
+            tuple key = (is_buy, trading_pair)
+            tuple cached = self._crossing_thresholds.get(key)
+            double threshold
+        if cached is not None and cached[0] == best_order_price:
+            return cached[1]
+        if is_buy:
+            price_quantum = self.c_get_order_price_quantum(trading_pair, best_order_price)
+            threshold = float(best_order_price + 2 * price_quantum) * (1 + self.CROSSING_THRESHOLD_MARGIN)
+            if not self.c_quantize_order_price(trading_pair, Decimal(str(threshold))) > best_order_price:
+                threshold = INFINITY
+        else:
+            threshold = float(best_order_price) * (1 - self.CROSSING_THRESHOLD_MARGIN)
+            if not self.c_quantize_order_price(trading_pair, Decimal(str(threshold))) < best_order_price:
+                threshold = -INFINITY
+        self._crossing_thresholds[key] = (best_order_price, threshold)
+        return threshold
+
+    cdef bint c_is_limit_order_active(self, const CPPLimitOrder *cpp_limit_order_ptr):
+        """
+        A limit order can be filled once the order latency has passed since it was created.
+        """
+        return (self._order_latency <= 0
+                or cpp_limit_order_ptr.getCreationTimestamp() * 1e-6 + self._order_latency <= self._current_timestamp)
+
+    cdef double c_get_queue_ahead(self, str trading_pair, bint is_buy, object price):
+        """
+        Amount of the order book at the price of a new limit order, which has to trade before the order is filled by
+        trades at its price.
+        """
+        cdef:
+            OrderBook order_book = self.c_get_order_book(trading_pair)
+            double order_price = float(price)
+        entries = order_book.bid_entries() if is_buy else order_book.ask_entries()
+        for entry in entries:
+            if math.isclose(entry.price, order_price, rel_tol=1e-9):
+                return entry.amount
+            if (is_buy and entry.price < order_price) or (not is_buy and entry.price > order_price):
+                break
+        return 0
+
+    cdef object c_fill_from_queue(self, const CPPLimitOrder *cpp_limit_order_ptr, object trade_quantity):
+        """
+        Consumes the amount queued ahead of a limit order with a trade at its price.
+
+        :return: the quantity of the trade that reaches the limit order after its queue ahead
+        """
+        cdef:
+            str order_id = cpp_limit_order_ptr.getClientOrderID().decode("utf8")
+            object queue_ahead = Decimal(str(self._queue_positions.get(order_id, 0)))
+        trade_quantity = Decimal(str(trade_quantity))
+        self._queue_positions[order_id] = float(max(queue_ahead - trade_quantity, s_decimal_0))
+        return max(trade_quantity - queue_ahead, s_decimal_0)
+
     cdef c_process_crossed_limit_orders(self):
         cdef:
             LimitOrders *limit_orders_ptr = address(self._bid_limit_orders)
@@ -910,6 +1129,10 @@ cdef class PaperTradeExchange(ExchangeBase):
             SingleTradingPairLimitOrdersIterator orders_it
             SingleTradingPairLimitOrdersRIterator orders_rit
             vector[SingleTradingPairLimitOrdersIterator] process_order_its
+            # The quantity filled of every order processed, None to fill the rest of the order
+            list fill_quantities = []
+            object fill_quantity
+            size_t i
             const CPPLimitOrder *cpp_limit_order_ptr = NULL
 
         if map_it == limit_orders_map_ptr.end():
@@ -920,22 +1143,45 @@ cdef class PaperTradeExchange(ExchangeBase):
             orders_rit = orders_collection_ptr.rbegin()
             while orders_rit != orders_collection_ptr.rend():
                 cpp_limit_order_ptr = address(deref(orders_rit))
-                if <object>cpp_limit_order_ptr.getPrice() <= trade_price:
-                    break
-                process_order_its.push_back(getIteratorFromReverseIterator(
-                    <reverse_iterator[SingleTradingPairLimitOrdersIterator]>orders_rit))
+                order_price = <object>cpp_limit_order_ptr.getPrice()
+                if order_price <= trade_price:
+                    # The orders at the trade price are only reached by the trade after their queue ahead
+                    if not (self._track_queue_position
+                            and math.isclose(float(order_price), float(trade_price), rel_tol=1e-9)):
+                        break
+                    if self.c_is_limit_order_active(cpp_limit_order_ptr):
+                        fill_quantity = self.c_fill_from_queue(cpp_limit_order_ptr, trade_quantity)
+                        if fill_quantity > s_decimal_0:
+                            process_order_its.push_back(getIteratorFromReverseIterator(
+                                <reverse_iterator[SingleTradingPairLimitOrdersIterator]>orders_rit))
+                            fill_quantities.append(fill_quantity)
+                elif self.c_is_limit_order_active(cpp_limit_order_ptr):
+                    process_order_its.push_back(getIteratorFromReverseIterator(
+                        <reverse_iterator[SingleTradingPairLimitOrdersIterator]>orders_rit))
+                    fill_quantities.append(None)
                 inc(orders_rit)
         else:
             orders_it = orders_collection_ptr.begin()
             while orders_it != orders_collection_ptr.end():
                 cpp_limit_order_ptr = address(deref(orders_it))
-                if <object>cpp_limit_order_ptr.getPrice() >= trade_price:
-                    break
-                process_order_its.push_back(orders_it)
+                order_price = <object>cpp_limit_order_ptr.getPrice()
+                if order_price >= trade_price:
+                    if not (self._track_queue_position
+                            and math.isclose(float(order_price), float(trade_price), rel_tol=1e-9)):
+                        break
+                    if self.c_is_limit_order_active(cpp_limit_order_ptr):
+                        fill_quantity = self.c_fill_from_queue(cpp_limit_order_ptr, trade_quantity)
+                        if fill_quantity > s_decimal_0:
+                            process_order_its.push_back(orders_it)
+                            fill_quantities.append(fill_quantity)
+                elif self.c_is_limit_order_active(cpp_limit_order_ptr):
+                    process_order_its.push_back(orders_it)
+                    fill_quantities.append(None)
                 inc(orders_it)
 
-        for orders_it in process_order_its:
-            self.c_process_limit_order(is_maker_buy, limit_orders_map_ptr, address(map_it), orders_it)
+        for i in range(process_order_its.size()):
+            self.c_process_limit_order(is_maker_buy, limit_orders_map_ptr, address(map_it), process_order_its[i],
+                                       fill_quantities[i])
 
     # </editor-fold>
 
@@ -999,6 +1245,22 @@ cdef class PaperTradeExchange(ExchangeBase):
             self.logger().error(f"Error canceling order.", exc_info=True)
 
     cdef c_cancel(self, str trading_pair_str, str client_order_id):
+        if self._cancel_latency > 0:
+            self._pending_cancels.append((self._current_timestamp + self._cancel_latency,
+                                          trading_pair_str,
+                                          client_order_id))
+        else:
+            self.c_cancel_limit_order(trading_pair_str, client_order_id)
+
+    cdef c_process_pending_cancels(self):
+        """
+        Cancels the limit orders whose cancel latency has passed, until then they can still be filled.
+        """
+        while len(self._pending_cancels) > 0 and self._pending_cancels[0][0] <= self._current_timestamp:
+            _, trading_pair_str, client_order_id = self._pending_cancels.popleft()
+            self.c_cancel_limit_order(trading_pair_str, client_order_id)
+
+    cdef c_cancel_limit_order(self, str trading_pair_str, str client_order_id):
         cdef:
             string cpp_trading_pair = trading_pair_str.encode("utf8")
             string cpp_client_order_id = client_order_id.encode("utf8")
@@ -9,6 +9,7 @@ from shutil import move
 from typing import Dict, List, Optional, Tuple, Union
 
 import pandas as pd
+from sqlalchemy import func
 from sqlalchemy.orm import Query, Session
 
 from hummingbot import data_path
@@ -228,6 +229,22 @@ class MarketsRecorder:
             executors = session.query(Executors).filter(Executors.controller_id == controller_id).all()
             return [executor.to_executor_info() for executor in executors]
 
+    def get_executors_performance_by_controller(self) -> List[Tuple[Optional[str], Optional[int], bool, float, float, int]]:
+        """
+        Aggregate the stored executors in a single grouped query. Each row contains the controller id, close type,
+        is_active flag, the sum of net pnl quote, the sum of filled amount quote and the number of executors.
+        """
+        with self._sql_manager.get_new_session() as session:
+            query: Query = (session
+                            .query(Executors.controller_id,
+                                   Executors.close_type,
+                                   Executors.is_active,
+                                   func.sum(Executors.net_pnl_quote),
+                                   func.sum(Executors.filled_amount_quote),
+                                   func.count(Executors.id))
+                            .group_by(Executors.controller_id, Executors.close_type, Executors.is_active))
+            return [tuple(row) for row in query.all()]
+
     def get_orders_for_config_and_market(self, config_file_path: str, market: ConnectorBase,
                                          with_exchange_order_id_present: Optional[bool] = False,
                                          number_of_rows: Optional[int] = None) -> List[Order]:
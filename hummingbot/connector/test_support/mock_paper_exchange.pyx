@@ -25,13 +25,23 @@ s_decimal_0 = Decimal("0")
 
 cdef class MockPaperExchange(PaperTradeExchange):
 
-    def __init__(self, client_config_map: "ClientConfigAdapter", trade_fee_schema: Optional[TradeFeeSchema] = None):
+    def __init__(self,
+                 client_config_map: "ClientConfigAdapter",
+                 trade_fee_schema: Optional[TradeFeeSchema] = None,
+                 order_latency: float = 0.0,
+                 cancel_latency: float = 0.0,
+                 track_queue_position: bool = False,
+                 aggregate_market_order_fills: bool = False):
         PaperTradeExchange.__init__(
             self,
             client_config_map,
             MockOrderTracker(),
             MockPaperExchange,
             exchange_name="mock",
+            order_latency=order_latency,
+            cancel_latency=cancel_latency,
+            track_queue_position=track_queue_position,
+            aggregate_market_order_fills=aggregate_market_order_fills,
         )
 
         trade_fee_schema = trade_fee_schema or TradeFeeSchema(
@@ -175,6 +175,47 @@ cdef class CompositeOrderBook(OrderBook):
 
         self._traded_order_book.c_apply_diffs(cpp_bids_changes, cpp_asks_changes, self._last_diff_uid)
 
+    cdef tuple c_simulate_fill(self, bint is_buy, double amount):
+        cdef:
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            set[OrderBookEntry].iterator traded_ask_it = self._traded_order_book._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            set[OrderBookEntry].reverse_iterator traded_bid_it = self._traded_order_book._bid_book.rbegin()
+            double amount_left = amount
+            double price
+            double level_amount
+            vector[double] prices
+            vector[double] amounts
+
+        # Same composite amounts as ask_entries and bid_entries, without building the order book rows
+        if is_buy:
+            while ask_it != self._ask_book.end():
+                price = deref(ask_it).getPrice()
+                level_amount = deref(ask_it).getAmount()
+                while (traded_ask_it != self._traded_order_book._ask_book.end()
+                       and deref(traded_ask_it).getPrice() < price):
+                    inc(traded_ask_it)
+                if (traded_ask_it != self._traded_order_book._ask_book.end()
+                        and deref(traded_ask_it).getPrice() == price):
+                    level_amount -= deref(traded_ask_it).getAmount()
+                if self.c_add_fill_level(price, level_amount, &amount_left, &prices, &amounts):
+                    break
+                inc(ask_it)
+        else:
+            while bid_it != self._bid_book.rend():
+                price = deref(bid_it).getPrice()
+                level_amount = deref(bid_it).getAmount()
+                while (traded_bid_it != self._traded_order_book._bid_book.rend()
+                       and deref(traded_bid_it).getPrice() > price):
+                    inc(traded_bid_it)
+                if (traded_bid_it != self._traded_order_book._bid_book.rend()
+                        and deref(traded_bid_it).getPrice() == price):
+                    level_amount -= deref(traded_bid_it).getAmount()
+                if self.c_add_fill_level(price, level_amount, &amount_left, &prices, &amounts):
+                    break
+                inc(bid_it)
+        return self.c_fill_result(&prices, &amounts, amount - amount_left)
+
     cdef double c_get_price(self, bint is_buy) except? -1:
         cdef:
             set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
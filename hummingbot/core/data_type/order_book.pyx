@@ -141,6 +141,14 @@ cdef class OrderBook(PubSub):
         self._last_applied_trade = time.perf_counter()
         self.c_trigger_event(self.ORDER_BOOK_TRADE_EVENT_TAG, trade_event)
 
+    cdef c_apply_trades(self, list trade_events):
+        # The trades are in the order they happened, the last one sets the last trade price
+        if len(trade_events) == 0:
+            return
+        self._last_trade_price = trade_events[-1].price
+        self._last_applied_trade = time.perf_counter()
+        self.c_trigger_events(self.ORDER_BOOK_TRADE_EVENT_TAG, trade_events)
+
     @property
     def last_trade_price(self) -> float:
         return self._last_trade_price
@@ -200,6 +208,9 @@ cdef class OrderBook(PubSub):
     def apply_trade(self, trade: OrderBookTradeEvent):
         self.c_apply_trade(trade)
 
+    def apply_trades(self, trades: List[OrderBookTradeEvent]):
+        self.c_apply_trades(trades)
+
     def apply_pandas_diffs(self, bids_df: pd.DataFrame, asks_df: pd.DataFrame):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id], and a UNIX timestamp index.
@@ -308,6 +319,74 @@ cdef class OrderBook(PubSub):
                 break
         return retval
 
+    cdef tuple c_simulate_fill(self, bint is_buy, double amount):
+        cdef:
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            double amount_left = amount
+            vector[double] prices
+            vector[double] amounts
+        if is_buy:
+            while ask_it != self._ask_book.end():
+                if self.c_add_fill_level(deref(ask_it).getPrice(), deref(ask_it).getAmount(), &amount_left,
+                                         &prices, &amounts):
+                    break
+                inc(ask_it)
+        else:
+            while bid_it != self._bid_book.rend():
+                if self.c_add_fill_level(deref(bid_it).getPrice(), deref(bid_it).getAmount(), &amount_left,
+                                         &prices, &amounts):
+                    break
+                inc(bid_it)
+        return self.c_fill_result(&prices, &amounts, amount - amount_left)
+
+    cdef bint c_add_fill_level(self, double price, double level_amount, double *amount_left,
+                               vector[double] *prices, vector[double] *amounts):
+        """
+        Adds the amount taken from a price level to the fill, returns True when the fill is complete.
+        """
+        if level_amount <= 0:
+            return False
+        prices.push_back(price)
+        if level_amount < amount_left[0]:
+            amounts.push_back(level_amount)
+            amount_left[0] -= level_amount
+            return False
+        amounts.push_back(amount_left[0])
+        amount_left[0] = 0
+        return True
+
+    cdef tuple c_fill_result(self, vector[double] *prices, vector[double] *amounts, double filled_amount):
+        cdef:
+            size_t i
+            size_t levels = prices.size()
+            double notional = 0
+            double average_price
+            np.ndarray[np.float64_t, ndim=1] prices_array = np.empty(levels, dtype=np.float64)
+            np.ndarray[np.float64_t, ndim=1] amounts_array = np.empty(levels, dtype=np.float64)
+        for i in range(levels):
+            prices_array[i] = deref(prices)[i]
+            amounts_array[i] = deref(amounts)[i]
+            notional += deref(prices)[i] * deref(amounts)[i]
+        if levels == 0:
+            average_price = NaN
+        elif levels == 1:
+            average_price = deref(prices)[0]
+        else:
+            average_price = notional / filled_amount
+        return average_price, filled_amount, prices_array, amounts_array
+
+    def simulate_fill(self, is_buy: bool, amount: float) -> Tuple[float, float, np.ndarray, np.ndarray]:
+        """
+        Simulates a market order against the order book in a single pass over the book entries.
+
+        :param is_buy: True to take the asks, False to take the bids
+        :param amount: the amount of base asset of the order
+        :return: the average fill price, the filled amount, and the price and amount taken from every price level,
+        the filled amount is less than the order amount if the book is not deep enough
+        """
+        return self.c_simulate_fill(is_buy, amount)
+
     cdef double c_get_price(self, bint is_buy) except? -1:
         cdef:
             set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
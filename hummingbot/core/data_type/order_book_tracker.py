@@ -23,6 +23,7 @@ class OrderBookTrackerDataSourceType(Enum):
 
 class OrderBookTracker:
     PAST_DIFF_WINDOW_SIZE: int = 32
+    TRADE_EVENTS_BATCH_SIZE: int = 100
     _obt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -303,24 +304,40 @@ class OrderBookTracker:
         while True:
             try:
                 trade_message: OrderBookMessage = await self._order_book_trade_stream.get()
-                trading_pair: str = trade_message.trading_pair
-
-                if trading_pair not in self._order_books:
-                    messages_rejected += 1
-                    continue
-
-                order_book: OrderBook = self._order_books[trading_pair]
-                order_book.apply_trade(OrderBookTradeEvent(
-                    trading_pair=trade_message.trading_pair,
-                    timestamp=trade_message.timestamp,
-                    price=float(trade_message.content["price"]),
-                    amount=float(trade_message.content["amount"]),
-                    trade_id=trade_message.trade_id,
-                    type=TradeType.SELL if
-                    trade_message.content["trade_type"] == float(TradeType.SELL.value) else TradeType.BUY
-                ))
-
-                messages_accepted += 1
+                # The trades already queued are applied with a single dispatch per order book
+                trade_events: Dict[str, List[OrderBookTradeEvent]] = defaultdict(list)
+                batch_size: int = 0
+                while True:
+                    batch_size += 1
+                    try:
+                        trading_pair: str = trade_message.trading_pair
+                        if trading_pair in self._order_books:
+                            trade_events[trading_pair].append(OrderBookTradeEvent(
+                                trading_pair=trade_message.trading_pair,
+                                timestamp=trade_message.timestamp,
+                                price=float(trade_message.content["price"]),
+                                amount=float(trade_message.content["amount"]),
+                                trade_id=trade_message.trade_id,
+                                type=TradeType.SELL if
+                                trade_message.content["trade_type"] == float(TradeType.SELL.value) else TradeType.BUY
+                            ))
+                            messages_accepted += 1
+                        else:
+                            messages_rejected += 1
+                    except Exception:
+                        # Only the malformed message is discarded, the trades already in the batch are still applied
+                        messages_rejected += 1
+                        self.logger().network(
+                            "Unexpected error processing a trade message.",
+                            exc_info=True,
+                            app_warning_msg="Unexpected error processing a trade message. The message was discarded."
+                        )
+                    if self._order_book_trade_stream.empty() or batch_size >= self.TRADE_EVENTS_BATCH_SIZE:
+                        break
+                    trade_message = self._order_book_trade_stream.get_nowait()
+
+                for trading_pair, events in trade_events.items():
+                    self._order_books[trading_pair].apply_trades(events)
 
                 # Log some statistics.
                 now: float = time.time()
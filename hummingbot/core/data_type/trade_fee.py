@@ -70,6 +70,27 @@ class TradeFeeSchema:
                 self.maker_fixed_fees[i].token, Decimal(self.maker_fixed_fees[i].amount)
             )
 
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "percent_fee_token": self.percent_fee_token,
+            "maker_percent_fee_decimal": str(self.maker_percent_fee_decimal),
+            "taker_percent_fee_decimal": str(self.taker_percent_fee_decimal),
+            "buy_percent_fee_deducted_from_returns": self.buy_percent_fee_deducted_from_returns,
+            "maker_fixed_fees": [token_amount.to_json() for token_amount in self.maker_fixed_fees],
+            "taker_fixed_fees": [token_amount.to_json() for token_amount in self.taker_fixed_fees],
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]):
+        return TradeFeeSchema(
+            percent_fee_token=data["percent_fee_token"],
+            maker_percent_fee_decimal=Decimal(data["maker_percent_fee_decimal"]),
+            taker_percent_fee_decimal=Decimal(data["taker_percent_fee_decimal"]),
+            buy_percent_fee_deducted_from_returns=data["buy_percent_fee_deducted_from_returns"],
+            maker_fixed_fees=[TokenAmount.from_json(token_amount) for token_amount in data["maker_fixed_fees"]],
+            taker_fixed_fees=[TokenAmount.from_json(token_amount) for token_amount in data["taker_fixed_fees"]],
+        )
+
 
 @dataclass
 class TradeFeeBase(ABC):
@@ -80,7 +80,7 @@ class MarketOrderFailureEvent(NamedTuple):
     order_type: OrderType
 
 
-@dataclass
+@dataclass(slots=True)
 class BuyOrderCompletedEvent:
     timestamp: float
     order_id: str
@@ -92,7 +92,7 @@ class BuyOrderCompletedEvent:
     exchange_order_id: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SellOrderCompletedEvent:
     timestamp: float
     order_id: str
@@ -104,7 +104,7 @@ class SellOrderCompletedEvent:
     exchange_order_id: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderCancelledEvent:
     timestamp: float
     order_id: str
@@ -137,7 +137,7 @@ class TokenApprovalCancelledEvent:
     token_symbol: str
 
 
-@dataclass
+@dataclass(slots=True)
 class FundingPaymentCompletedEvent:
     timestamp: float
     market: str
@@ -217,7 +217,7 @@ class OrderFilledEvent(NamedTuple):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class BuyOrderCreatedEvent:
     timestamp: float
     type: OrderType
@@ -231,7 +231,7 @@ class BuyOrderCreatedEvent:
     position: Optional[str] = PositionAction.NIL.value
 
 
-@dataclass
+@dataclass(slots=True)
 class SellOrderCreatedEvent:
     timestamp: float
     type: OrderType
@@ -332,7 +332,7 @@ class PositionModeChangeEvent:
     message: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BalanceUpdateEvent:
     timestamp: float
     asset_name: str
@@ -340,7 +340,7 @@ class BalanceUpdateEvent:
     available_balance: Optional[Decimal] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PositionUpdateEvent:
     timestamp: float
     trading_pair: str
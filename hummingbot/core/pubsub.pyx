@@ -39,8 +39,12 @@ cdef class PubSub:
        make sense to do the GC every time.
     2. c_remove_listener():
        Every time. This assumes c_remove_listener() is called infrequently.
-    3. c_get_listeners() and c_trigger_event():
-       Every time. Both functions take O(n) already.
+    3. c_get_listeners():
+       Every time. The function takes O(n) already.
+    4. c_trigger_event() and c_trigger_events():
+       When the listeners of the event are dispatched to for the first time after they changed, or after one of them
+       was found dead. The weak references of the live listeners are kept in a tuple per event, that is rebuilt only
+       when the listeners of the event change, so dispatching an event doesn't copy or scan the listeners set.
     """
 
     ADD_LISTENER_GC_PROBABILITY = 0.005
@@ -52,6 +56,10 @@ cdef class PubSub:
             class_logger = logging.getLogger(__name__)
         return class_logger
 
+    def __cinit__(self):
+        # Initialized here, as some subclasses don't call the __init__ of PubSub
+        self._listener_refs = {}
+
     def __init__(self):
         self._events = Events()
 
@@ -67,6 +75,9 @@ cdef class PubSub:
     def trigger_event(self, event_tag: Enum, message: any):
         self.c_trigger_event(event_tag.value, message)
 
+    def trigger_events(self, event_tag: Enum, messages: List[any]):
+        self.c_trigger_events(event_tag.value, messages)
+
     cdef c_log_exception(self, int64_t event_tag, object arg):
         self.logger().error(f"Unexpected error while processing event {event_tag}.", exc_info=True)
 
@@ -83,6 +94,7 @@ cdef class PubSub:
         else:
             new_listeners.insert(listener_wrapper)
             self._events.insert(EventsPair(event_tag, new_listeners))
+        self._listener_refs.pop(event_tag, None)
 
         if random.random() < PubSub.ADD_LISTENER_GC_PROBABILITY:
             self.c_remove_dead_listeners(event_tag)
@@ -100,6 +112,7 @@ cdef class PubSub:
         lit = deref(listeners_ptr).find(listener_wrapper)
         if lit != deref(listeners_ptr).end():
             deref(listeners_ptr).erase(lit)
+            self._listener_refs.pop(event_tag, None)
         self.c_remove_dead_listeners(event_tag)
 
     cdef c_remove_dead_listeners(self, int64_t event_tag):
@@ -120,6 +133,8 @@ cdef class PubSub:
             inc(lit)
         for lit in lit_to_remove:
             deref(listeners_ptr).erase(lit)
+        if lit_to_remove.size() > 0:
+            self._listener_refs.pop(event_tag, None)
         if deref(listeners_ptr).size() < 1:
             self._events.erase(it)
 
@@ -143,23 +158,51 @@ cdef class PubSub:
             retval.append(typed_listener)
         return retval
 
+    cdef tuple c_get_listener_refs(self, int64_t event_tag):
+        cdef:
+            tuple listener_refs = self._listener_refs.get(event_tag)
+            EventsIterator it
+        if listener_refs is None:
+            self.c_remove_dead_listeners(event_tag)
+            it = self._events.find(event_tag)
+            if it == self._events.end():
+                listener_refs = ()
+            else:
+                listener_refs = tuple([<object>pyref.get() for pyref in deref(it).second])
+            self._listener_refs[event_tag] = listener_refs
+        return listener_refs
+
     cdef c_trigger_event(self, int64_t event_tag, object arg):
-        self.c_remove_dead_listeners(event_tag)
+        self.c_dispatch_event(event_tag, self.c_get_listener_refs(event_tag), arg)
+
+    cdef c_trigger_events(self, int64_t event_tag, object args):
+        """
+        Dispatches the events in order, as if c_trigger_event() was called for each one of them, to the listeners
+        taken once for the whole batch. Used by the publishers that receive several events of the same tag at once,
+        like the trades of a busy order book. A listener removed during the batch still receives the rest of it.
+        """
+        cdef:
+            tuple listener_refs = self.c_get_listener_refs(event_tag)
+        if len(listener_refs) == 0:
+            return
+        for arg in args:
+            self.c_dispatch_event(event_tag, listener_refs, arg)
 
+    cdef c_dispatch_event(self, int64_t event_tag, tuple listener_refs, object arg):
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection listeners
-            object listener_weafref
+            object listener_weakref
+            object listener
             EventListener typed_listener
-        if it == self._events.end():
-            return
 
-        # It is extremely important that this set of listeners is a C++ copy - because listeners are allowed to call
-        # c_remove_listener(), which breaks the iterator if we're using the underlying set.
-        listeners = deref(it).second
-        for pyref in listeners:
-            listener_weafref = <object>pyref.get()
-            typed_listener = <object>PyWeakref_GetObject(listener_weafref)
+        # The tuple is not modified when the listeners change, so listeners are allowed to call c_remove_listener()
+        # while the event is dispatched. A listener removed this way still receives the event, as the listeners
+        # are taken before the dispatch.
+        for listener_weakref in listener_refs:
+            listener = <object>PyWeakref_GetObject(listener_weakref)
+            if listener is None:
+                self._listener_refs.pop(event_tag, None)
+                continue
+            typed_listener = listener
             try:
                 typed_listener.c_set_event_info(event_tag, self)
                 typed_listener.c_call(arg)
@@ -0,0 +1,111 @@
+from collections import deque
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+
+from hummingbot.connector.utils import combine_to_hb_trading_pair, split_hb_trading_pair
+from hummingbot.core.gateway.utils import unwrap_token_symbol
+
+
+@dataclass(frozen=True)
+class ConversionRate:
+    """
+    A conversion rate with the price pairs used to compute it and the time when the oldest of them was updated, so
+    the callers can tell how stale an indirect rate is.
+    """
+    rate: Decimal
+    path: Tuple[str, ...]
+    timestamp: Optional[float] = None
+
+    def age(self, now: float) -> Optional[float]:
+        return None if self.timestamp is None else now - self.timestamp
+
+
+class RateConversionGraph:
+    """
+    Conversion graph of the tokens of a prices dict, where every trading pair with a price links its base and quote
+    tokens in both directions.
+
+    The rates of all the tokens against the quote token are computed when the graph is built, walking the graph
+    breadth first from the quote token, so every token is converted with the fewest intermediate pairs. The rates
+    between other tokens are computed on the first request, and kept until the graph is rebuilt.
+    """
+
+    def __init__(self, prices: Dict[str, Decimal], quote_token: str,
+                 timestamps: Optional[Dict[str, float]] = None):
+        self._prices = prices
+        self._timestamps = timestamps or {}
+        self._quote_token = quote_token
+        self._edges: Dict[str, List[Tuple[str, str, bool]]] = {}
+        for pair in prices:
+            try:
+                base, quote = split_hb_trading_pair(pair)
+            except ValueError:
+                continue
+            self._edges.setdefault(base, []).append((quote, pair, False))
+            self._edges.setdefault(quote, []).append((base, pair, True))
+        self._rates_by_source: Dict[str, Dict[str, ConversionRate]] = {
+            quote_token: self._conversion_rates_to(quote_token)}
+
+    @property
+    def quote_token(self) -> str:
+        return self._quote_token
+
+    @property
+    def rates(self) -> Dict[str, ConversionRate]:
+        """
+        The rates of all the reachable tokens against the quote token.
+        """
+        return self._rates_by_source[self._quote_token].copy()
+
+    def _conversion_rates_to(self, target: str) -> Dict[str, ConversionRate]:
+        """
+        Walks the graph from the target token, for every token found the rate is the rate of the token it was found
+        from times the price of the pair that links them.
+        """
+        rates = {target: ConversionRate(rate=Decimal("1"), path=())}
+        queue = deque([target])
+        while queue:
+            token = queue.popleft()
+            token_rate = rates[token]
+            for neighbour, pair, is_base_of_pair in self._edges.get(token, []):
+                if neighbour in rates:
+                    continue
+                price = self._prices[pair]
+                if is_base_of_pair:
+                    # pair is neighbour-token, the price converts neighbour to token
+                    rate = price * token_rate.rate
+                elif price == 0:
+                    continue
+                else:
+                    # pair is token-neighbour, the price converts token to neighbour
+                    rate = token_rate.rate / price
+                timestamps = [t for t in (token_rate.timestamp, self._timestamps.get(pair)) if t is not None]
+                rates[neighbour] = ConversionRate(rate=rate,
+                                                  path=(pair,) + token_rate.path,
+                                                  timestamp=min(timestamps) if timestamps else None)
+                queue.append(neighbour)
+        return rates
+
+    def get_conversion_rate(self, pair: str) -> Optional[ConversionRate]:
+        if pair in self._prices:
+            return ConversionRate(rate=self._prices[pair], path=(pair,), timestamp=self._timestamps.get(pair))
+        base, quote = split_hb_trading_pair(trading_pair=pair)
+        base = unwrap_token_symbol(base)
+        quote = unwrap_token_symbol(quote)
+        if base == quote:
+            return ConversionRate(rate=Decimal("1"), path=())
+        reverse_pair = combine_to_hb_trading_pair(base=quote, quote=base)
+        if reverse_pair in self._prices and self._prices[reverse_pair] != 0:
+            return ConversionRate(rate=Decimal("1") / self._prices[reverse_pair],
+                                  path=(reverse_pair,),
+                                  timestamp=self._timestamps.get(reverse_pair))
+        if quote not in self._rates_by_source:
+            if quote not in self._edges:
+                return None
+            self._rates_by_source[quote] = self._conversion_rates_to(quote)
+        return self._rates_by_source[quote].get(base)
+
+    def get_pair_rate(self, pair: str) -> Optional[Decimal]:
+        conversion_rate = self.get_conversion_rate(pair)
+        return None if conversion_rate is None else conversion_rate.rate
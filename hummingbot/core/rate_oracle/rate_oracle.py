@@ -1,12 +1,14 @@
 import asyncio
 import logging
+import time
 from decimal import Decimal
-from typing import Dict, Optional
+from typing import Dict, Optional, Set, Tuple
 
 import hummingbot.client.settings  # noqa
-from hummingbot.connector.utils import combine_to_hb_trading_pair
+from hummingbot.connector.utils import combine_to_hb_trading_pair, split_hb_trading_pair
 from hummingbot.core.network_base import NetworkBase
 from hummingbot.core.network_iterator import NetworkStatus
+from hummingbot.core.rate_oracle.rate_conversion_graph import ConversionRate, RateConversionGraph
 from hummingbot.core.rate_oracle.sources.ascend_ex_rate_source import AscendExRateSource
 from hummingbot.core.rate_oracle.sources.binance_rate_source import BinanceRateSource
 from hummingbot.core.rate_oracle.sources.binance_us_rate_source import BinanceUSRateSource
@@ -38,7 +40,14 @@ class RateOracle(NetworkBase):
     """
     RateOracle provides conversion rates for any given pair token symbols in both async and sync fashions.
     It achieves this by query URL on a given source for prices and store them, either in cache or as an object member.
-    The find_rate is then used on these prices to find a rate on a given pair.
+    Every time the stored prices are updated a conversion graph is built from them, with the rates of all the tokens
+    against the quote token, so the rates of the stored prices are lookups.
+    While the network is running the fetch loop is the only producer of prices, and the rates are read from the
+    stored prices. Otherwise the prices are fetched from the source, and the concurrent requests share the same fetch.
+    The oracle tracks the tokens of the requested rates, and the sources that support filtered queries are asked only
+    for the prices of those tokens. The prices are refreshed every `refresh_interval` seconds of the source, or
+    earlier when a rate of a new token is requested, and the interval doubles after every failed update up to
+    `max_refresh_interval` of the source.
     """
     _logger: Optional[HummingbotLogger] = None
     _shared_instance: "RateOracle" = None
@@ -59,7 +68,13 @@ class RateOracle(NetworkBase):
         super().__init__()
         self._source: RateSourceBase = source if source is not None else BinanceRateSource()
         self._prices: Dict[str, Decimal] = {}
+        self._price_timestamps: Dict[str, float] = {}
+        self._conversion_graph: Optional[RateConversionGraph] = None
         self._fetch_price_task: Optional[asyncio.Task] = None
+        self._source_prices_request: Optional[Tuple[str, asyncio.Task]] = None
+        self._requested_pairs: Set[str] = set()
+        self._requested_tokens: Set[str] = set()
+        self._refresh_requested = asyncio.Event()
         self._ready_event = asyncio.Event()
         self._quote_token = quote_token if quote_token is not None else "USD"
 
@@ -99,7 +114,10 @@ class RateOracle(NetworkBase):
     def quote_token(self, new_token: str):
         if new_token != self._quote_token:
             self._quote_token = new_token
+            self._requested_pairs = set()
             self._prices = {}
+            self._price_timestamps = {}
+            self._conversion_graph = None
 
     @property
     def prices(self) -> Dict[str, Decimal]:
@@ -108,6 +126,17 @@ class RateOracle(NetworkBase):
         """
         return self._prices.copy()
 
+    @property
+    def price_timestamps(self) -> Dict[str, float]:
+        """
+        Time when every stored price was last updated
+        """
+        return self._price_timestamps.copy()
+
+    @property
+    def requested_tokens(self) -> Set[str]:
+        return self._requested_tokens.copy()
+
     async def start_network(self):
         await self.stop_network()
         self._fetch_price_task = safe_ensure_future(self._fetch_price_loop())
@@ -118,10 +147,12 @@ class RateOracle(NetworkBase):
             self._fetch_price_task = None
         # Reset stored prices so that they are not used if they are not being updated
         self._prices = {}
+        self._price_timestamps = {}
+        self._conversion_graph = None
 
     async def check_network(self) -> NetworkStatus:
         try:
-            prices = await self._source.get_prices(quote_token=self._quote_token)
+            prices = await self._get_source_prices()
             if not prices:
                 raise Exception(f"Error fetching new prices from {self._source.name}.")
         except asyncio.CancelledError:
@@ -149,9 +180,8 @@ class RateOracle(NetworkBase):
         :param base_token: The token symbol that we want to price, e.g. BTC
         :return A conversion rate
         """
-        prices = await self._source.get_prices(quote_token=self._quote_token)
         pair = combine_to_hb_trading_pair(base=base_token, quote=self._quote_token)
-        return find_rate(prices, pair)
+        return await self.rate_async(pair)
 
     def get_pair_rate(self, pair: str) -> Decimal:
         """
@@ -161,7 +191,30 @@ class RateOracle(NetworkBase):
         :param pair: A trading pair, e.g. BTC-USDT
         :return A conversion rate
         """
-        return find_rate(self._prices, pair)
+        self._track_pair(pair)
+        return self.conversion_graph.get_pair_rate(pair)
+
+    def get_pair_conversion_rate(self, pair: str) -> Optional[ConversionRate]:
+        """
+        Same as get_pair_rate, but also returns the price pairs used for the conversion and the time when the oldest
+        of them was fetched.
+
+        :param pair: A trading pair, e.g. BTC-USDT
+        :return A conversion rate with its path, or None if there is no route between the tokens
+        """
+        self._track_pair(pair)
+        return self.conversion_graph.get_conversion_rate(pair)
+
+    @property
+    def conversion_graph(self) -> RateConversionGraph:
+        if self._conversion_graph is None:
+            self._update_conversion_graph()
+        return self._conversion_graph
+
+    def _update_conversion_graph(self):
+        self._conversion_graph = RateConversionGraph(prices=self._prices.copy(),
+                                                     quote_token=self._quote_token,
+                                                     timestamps=self._price_timestamps.copy())
 
     async def stored_or_live_rate(self, pair: str) -> Decimal:
         """
@@ -182,30 +235,91 @@ class RateOracle(NetworkBase):
     async def rate_async(self, pair: str) -> Decimal:
         """
         Finds a conversion rate in an async operation, it is a class method which can be used directly without having to
-        start the RateOracle network.
+        start the RateOracle network. If the network is running the rate is read from the stored prices.
         :param pair: A trading pair, e.g. BTC-USDT
         :return A conversion rate
         """
-        prices = await self._source.get_prices(quote_token=self._quote_token)
+        if self._is_fetching_prices():
+            return self.get_pair_rate(pair)
+        self._track_pair(pair)
+        prices = await self._get_source_prices()
         return find_rate(prices, pair)
 
+    def _track_pair(self, pair: str):
+        """
+        Adds the tokens of the pair to the requested tokens. If some of them are new and the source fetches only the
+        requested tokens, asks the fetch loop to update the prices without waiting for the refresh interval.
+        """
+        if pair in self._requested_pairs:
+            return
+        self._requested_pairs.add(pair)
+        try:
+            tokens = set(split_hb_trading_pair(pair))
+        except ValueError:
+            return
+        new_tokens = tokens - self._requested_tokens - {self._quote_token}
+        if new_tokens:
+            self._requested_tokens.update(new_tokens)
+            if self._source.supports_token_filter:
+                self._refresh_requested.set()
+
+    def _is_fetching_prices(self) -> bool:
+        return self._fetch_price_task is not None and not self._fetch_price_task.done() and len(self._prices) > 0
+
+    async def _get_source_prices(self) -> Dict[str, Decimal]:
+        """
+        Fetches the prices of the quote token from the source, the concurrent callers share the same request.
+        """
+        if self._source_prices_request is not None:
+            quote_token, request = self._source_prices_request
+            if quote_token == self._quote_token and not request.done():
+                return await asyncio.shield(request)
+        request = asyncio.ensure_future(self._source.get_prices(quote_token=self._quote_token))
+        self._source_prices_request = (self._quote_token, request)
+        return await asyncio.shield(request)
+
     def set_price(self, pair: str, price: Decimal):
         """
         Update keys in self._prices with new prices
         """
         self._prices[pair] = price
+        self._price_timestamps[pair] = time.time()
+        self._conversion_graph = None
 
     async def _fetch_price_loop(self):
+        consecutive_failures = 0
         while True:
+            self._refresh_requested.clear()
             try:
-                new_prices = await self._source.get_prices(quote_token=self._quote_token)
+                new_prices = await self._fetch_requested_prices()
                 self._prices.update(new_prices)
+                fetch_timestamp = time.time()
+                self._price_timestamps.update((pair, fetch_timestamp) for pair in new_prices)
+                self._update_conversion_graph()
+                consecutive_failures = 0
 
                 if self._prices:
                     self._ready_event.set()
             except asyncio.CancelledError:
                 raise
             except Exception:
+                consecutive_failures += 1
                 self.logger().network(f"Error fetching new prices from {self.source.name}.", exc_info=True,
                                       app_warning_msg=f"Couldn't fetch newest prices from {self.source.name}.")
-            await asyncio.sleep(1)
+            await self._wait_for_next_refresh(consecutive_failures)
+
+    async def _fetch_requested_prices(self) -> Dict[str, Decimal]:
+        if self._source.supports_token_filter and self._requested_tokens and self._prices:
+            return await self._source.get_prices_for_tokens(tokens=self._requested_tokens.copy(),
+                                                            quote_token=self._quote_token)
+        return await self._get_source_prices()
+
+    async def _wait_for_next_refresh(self, consecutive_failures: int):
+        if consecutive_failures > 0:
+            await asyncio.sleep(min(self._source.refresh_interval * 2 ** consecutive_failures,
+                                    self._source.max_refresh_interval))
+            return
+        try:
+            await asyncio.wait_for(self._refresh_requested.wait(), timeout=self._source.refresh_interval)
+        except asyncio.TimeoutError:
+            pass
@@ -2,7 +2,7 @@ import asyncio
 import functools
 from asyncio import Task
 from decimal import Decimal
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Set, Union
 
 from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
@@ -13,6 +13,10 @@ from hummingbot.data_feed.coin_gecko_data_feed.coin_gecko_constants import COOLO
 
 
 class CoinGeckoRateSource(RateSourceBase):
+    # 10 requests per minute are allowed, a refresh of the requested tokens takes one or two of them
+    refresh_interval: float = 15.0
+    max_refresh_interval: float = COOLOFF_AFTER_BAN
+
     def __init__(self, extra_token_ids: List[str]):
         super().__init__()
         self._coin_gecko_supported_vs_tokens: Optional[List[str]] = None
@@ -33,6 +37,10 @@ class CoinGeckoRateSource(RateSourceBase):
     def extra_token_ids(self, new_ids: List[str]):
         self._extra_token_ids = new_ids
 
+    @property
+    def supports_token_filter(self) -> bool:
+        return True
+
     def try_event(self, fn):
         @functools.wraps(fn)
         async def try_raise_event(*args, **kwargs):
@@ -73,14 +81,8 @@ class CoinGeckoRateSource(RateSourceBase):
         if quote_token is None:
             raise NotImplementedError("Must supply a quote token to fetch prices for CoinGecko")
         self._ensure_data_feed()
-        vs_currency = quote_token.lower()
+        vs_currency = await self._get_vs_currency(quote_token)
         results = {}
-        if not self._coin_gecko_supported_vs_tokens:
-            self._coin_gecko_supported_vs_tokens = await self.try_event(
-                self._coin_gecko_data_feed.get_supported_vs_tokens)()
-
-        if vs_currency not in self._coin_gecko_supported_vs_tokens:
-            vs_currency = "usd"
 
         # Extra tokens
         r = await self.try_event(self._get_coin_gecko_extra_token_prices)(vs_currency)
@@ -105,6 +107,39 @@ class CoinGeckoRateSource(RateSourceBase):
         self._lock.release()
         return results
 
+    async def get_prices_for_tokens(self, tokens: Set[str], quote_token: Optional[str] = None) -> Dict[str, Decimal]:
+        """
+        Fetches the CoinGecko prices of the tokens with the given symbols and of the extra tokens. If more than one
+        CoinGecko token has the same symbol the one with the largest market cap is used.
+
+        :param tokens: The symbols of the tokens to fetch prices for
+        :param quote_token: The quote token for which to fetch prices
+        :return A dictionary of trading pairs and prices
+        """
+        if quote_token is None:
+            raise NotImplementedError("Must supply a quote token to fetch prices for CoinGecko")
+        self._ensure_data_feed()
+        async with self._lock:
+            vs_currency = await self._get_vs_currency(quote_token)
+            results = {}
+            if tokens:
+                resp = await self.try_event(self._coin_gecko_data_feed.get_prices_by_symbols)(
+                    vs_currency=vs_currency, symbols=sorted(tokens))
+                # the records are sorted by market cap, the first record of every symbol is kept
+                for record in reversed(resp):
+                    pair = combine_to_hb_trading_pair(base=record["symbol"].upper(), quote=vs_currency.upper())
+                    if record["current_price"]:
+                        results[pair] = Decimal(str(record["current_price"]))
+            results.update(await self.try_event(self._get_coin_gecko_extra_token_prices)(vs_currency))
+        return results
+
+    async def _get_vs_currency(self, quote_token: str) -> str:
+        if not self._coin_gecko_supported_vs_tokens:
+            self._coin_gecko_supported_vs_tokens = await self.try_event(
+                self._coin_gecko_data_feed.get_supported_vs_tokens)()
+        vs_currency = quote_token.lower()
+        return vs_currency if vs_currency in self._coin_gecko_supported_vs_tokens else "usd"
+
     def _ensure_data_feed(self):
         if self._coin_gecko_data_feed is None:
             self._coin_gecko_data_feed = CoinGeckoDataFeed()
@@ -1,13 +1,16 @@
 import logging
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import Dict, Optional
+from typing import Dict, Optional, Set
 
 from hummingbot.logger import HummingbotLogger
 
 
 class RateSourceBase(ABC):
     _logger: Optional[HummingbotLogger] = None
+    # Seconds between the RateOracle price updates, and the longest delay between them after consecutive failures
+    refresh_interval: float = 1.0
+    max_refresh_interval: float = 60.0
 
     @property
     @abstractmethod
@@ -23,3 +26,17 @@ class RateSourceBase(ABC):
     @abstractmethod
     async def get_prices(self, quote_token: Optional[str] = None) -> Dict[str, Decimal]:
         ...
+
+    @property
+    def supports_token_filter(self) -> bool:
+        """
+        True if the source can fetch the prices of a few tokens cheaper than all its prices.
+        """
+        return False
+
+    async def get_prices_for_tokens(self, tokens: Set[str], quote_token: Optional[str] = None) -> Dict[str, Decimal]:
+        """
+        Fetches the prices of the given tokens. The sources that don't support filtered queries return all their
+        prices, and the result may include prices of other tokens.
+        """
+        return await self.get_prices(quote_token=quote_token)
@@ -1,23 +1,42 @@
+import asyncio
 import cachetools
 import errno
 import functools
 import numpy as np
 import socket
 import pandas as pd
+from typing import Dict
 
 
 def async_ttl_cache(ttl: int = 3600, maxsize: int = 1):
+    """
+    Caches the results of a coroutine function for ttl seconds. The concurrent calls with the same arguments while the
+    result is not cached share the same in-flight call, instead of running the function once per caller.
+    """
     cache = cachetools.TTLCache(ttl=ttl, maxsize=maxsize)
+    in_flight: Dict[str, asyncio.Task] = {}
 
     def decorator(fn):
+        def on_done(key: str, task: asyncio.Task):
+            if in_flight.get(key) is task:
+                del in_flight[key]
+            if not task.cancelled() and task.exception() is None:
+                cache[key] = task.result()
+
         @functools.wraps(fn)
         async def memoize(*args, **kwargs):
             key = str((args, kwargs))
             try:
                 return cache[key]
             except KeyError:
-                cache[key] = await fn(*args, **kwargs)
-                return cache[key]
+                pass
+            task = in_flight.get(key)
+            if task is None or task.get_loop() is not asyncio.get_running_loop():
+                task = asyncio.ensure_future(fn(*args, **kwargs))
+                in_flight[key] = task
+                task.add_done_callback(functools.partial(on_done, key))
+            # shielded so that a cancelled caller doesn't cancel the call for the other callers
+            return await asyncio.shield(task)
 
         memoize.cache_clear = lambda: cache.clear()
         return memoize
@@ -1,6 +1,12 @@
+import asyncio
+import hashlib
+import json
 import logging
+import time
+from pathlib import Path
 from typing import Any, Awaitable, Callable, Dict, List, Optional
 
+from hummingbot import data_path
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.client.settings import AllConnectorSettings, ConnectorSetting
 from hummingbot.logger import HummingbotLogger
@@ -8,11 +14,24 @@ from hummingbot.logger import HummingbotLogger
 from ...client.config.security import Security
 from .async_utils import safe_ensure_future
 
+TRADING_PAIRS_CACHE_VERSION = 1
+TRADING_PAIRS_CACHE_FILE_NAME = "trading_pairs_cache.json"
+
 
 class TradingPairFetcher:
+    """
+    Keeps the trading pairs of the connectors, used for the autocompletion and the validation of the trading pairs.
+    The pairs of the last fetch are cached in the data folder, so they are available as soon as the client starts.
+    Only the connectors without cached pairs, or with pairs older than CACHE_TTL, are fetched again in the
+    background, at most MAX_CONCURRENT_FETCHES at a time and each one limited to FETCH_TIMEOUT seconds.
+    """
     _sf_shared_instance: "TradingPairFetcher" = None
     _tpf_logger: Optional[HummingbotLogger] = None
 
+    CACHE_TTL = 24 * 60 * 60
+    MAX_CONCURRENT_FETCHES = 8
+    FETCH_TIMEOUT = 30.0
+
     @classmethod
     def logger(cls) -> HummingbotLogger:
         if cls._tpf_logger is None:
@@ -30,49 +49,107 @@ class TradingPairFetcher:
         self.ready = False
         self.trading_pairs: Dict[str, Any] = {}
         self.fetch_pairs_from_all_exchanges = client_config_map.fetch_pairs_from_all_exchanges
+        self._cache: Dict[str, Dict[str, Any]] = self._load_cache()
+        self._fetch_semaphore: Optional[asyncio.Semaphore] = None
         self._fetch_task = safe_ensure_future(self.fetch_all(client_config_map))
 
-    def _fetch_pairs_from_connector_setting(
+    async def _fetch_pairs_from_connector_setting(
             self,
             connector_setting: ConnectorSetting,
             connector_name: Optional[str] = None):
         connector_name = connector_name or connector_setting.name
-        connector = connector_setting.non_trading_connector_instance_with_default_configuration()
-        safe_ensure_future(self.call_fetch_pairs(connector.all_trading_pairs(), connector_name))
+        if self._fetch_semaphore is None:
+            self._fetch_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_FETCHES)
+        async with self._fetch_semaphore:
+            try:
+                connector = connector_setting.non_trading_connector_instance_with_default_configuration()
+            except ModuleNotFoundError:
+                # XXX(martin_kou): Some connectors, e.g. uniswap v3, aren't completed yet. Ignore if you can't find
+                # the data source module for them.
+                return
+            await self.call_fetch_pairs(
+                asyncio.wait_for(connector.all_trading_pairs(), timeout=self.FETCH_TIMEOUT), connector_name)
 
     async def fetch_all(self, client_config_map: ClientConfigAdapter):
         await Security.wait_til_decryption_done()
         connector_settings = self._all_connector_settings()
+        fetches = []
         for conn_setting in connector_settings.values():
-            # XXX(martin_kou): Some connectors, e.g. uniswap v3, aren't completed yet. Ignore if you can't find the
-            # data source module for them.
             try:
                 if conn_setting.base_name().endswith("paper_trade"):
-                    self._fetch_pairs_from_connector_setting(
-                        connector_setting=connector_settings[conn_setting.parent_name],
-                        connector_name=conn_setting.name
-                    )
-                elif not self.fetch_pairs_from_all_exchanges:
-                    if conn_setting.connector_connected():
-                        self._fetch_pairs_from_connector_setting(connector_setting=conn_setting)
+                    fetch_setting = connector_settings[conn_setting.parent_name]
+                elif not self.fetch_pairs_from_all_exchanges and not conn_setting.connector_connected():
+                    continue
                 else:
-                    self._fetch_pairs_from_connector_setting(connector_setting=conn_setting)
-            except ModuleNotFoundError:
-                continue
+                    fetch_setting = conn_setting
+                cache_entry = self._cache.get(conn_setting.name)
+                if cache_entry is not None:
+                    self.trading_pairs[conn_setting.name] = cache_entry["trading_pairs"]
+                    if time.time() - cache_entry["timestamp"] < self.CACHE_TTL:
+                        continue
+                fetches.append(self._fetch_pairs_from_connector_setting(
+                    connector_setting=fetch_setting,
+                    connector_name=conn_setting.name
+                ))
             except Exception:
                 self.logger().exception(f"An error occurred when fetching trading pairs for {conn_setting.name}."
                                         "Please check the logs")
+        # The cached pairs are usable right away, the stale and missing ones are refreshed in the background
         self.ready = True
+        if len(fetches) > 0:
+            await asyncio.gather(*fetches)
+            self._save_cache()
 
     async def call_fetch_pairs(self, fetch_fn: Callable[[], Awaitable[List[str]]], exchange_name: str):
         try:
             pairs = await fetch_fn
-            self.trading_pairs[exchange_name] = pairs
         except Exception:
             self.logger().error(f"Connector {exchange_name} failed to retrieve its trading pairs. "
                                 f"Trading pairs autocompletion won't work.", exc_info=True)
-            # In case of error just assign empty list, this is st. the bot won't stop working
-            self.trading_pairs[exchange_name] = []
+            # In case of error keep the cached pairs, or assign an empty list, this is st. the bot won't stop working
+            self.trading_pairs.setdefault(exchange_name, [])
+            return
+        pairs_hash = self._trading_pairs_hash(pairs)
+        cache_entry = self._cache.get(exchange_name)
+        if cache_entry is None or cache_entry["hash"] != pairs_hash:
+            self.trading_pairs[exchange_name] = pairs
+            self._cache[exchange_name] = {"hash": pairs_hash, "timestamp": time.time(), "trading_pairs": pairs}
+        else:
+            # The pairs didn't change, the cached list is kept and only its age is reset
+            self.trading_pairs[exchange_name] = cache_entry["trading_pairs"]
+            cache_entry["timestamp"] = time.time()
+
+    @staticmethod
+    def _trading_pairs_hash(trading_pairs: List[str]) -> str:
+        return hashlib.sha256(json.dumps(trading_pairs).encode()).hexdigest()
+
+    @classmethod
+    def _cache_path(cls) -> Path:
+        return Path(data_path()) / TRADING_PAIRS_CACHE_FILE_NAME
+
+    def _load_cache(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self._cache_path()) as fd:
+                cache = json.load(fd)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError):
+            self.logger().warning("The trading pairs cache could not be read, the trading pairs will be fetched.")
+            return {}
+        if cache.get("version") != TRADING_PAIRS_CACHE_VERSION:
+            return {}
+        return cache.get("connectors", {})
+
+    def _save_cache(self):
+        cache = {"version": TRADING_PAIRS_CACHE_VERSION, "connectors": self._cache}
+        try:
+            cache_path = self._cache_path()
+            temp_path = cache_path.with_suffix(".tmp")
+            with open(temp_path, "w") as fd:
+                json.dump(cache, fd)
+            temp_path.replace(cache_path)
+        except OSError:
+            self.logger().warning("The trading pairs cache could not be saved.", exc_info=True)
 
     def _all_connector_settings(self) -> Dict[str, ConnectorSetting]:
         # Method created to enabling patching in unit tests
@@ -0,0 +1,151 @@
+import math
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.candles_ring_buffer import CandlesRingBuffer
+
+
+class AggregatedCandles:
+    """
+    Candles of a coarser interval derived from the candles of a running feed of the same trading pair, so every
+    interval of a pair can be served by a single websocket stream.
+
+    The candles are resampled incrementally in a ring buffer when they are read: only the candles of the base feed
+    from the start of the last aggregated candle are processed, and the whole history is only aggregated again when
+    the base feed was refilled. As in the exchanges, the last candle is partial while its interval is open, but the
+    first candles of the base feed are discarded when they don't cover a full interval.
+    """
+    columns = CandlesBase.columns
+    # Every aggregated column is reduced with one of these operations, the timestamp is the start of the interval
+    _first_columns = ["open"]
+    _max_columns = ["high"]
+    _min_columns = ["low"]
+    _last_columns = ["close"]
+    _sum_columns = ["volume", "quote_asset_volume", "n_trades", "taker_buy_base_volume", "taker_buy_quote_volume"]
+
+    @staticmethod
+    def can_aggregate(base_interval: str, interval: str) -> bool:
+        """
+        Checks if the candles of the interval can be built from the ones of the base interval. The candles of the
+        exchanges are aligned to the start of the day in UTC, so only the intervals that divide a day can be derived.
+        """
+        seconds = CandlesBase.interval_to_seconds.get(interval)
+        base_seconds = CandlesBase.interval_to_seconds.get(base_interval)
+        if seconds is None or base_seconds is None or seconds <= base_seconds:
+            return False
+        return seconds % base_seconds == 0 and 86400 % seconds == 0
+
+    def __init__(self, base_feed: CandlesBase, interval: str, max_records: int = 150):
+        if not self.can_aggregate(base_feed.interval, interval):
+            raise ValueError(f"The {interval} candles can't be derived from the {base_feed.interval} candles.")
+        self.base_feed = base_feed
+        self.interval = interval
+        self.max_records = max_records
+        if base_feed.max_records < max_records * self.ratio:
+            raise ValueError(f"The {base_feed.interval} feed keeps {base_feed.max_records} candles, "
+                             f"{max_records * self.ratio} are needed for {max_records} {interval} candles.")
+        self._step = CandlesBase.interval_to_seconds[interval] * base_feed.timestamp_units_per_second
+        self._candles = CandlesRingBuffer(maxlen=max_records, number_of_columns=len(self.columns))
+        self._base_version = -1
+        self._candles_df_cache: Optional[pd.DataFrame] = None
+        self._candles_df_version = -1
+
+    @property
+    def name(self) -> str:
+        return self.base_feed.name
+
+    @property
+    def ratio(self) -> int:
+        """
+        Number of candles of the base feed in every aggregated candle.
+        """
+        return CandlesBase.interval_to_seconds[self.interval] // CandlesBase.interval_to_seconds[self.base_feed.interval]
+
+    def start(self):
+        """
+        The candles are derived from the base feed, which is started and stopped by its owner.
+        """
+        pass
+
+    def stop(self):
+        pass
+
+    @property
+    def ready(self) -> bool:
+        self._update()
+        return len(self._candles) == self._candles.maxlen and self.base_feed._interruption_timestamp is None
+
+    @property
+    def candles_df(self) -> pd.DataFrame:
+        """
+        Same as the candles_df of the feeds, a shallow copy of a DataFrame cached until the candles change. It's built
+        by the base feed, so the timestamps have the same units as in the candles of the base feed.
+        """
+        self._update()
+        if self._candles_df_version != self._candles.version:
+            self._candles_df_cache = self.base_feed._build_candles_df(self._candles.values)
+            self._candles_df_version = self._candles.version
+        return self._candles_df_cache.copy(deep=False)
+
+    @property
+    def candles_array(self) -> np.ndarray:
+        self._update()
+        return self._candles.values
+
+    def _update(self):
+        base_candles = self.base_feed._candles
+        if self._base_version == base_candles.version:
+            return
+        self._base_version = base_candles.version
+        values = base_candles.values
+        if len(values) == 0:
+            self._candles.clear()
+            return
+        start_index = self._incremental_start_index(values)
+        if start_index is None:
+            self._candles.clear()
+            self._candles.extend(self._aggregate(values, drop_partial_first=True)[-self._candles.maxlen:])
+        else:
+            candles = self._aggregate(values[start_index:], drop_partial_first=False)
+            self._candles.update_last(candles[0])
+            self._candles.extend(candles[1:])
+
+    def _incremental_start_index(self, values: np.ndarray) -> Optional[int]:
+        """
+        Returns the index of the base candle that opens the last aggregated candle, or None if the history has to be
+        aggregated again because the candle is no longer in the base feed or older candles can be added.
+        """
+        if len(self._candles) == 0:
+            return None
+        first_complete_start = math.ceil(values[0, 0] / self._step) * self._step
+        if len(self._candles) < self._candles.maxlen and first_complete_start < self._candles[0][0]:
+            return None
+        last_start = self._candles[-1][0]
+        index = int(np.searchsorted(values[:, 0], last_start))
+        if index == len(values) or values[index, 0] != last_start:
+            return None
+        return index
+
+    def _aggregate(self, values: np.ndarray, drop_partial_first: bool) -> np.ndarray:
+        starts = values[:, 0] // self._step * self._step
+        first_indexes = np.concatenate([[0], np.flatnonzero(np.diff(starts)) + 1])
+        last_indexes = np.concatenate([first_indexes[1:] - 1, [len(values) - 1]])
+        columns = {column: i for i, column in enumerate(self.columns)}
+        candles = np.empty((len(first_indexes), len(self.columns)), dtype=np.float64)
+        candles[:, 0] = starts[first_indexes]
+        for column in self._first_columns:
+            candles[:, columns[column]] = values[first_indexes, columns[column]]
+        for column in self._last_columns:
+            candles[:, columns[column]] = values[last_indexes, columns[column]]
+        for column in self._max_columns:
+            candles[:, columns[column]] = np.maximum.reduceat(values[:, columns[column]], first_indexes)
+        for column in self._min_columns:
+            candles[:, columns[column]] = np.minimum.reduceat(values[:, columns[column]], first_indexes)
+        for column in self._sum_columns:
+            candles[:, columns[column]] = np.add.reduceat(values[:, columns[column]], first_indexes)
+        if drop_partial_first and values[0, 0] != starts[0]:
+            candles = candles[1:]
+        return candles
@@ -0,0 +1,117 @@
+"""
+Indicators computed at once for the candles of many trading pairs.
+
+Every function receives 2-D arrays with one row per trading pair and one column per candle, ordered by timestamp,
+and computes the indicator along the rows with the same definitions as pandas_ta. The recursive indicators are
+computed with a linear filter over the time axis, so the cost is a few array operations regardless of the number
+of trading pairs. Leading NaNs, e.g. from a trading pair with less candles than the others, are treated as missing
+values.
+"""
+from typing import Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from hummingbot.core.utils.lazy_import import lazy_import
+from hummingbot.data_feed.candles_feed.candles_indicators import non_zero
+
+# scipy is only needed when the indicators are computed
+signal = lazy_import("scipy.signal")
+
+
+def _windows(values: np.ndarray, length: int) -> np.ndarray:
+    return sliding_window_view(values, length, axis=1)
+
+
+def _pad_front(values: np.ndarray, length: int) -> np.ndarray:
+    padding = np.full((values.shape[0], length - 1), np.nan)
+    return np.concatenate([padding, values], axis=1)
+
+
+def sma(values: np.ndarray, length: int) -> np.ndarray:
+    """
+    Simple moving average, NaN until `length` values are available.
+    """
+    if values.shape[1] < length:
+        return np.full(values.shape, np.nan)
+    return _pad_front(_windows(values, length).mean(axis=2), length)
+
+
+def rolling_std(values: np.ndarray, length: int, ddof: int = 0) -> np.ndarray:
+    if values.shape[1] < length:
+        return np.full(values.shape, np.nan)
+    return _pad_front(_windows(values, length).std(axis=2, ddof=ddof), length)
+
+
+def _shift_rows(values: np.ndarray, shifts: np.ndarray) -> np.ndarray:
+    """
+    Moves every row `shifts` columns to the left (or to the right when negative), filling the columns left with NaN.
+    """
+    columns = np.arange(values.shape[1])[np.newaxis, :] + shifts[:, np.newaxis]
+    is_inside = (columns >= 0) & (columns < values.shape[1])
+    shifted = np.take_along_axis(values, np.clip(columns, 0, values.shape[1] - 1), axis=1)
+    return np.where(is_inside, shifted, np.nan)
+
+
+def ema(values: np.ndarray, length: int) -> np.ndarray:
+    """
+    Exponential moving average as pandas_ta's ema: seeded with the mean of the first `length` values of every row and
+    then alpha = 2 / (length + 1). The leading NaNs of a row are skipped, so its seed is the mean of its first `length`
+    valid values.
+    """
+    result = np.full(values.shape, np.nan)
+    if values.shape[1] < length:
+        return result
+    is_valid = ~np.isnan(values)
+    first_valid = np.where(is_valid.any(axis=1), is_valid.argmax(axis=1), values.shape[1])
+    has_leading_nans = first_valid.any()
+    if has_leading_nans:
+        # The rows are aligned on their first valid value, so the seeds are taken from the same columns
+        values = _shift_rows(values, first_valid)
+    alpha = 2 / (length + 1)
+    seed = values[:, :length].mean(axis=1)
+    result[:, length - 1] = seed
+    if values.shape[1] > length:
+        result[:, length:], _ = signal.lfilter([alpha], [1, alpha - 1], values[:, length:], axis=1,
+                                               zi=((1 - alpha) * seed)[:, np.newaxis])
+    return _shift_rows(result, -first_valid) if has_leading_nans else result
+
+
+def rma(values: np.ndarray, length: int) -> np.ndarray:
+    """
+    Wilder's moving average as pandas_ta's rma, the pandas ewm with alpha = 1 / length, adjust=True and
+    min_periods=length. The NaNs don't count as values but decay the weights of the previous ones, as in pandas.
+    """
+    decay = 1 - 1 / length
+    is_valid = ~np.isnan(values)
+    weighted_sums = signal.lfilter([1], [1, -decay], np.where(is_valid, values, 0.0), axis=1)
+    weights = signal.lfilter([1], [1, -decay], is_valid.astype(float), axis=1)
+    result = np.full(values.shape, np.nan)
+    np.divide(weighted_sums, weights, out=result, where=np.cumsum(is_valid, axis=1) >= length)
+    return result
+
+
+def rsi(close: np.ndarray, length: int = 14) -> np.ndarray:
+    """
+    Relative strength index as pandas_ta's rsi.
+    """
+    change = np.full(close.shape, np.nan)
+    change[:, 1:] = np.diff(close, axis=1)
+    positive_average = rma(np.where(change > 0, change, np.where(np.isnan(change), np.nan, 0.0)), length)
+    negative_average = rma(np.where(change < 0, -change, np.where(np.isnan(change), np.nan, 0.0)), length)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return 100 * positive_average / (positive_average + negative_average)
+
+
+def bollinger_bands(close: np.ndarray, length: int = 5,
+                    std: float = 2.0) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Bollinger bands as pandas_ta's bbands: lower, middle and upper bands, bandwidth and percent (BBP).
+    """
+    middle = sma(close, length)
+    deviation = std * rolling_std(close, length)
+    lower = middle - deviation
+    upper = middle + deviation
+    width = non_zero(upper - lower)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return lower, middle, upper, 100 * width / middle, non_zero(close - lower) / width
@@ -7,6 +7,8 @@ HEALTH_CHECK_ENDPOINT = "/fapi/v1/ping"
 CANDLES_ENDPOINT = "/fapi/v1/klines"
 
 WSS_URL = "wss://fstream.binance.com/ws"
+# Maximum number of streams that a single websocket connection can listen to
+MAX_STREAMS_PER_CONNECTION = 200
 
 INTERVALS = bidict({
     "1m": 60,
@@ -1,6 +1,6 @@
 import asyncio
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 import numpy as np
 
@@ -14,6 +14,7 @@ from hummingbot.logger import HummingbotLogger
 
 class BinanceSpotCandles(CandlesBase):
     _logger: Optional[HummingbotLogger] = None
+    max_streams_per_connection = CONSTANTS.MAX_STREAMS_PER_CONNECTION
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -52,6 +53,23 @@ class BinanceSpotCandles(CandlesBase):
     def intervals(self):
         return CONSTANTS.INTERVALS
 
+    @property
+    def stream_key(self) -> str:
+        return f"{self._ex_trading_pair.lower()}@kline_{self.interval}"
+
+    @staticmethod
+    def get_stream_key_from_message(data: Optional[Dict[str, Any]]) -> Optional[str]:
+        if data is not None and data.get("e") == "kline":
+            return f"{data['s'].lower()}@kline_{data['k']['i']}"
+
+    @staticmethod
+    def build_subscription_payload(stream_keys: List[str], subscribe: bool, request_id: int) -> Dict[str, Any]:
+        return {
+            "method": "SUBSCRIBE" if subscribe else "UNSUBSCRIBE",
+            "params": stream_keys,
+            "id": request_id
+        }
+
     async def check_network(self) -> NetworkStatus:
         rest_assistant = await self._api_factory.get_rest_assistant()
         await rest_assistant.execute_request(url=self.health_check_url,
@@ -110,13 +128,7 @@ class BinanceSpotCandles(CandlesBase):
         :param ws: the websocket assistant used to connect to the exchange
         """
         try:
-            candle_params = []
-            candle_params.append(f"{self._ex_trading_pair.lower()}@kline_{self.interval}")
-            payload = {
-                "method": "SUBSCRIBE",
-                "params": candle_params,
-                "id": 1
-            }
+            payload = self.build_subscription_payload([self.stream_key], subscribe=True, request_id=1)
             subscribe_candles_request: WSJSONRequest = WSJSONRequest(payload=payload)
 
             await ws.send(subscribe_candles_request)
@@ -132,30 +144,32 @@ class BinanceSpotCandles(CandlesBase):
 
     async def _process_websocket_messages(self, websocket_assistant: WSAssistant):
         async for ws_response in websocket_assistant.iter_messages():
-            data: Dict[str, Any] = ws_response.data
-            if data is not None and data.get("e") == "kline":  # data will be None when the websocket is disconnected
-                timestamp = data["k"]["t"]
-                open = data["k"]["o"]
-                high = data["k"]["h"]
-                low = data["k"]["l"]
-                close = data["k"]["c"]
-                volume = data["k"]["v"]
-                quote_asset_volume = data["k"]["q"]
-                n_trades = data["k"]["n"]
-                taker_buy_base_volume = data["k"]["V"]
-                taker_buy_quote_volume = data["k"]["Q"]
-                if len(self._candles) == 0:
-                    self._candles.append(np.array([timestamp, open, high, low, close, volume,
-                                                   quote_asset_volume, n_trades, taker_buy_base_volume,
-                                                   taker_buy_quote_volume]))
-                    safe_ensure_future(self.fill_historical_candles())
-                elif timestamp > int(self._candles[-1][0]):
-                    # TODO: validate also that the diff of timestamp == interval (issue with 1M interval).
-                    self._candles.append(np.array([timestamp, open, high, low, close, volume,
-                                                   quote_asset_volume, n_trades, taker_buy_base_volume,
-                                                   taker_buy_quote_volume]))
-                elif timestamp == int(self._candles[-1][0]):
-                    self._candles.pop()
-                    self._candles.append(np.array([timestamp, open, high, low, close, volume,
-                                                   quote_asset_volume, n_trades, taker_buy_base_volume,
-                                                   taker_buy_quote_volume]))
+            self._process_websocket_message(ws_response.data)
+
+    def _process_websocket_message(self, data: Optional[Dict[str, Any]]):
+        if data is not None and data.get("e") == "kline":  # data will be None when the websocket is disconnected
+            timestamp = data["k"]["t"]
+            open = data["k"]["o"]
+            high = data["k"]["h"]
+            low = data["k"]["l"]
+            close = data["k"]["c"]
+            volume = data["k"]["v"]
+            quote_asset_volume = data["k"]["q"]
+            n_trades = data["k"]["n"]
+            taker_buy_base_volume = data["k"]["V"]
+            taker_buy_quote_volume = data["k"]["Q"]
+            if len(self._candles) == 0:
+                self._candles.append(np.array([timestamp, open, high, low, close, volume,
+                                               quote_asset_volume, n_trades, taker_buy_base_volume,
+                                               taker_buy_quote_volume]))
+                safe_ensure_future(self.fill_historical_candles())
+            elif timestamp > int(self._candles[-1][0]):
+                # TODO: validate also that the diff of timestamp == interval (issue with 1M interval).
+                self._candles.append(np.array([timestamp, open, high, low, close, volume,
+                                               quote_asset_volume, n_trades, taker_buy_base_volume,
+                                               taker_buy_quote_volume]))
+            elif timestamp == int(self._candles[-1][0]):
+                self._candles.pop()
+                self._candles.append(np.array([timestamp, open, high, low, close, volume,
+                                               quote_asset_volume, n_trades, taker_buy_base_volume,
+                                               taker_buy_quote_volume]))
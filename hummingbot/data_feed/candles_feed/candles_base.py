@@ -1,7 +1,8 @@
 import asyncio
+import math
 import os
-from collections import deque
-from typing import Optional
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 import numpy as np
 import pandas as pd
@@ -13,13 +14,17 @@ from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
-from hummingbot.data_feed.candles_feed.data_types import HistoricalCandlesConfig
+from hummingbot.data_feed.candles_feed.candles_ring_buffer import CandlesRingBuffer
+from hummingbot.data_feed.candles_feed.data_types import CandlesFeedMetrics, HistoricalCandlesConfig
+
+if TYPE_CHECKING:  # pragma: no cover
+    from hummingbot.data_feed.candles_feed.candles_connection_hub import CandlesConnectionHub
 
 
 class CandlesBase(NetworkBase):
     """
     This class serves as a base class for fetching and storing candle data from a cryptocurrency exchange.
-    The class uses the Rest and WS Assistants for all the IO operations, and a double-ended queue to store candles.
+    The class uses the Rest and WS Assistants for all the IO operations, and a NumPy ring buffer to store candles.
     Also implements the Throttler module for API rate limiting, but it's not so necessary since the realtime data should
     be updated via websockets mainly.
     """
@@ -43,14 +48,24 @@ class CandlesBase(NetworkBase):
     })
     columns = ["timestamp", "open", "high", "low", "close", "volume", "quote_asset_volume",
                "n_trades", "taker_buy_base_volume", "taker_buy_quote_volume"]
+    # Units of the timestamps stored in the buffer per second
+    timestamp_units_per_second = 1000
+    # Streams allowed in a single websocket by the exchange. When it's set the feeds created by the CandlesFactory share
+    # their websockets through a CandlesConnectionHub, otherwise every feed opens its own websocket.
+    max_streams_per_connection: Optional[int] = None
 
     def __init__(self, trading_pair: str, interval: str = "1m", max_records: int = 150):
         super().__init__()
         async_throttler = AsyncThrottler(rate_limits=self.rate_limits)
         self._api_factory = WebAssistantsFactory(throttler=async_throttler)
         self.max_records = max_records
-        self._candles = deque(maxlen=max_records)
+        self._candles = CandlesRingBuffer(maxlen=max_records, number_of_columns=len(self.columns))
+        self._candles_df_cache: Optional[pd.DataFrame] = None
+        self._candles_df_version = -1
         self._listen_candles_task: Optional[asyncio.Task] = None
+        self._interruption_timestamp: Optional[float] = None
+        self.connection_hub: Optional["CandlesConnectionHub"] = None
+        self.metrics = CandlesFeedMetrics()
         self._trading_pair = trading_pair
         self._ex_trading_pair = self.get_exchange_trading_pair(trading_pair)
         if interval in self.intervals.keys():
@@ -65,12 +80,17 @@ class CandlesBase(NetworkBase):
         This method starts the network and starts a task for listen_for_subscriptions.
         """
         await self.stop_network()
-        self._listen_candles_task = safe_ensure_future(self.listen_for_subscriptions())
+        if self.connection_hub is not None:
+            self.connection_hub.add_feed(self)
+        else:
+            self._listen_candles_task = safe_ensure_future(self.listen_for_subscriptions())
 
     async def stop_network(self):
         """
         This method stops the network by canceling the _listen_candles_task task.
         """
+        if self.connection_hub is not None:
+            self.connection_hub.remove_feed(self)
         if self._listen_candles_task is not None:
             self._listen_candles_task.cancel()
             self._listen_candles_task = None
@@ -78,9 +98,10 @@ class CandlesBase(NetworkBase):
     @property
     def ready(self):
         """
-        This property returns a boolean indicating whether the _candles deque has reached its maximum length.
+        This property returns a boolean indicating whether the _candles buffer has reached its maximum length and
+        there is no gap pending to be filled after a reconnection.
         """
-        return len(self._candles) == self._candles.maxlen
+        return len(self._candles) == self._candles.maxlen and self._interruption_timestamp is None
 
     @property
     def name(self):
@@ -116,9 +137,30 @@ class CandlesBase(NetworkBase):
     @property
     def candles_df(self) -> pd.DataFrame:
         """
-        This property returns the candles stored in the _candles deque as a Pandas DataFrame.
+        This property returns the candles stored in the _candles buffer as a Pandas DataFrame.
+        The DataFrame is built only when a candle is added or updated, every access returns a shallow copy of the
+        cached one, so the callers can add columns without affecting the other consumers of the feed.
+        """
+        if self._candles_df_version != self._candles.version:
+            self._candles_df_cache = self._build_candles_df()
+            self._candles_df_version = self._candles.version
+        return self._candles_df_cache.copy(deep=False)
+
+    @property
+    def candles_array(self) -> np.ndarray:
+        """
+        Read only NumPy view of the candles, ordered by timestamp and with the columns in the order of `columns`.
+        It doesn't copy the candles, so it's only valid until the next update of the feed.
         """
-        return pd.DataFrame(self._candles, columns=self.columns, dtype=float)
+        return self._candles.values
+
+    def _build_candles_df(self, candles: Optional[np.ndarray] = None) -> pd.DataFrame:
+        """
+        Builds the DataFrame of the candles, the candles of the feed by default. The feeds that store the candles with
+        other units override it, and the candles aggregated from the feed are built with it too.
+        """
+        candles = self._candles.values if candles is None else candles
+        return pd.DataFrame(candles.copy(), columns=self.columns)
 
     def get_exchange_trading_pair(self, trading_pair):
         raise NotImplementedError
@@ -170,7 +212,7 @@ class CandlesBase(NetworkBase):
 
     async def fill_historical_candles(self):
         """
-        This is an abstract method that must be implemented by a subclass to fill the _candles deque with historical candles.
+        This is an abstract method that must be implemented by a subclass to fill the _candles buffer with historical candles.
         """
         raise NotImplementedError
 
@@ -184,6 +226,8 @@ class CandlesBase(NetworkBase):
             try:
                 ws: WSAssistant = await self._connected_websocket_assistant()
                 await self._subscribe_channels(ws)
+                if self._interruption_timestamp is not None:
+                    await self.fill_candles_gap()
                 await self._process_websocket_messages(websocket_assistant=ws)
             except asyncio.CancelledError:
                 raise
@@ -213,15 +257,122 @@ class CandlesBase(NetworkBase):
     async def _process_websocket_messages(self, websocket_assistant: WSAssistant):
         raise NotImplementedError
 
+    @property
+    def stream_key(self) -> str:
+        """
+        Name of the stream of the feed, used to route the messages of a shared websocket.
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def get_stream_key_from_message(data: Any) -> Optional[str]:
+        """
+        Returns the stream of a websocket message, or None if the message is not a candle.
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def build_subscription_payload(stream_keys: List[str], subscribe: bool, request_id: int) -> Dict[str, Any]:
+        """
+        Builds the message to subscribe or unsubscribe many streams at once in a shared websocket.
+        """
+        raise NotImplementedError
+
+    def _process_websocket_message(self, data: Any):
+        """
+        Processes a single websocket message of the feed, required by the feeds that share their websocket.
+        """
+        raise NotImplementedError
+
     async def _sleep(self, delay):
         """
         Function added only to facilitate patching the sleep in unit tests without affecting the asyncio module
         """
         await asyncio.sleep(delay)
 
+    def _time(self) -> float:
+        return time.time()
+
     async def _on_order_stream_interruption(self, websocket_assistant: Optional[WSAssistant] = None):
+        """
+        A full buffer is kept, only the candles missed while disconnected are fetched after reconnecting. A partial
+        buffer is cleared so the history is filled again from the first candle received.
+        """
         websocket_assistant and await websocket_assistant.disconnect()
+        self.metrics.interruptions += 1
+        if len(self._candles) == self._candles.maxlen:
+            if self._interruption_timestamp is None:
+                self._interruption_timestamp = self._time()
+        else:
+            self._interruption_timestamp = None
+            self._candles.clear()
+
+    async def fetch_latest_candles(self, limit: int) -> np.ndarray:
+        """
+        Fetches the most recent candles, including the one that is still open.
+        :param limit: quantity of candles
+        :return: numpy array with the candlesticks
+        """
+        return await self.fetch_candles(limit=limit)
+
+    async def fill_candles_gap(self):
+        """
+        Fetches the candles since the interruption of the websocket and merges them into the buffer. The candle that
+        was open when the connection dropped is refreshed too. If the merged candles are not continuous the buffer is
+        cleared, so the full history is fetched again as when the feed starts.
+        """
+        interval = self.get_seconds_from_interval(self.interval)
+        start = self._time()
+        gap_duration = start - self._interruption_timestamp
+        missing_records = math.ceil(gap_duration / interval) + 2
+        try:
+            if missing_records >= self._candles.maxlen:
+                raise ValueError(f"the gap of {missing_records} candles is larger than the buffer")
+            candles = await self.fetch_latest_candles(limit=missing_records)
+            new_records = self._merge_candles(candles)
+            if not self._is_continuous(self._candles.values[:, 0]):
+                raise ValueError("the candles are not continuous after filling the gap")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.logger().warning(f"Could not fill the candles gap of {self.name} ({e}), fetching the full history.")
+            self._candles.clear()
+            self.metrics.full_refills += 1
+        else:
+            latency = self._time() - start
+            self.logger().info(f"Filled the gap of {new_records} candles of {self.name} in {latency:.2f}s.")
+            self.metrics.gap_fills += 1
+            self.metrics.last_gap_records = new_records
+            self.metrics.last_gap_duration = gap_duration
+            self.metrics.last_refill_latency = latency
+            self.metrics.max_refill_latency = max(self.metrics.max_refill_latency, latency)
+        finally:
+            self._interruption_timestamp = None
+
+    def _merge_candles(self, candles: np.ndarray) -> int:
+        """
+        Merges the fetched candles into the buffer, the fetched values replace the stored ones with the same
+        timestamp. Returns the number of candles that were not in the buffer.
+        """
+        if len(candles) == 0:
+            return 0
+        stored = self._candles.values
+        merged = np.concatenate([np.asarray(candles, dtype=float).reshape(-1, len(self.columns)), stored])
+        # np.unique keeps the first occurrence, so the fetched candle is used when the timestamp is repeated
+        _, indexes = np.unique(merged[:, 0], return_index=True)
+        new_records = len(indexes) - len(stored)
         self._candles.clear()
+        self._candles.extend(merged[indexes][-self._candles.maxlen:])
+        return new_records
+
+    def _is_continuous(self, timestamps: np.ndarray) -> bool:
+        """
+        Checks that there are no missing candles. Months have different lengths, so those are not validated.
+        """
+        if self.interval == "1M":
+            return True
+        interval = self.get_seconds_from_interval(self.interval) * self.timestamp_units_per_second
+        return bool(np.all(np.diff(timestamps) == interval))
 
     def get_seconds_from_interval(self, interval: str) -> int:
         """
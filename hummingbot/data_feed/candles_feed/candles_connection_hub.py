@@ -0,0 +1,198 @@
+import asyncio
+import logging
+from typing import Dict, List, Optional, Set, Type
+
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
+from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest
+from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
+from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.logger import HummingbotLogger
+
+
+class CandlesHubConnection:
+    """
+    A websocket shared by many candles feeds of the same exchange. Every message is routed to the feeds of its
+    stream, and the subscriptions requested while the websocket is running are sent together in a single message to
+    respect the limits of messages per second of the exchanges.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, candles_class: Type[CandlesBase], api_factory: WebAssistantsFactory, wss_url: str,
+                 subscriptions_delay: float = 0.5):
+        self._candles_class = candles_class
+        self._api_factory = api_factory
+        self._wss_url = wss_url
+        self._subscriptions_delay = subscriptions_delay
+        self._feeds: Dict[str, List[CandlesBase]] = {}
+        self._pending_subscriptions: Set[str] = set()
+        self._pending_unsubscriptions: Set[str] = set()
+        self._request_id = 0
+        self._ws: Optional[WSAssistant] = None
+        self._listen_task: Optional[asyncio.Task] = None
+        self._subscriptions_task: Optional[asyncio.Task] = None
+
+    @property
+    def number_of_streams(self) -> int:
+        return len(self._feeds)
+
+    @property
+    def is_running(self) -> bool:
+        return self._listen_task is not None
+
+    def has_stream(self, stream_key: str) -> bool:
+        return stream_key in self._feeds
+
+    def add_feed(self, feed: CandlesBase):
+        feeds = self._feeds.setdefault(feed.stream_key, [])
+        if feed in feeds:
+            return
+        feeds.append(feed)
+        if len(feeds) == 1:
+            self._pending_unsubscriptions.discard(feed.stream_key)
+            self._pending_subscriptions.add(feed.stream_key)
+        if self._listen_task is None:
+            self._listen_task = safe_ensure_future(self.listen_for_subscriptions())
+        else:
+            self._schedule_subscriptions()
+
+    def remove_feed(self, feed: CandlesBase):
+        feeds = self._feeds.get(feed.stream_key, [])
+        if feed not in feeds:
+            return
+        feeds.remove(feed)
+        if len(feeds) == 0:
+            del self._feeds[feed.stream_key]
+            self._pending_subscriptions.discard(feed.stream_key)
+            self._pending_unsubscriptions.add(feed.stream_key)
+            self._schedule_subscriptions()
+        if len(self._feeds) == 0:
+            self.stop()
+
+    def stop(self):
+        for task in (self._listen_task, self._subscriptions_task):
+            if task is not None:
+                task.cancel()
+        self._listen_task = None
+        self._subscriptions_task = None
+        self._pending_subscriptions.clear()
+        self._pending_unsubscriptions.clear()
+
+    async def listen_for_subscriptions(self):
+        while True:
+            try:
+                self._ws = await self._api_factory.get_ws_assistant()
+                await self._ws.connect(ws_url=self._wss_url, ping_timeout=30)
+                self._pending_subscriptions.update(self._feeds.keys())
+                self._pending_unsubscriptions.clear()
+                await self._send_pending_subscriptions()
+                await self._fill_candles_gaps()
+                async for ws_response in self._ws.iter_messages():
+                    self._process_websocket_message(ws_response.data)
+            except asyncio.CancelledError:
+                raise
+            except ConnectionError as connection_exception:
+                self.logger().warning(f"The shared candles websocket was closed ({connection_exception})")
+            except Exception:
+                self.logger().exception(
+                    "Unexpected error occurred when listening to the shared candles websocket. Retrying in 1 seconds...",
+                )
+                await self._sleep(1.0)
+            finally:
+                await self._on_order_stream_interruption()
+
+    def _process_websocket_message(self, data):
+        stream_key = self._candles_class.get_stream_key_from_message(data)
+        for feed in self._feeds.get(stream_key, []):
+            feed._process_websocket_message(data)
+
+    async def _fill_candles_gaps(self):
+        feeds = [feed for feeds in self._feeds.values() for feed in feeds if feed._interruption_timestamp is not None]
+        await safe_gather(*[feed.fill_candles_gap() for feed in feeds])
+
+    def _schedule_subscriptions(self):
+        if self._ws is not None and (self._subscriptions_task is None or self._subscriptions_task.done()):
+            self._subscriptions_task = safe_ensure_future(self._send_pending_subscriptions_later())
+
+    async def _send_pending_subscriptions_later(self):
+        await self._sleep(self._subscriptions_delay)
+        await self._send_pending_subscriptions()
+
+    async def _send_pending_subscriptions(self):
+        for stream_keys, subscribe in ((self._pending_unsubscriptions, False), (self._pending_subscriptions, True)):
+            if len(stream_keys) > 0 and self._ws is not None:
+                self._request_id += 1
+                sent_stream_keys = sorted(stream_keys)
+                payload = self._candles_class.build_subscription_payload(sent_stream_keys, subscribe=subscribe,
+                                                                         request_id=self._request_id)
+                await self._ws.send(WSJSONRequest(payload=payload))
+                # The keys stay pending until the message is sent, so they are sent again if it fails. Only the keys
+                # sent are removed, the ones requested while sending are sent in the next message
+                stream_keys.difference_update(sent_stream_keys)
+                if subscribe:
+                    self.logger().info(f"Subscribed to {len(payload['params'])} public klines streams...")
+
+    async def _on_order_stream_interruption(self):
+        ws, self._ws = self._ws, None
+        ws and await ws.disconnect()
+        for feeds in self._feeds.values():
+            for feed in feeds:
+                await feed._on_order_stream_interruption()
+
+    async def _sleep(self, delay: float):
+        await asyncio.sleep(delay)
+
+
+class CandlesConnectionHub:
+    """
+    Multiplexes the streams of the candles feeds of an exchange over a few websockets, instead of opening one websocket
+    per feed. A new websocket is only opened when the ones in use reached the maximum number of streams allowed by the
+    exchange. There is one hub per candles feed class, available through `get_hub`.
+    """
+    _hubs: Dict[Type[CandlesBase], "CandlesConnectionHub"] = {}
+
+    @classmethod
+    def get_hub(cls, candles_class: Type[CandlesBase]) -> "CandlesConnectionHub":
+        if candles_class not in cls._hubs:
+            cls._hubs[candles_class] = CandlesConnectionHub(candles_class)
+        return cls._hubs[candles_class]
+
+    def __init__(self, candles_class: Type[CandlesBase]):
+        self._candles_class = candles_class
+        self._connections: List[CandlesHubConnection] = []
+        self._feed_connections: Dict[CandlesBase, CandlesHubConnection] = {}
+
+    @property
+    def connections(self) -> List[CandlesHubConnection]:
+        return self._connections
+
+    def add_feed(self, feed: CandlesBase):
+        if feed in self._feed_connections:
+            return
+        connection = self._get_connection_for_stream(feed)
+        connection.add_feed(feed)
+        self._feed_connections[feed] = connection
+
+    def remove_feed(self, feed: CandlesBase):
+        connection = self._feed_connections.pop(feed, None)
+        if connection is not None:
+            connection.remove_feed(feed)
+            if connection.number_of_streams == 0:
+                self._connections.remove(connection)
+
+    def _get_connection_for_stream(self, feed: CandlesBase) -> CandlesHubConnection:
+        for connection in self._connections:
+            if connection.has_stream(feed.stream_key):
+                return connection
+        for connection in self._connections:
+            if connection.number_of_streams < self._candles_class.max_streams_per_connection:
+                return connection
+        connection = CandlesHubConnection(self._candles_class, api_factory=feed._api_factory, wss_url=feed.wss_url)
+        self._connections.append(connection)
+        return connection
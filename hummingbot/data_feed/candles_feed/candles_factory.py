@@ -4,6 +4,7 @@ from hummingbot.data_feed.candles_feed.ascend_ex_spot_candles.ascend_ex_spot_can
 from hummingbot.data_feed.candles_feed.binance_perpetual_candles import BinancePerpetualCandles
 from hummingbot.data_feed.candles_feed.binance_spot_candles import BinanceSpotCandles
 from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.candles_connection_hub import CandlesConnectionHub
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
 from hummingbot.data_feed.candles_feed.gate_io_perpetual_candles import GateioPerpetualCandles
 from hummingbot.data_feed.candles_feed.gate_io_spot_candles import GateioSpotCandles
@@ -25,7 +26,8 @@ class UnsupportedConnectorException(Exception):
 class CandlesFactory:
     """
     The CandlesFactory class creates and returns a Candle object based on the specified configuration.
-    It uses a mapping of connector names to their respective candle classes.
+    It uses a mapping of connector names to their respective candle classes. The candles of the exchanges that support
+    many streams per websocket share their websockets through a CandlesConnectionHub.
     """
     _candles_map: Dict[str, Type[CandlesBase]] = {
         "binance_perpetual": BinancePerpetualCandles,
@@ -50,10 +52,14 @@ class CandlesFactory:
         """
         connector_class = cls._candles_map.get(candles_config.connector)
         if connector_class:
-            return connector_class(
+            candles = connector_class(
                 candles_config.trading_pair,
                 candles_config.interval,
                 candles_config.max_records
             )
+            if connector_class.max_streams_per_connection is not None:
+                # The feed only keeps its candles, the websocket is shared with the other feeds of the exchange
+                candles.connection_hub = CandlesConnectionHub.get_hub(connector_class)
+            return candles
         else:
             raise UnsupportedConnectorException(candles_config.connector)
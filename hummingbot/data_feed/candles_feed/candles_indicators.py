@@ -0,0 +1,498 @@
+import math
+import sys
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.utils.lazy_import import lazy_import
+from hummingbot.data_feed.candles_feed.candles_ring_buffer import CandlesRingBuffer
+
+# scipy is only needed when the indicators are computed
+signal = lazy_import("scipy.signal")
+
+
+class RollingWindow:
+    """
+    Rolling mean and standard deviation of the last `length` values, as pandas rolling with min_periods=length.
+    The sums are kept relative to a reference value and recomputed from the window every `length` values, so the
+    rounding errors of adding and removing values don't accumulate.
+    """
+
+    def __init__(self, length: int, ddof: int = 0):
+        self.length = length
+        self.ddof = ddof
+        self.reset()
+
+    def reset(self):
+        self._window = deque(maxlen=self.length - 1)
+        self._reference = 0.0
+        self._sum = 0.0
+        self._sum_of_squares = 0.0
+        self._commits_since_recompute = 0
+
+    def evaluate(self, value: float) -> Tuple[float, float]:
+        if len(self._window) < self.length - 1:
+            return math.nan, math.nan
+        total = self._sum + value - self._reference
+        mean = total / self.length
+        sum_of_squares = self._sum_of_squares + (value - self._reference) ** 2
+        variance = (sum_of_squares - total * mean) / (self.length - self.ddof)
+        return self._reference + mean, math.sqrt(max(variance, 0.0))
+
+    def commit(self, value: float):
+        if self.length == 1:
+            return
+        if len(self._window) == self._window.maxlen:
+            oldest = self._window[0] - self._reference
+            self._sum -= oldest
+            self._sum_of_squares -= oldest ** 2
+        self._window.append(value)
+        self._sum += value - self._reference
+        self._sum_of_squares += (value - self._reference) ** 2
+        self._commits_since_recompute += 1
+        if self._commits_since_recompute >= self.length:
+            self._recompute_sums()
+
+    def extend(self, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        window = np.fromiter(self._window, dtype=float, count=len(self._window))
+        rolling = pd.Series(np.concatenate([window, values])).rolling(self.length, min_periods=self.length)
+        mean = rolling.mean().values[len(window):]
+        std = rolling.std(ddof=self.ddof).values[len(window):]
+        if self.length > 1:
+            self._window.extend(values[-(self.length - 1):])
+        self._recompute_sums()
+        return mean, std
+
+    def _recompute_sums(self):
+        window = np.fromiter(self._window, dtype=float, count=len(self._window))
+        self._reference = float(window.mean()) if len(window) > 0 else 0.0
+        deviations = window - self._reference
+        self._sum = float(deviations.sum())
+        self._sum_of_squares = float((deviations ** 2).sum())
+        self._commits_since_recompute = 0
+
+
+class ExponentialMovingAverage:
+    """
+    Exponential moving average as pandas_ta's ema: the first value is the mean of the first `length` values (NaNs
+    are skipped) and then it follows the recursion with alpha = 2 / (length + 1).
+    """
+
+    def __init__(self, length: int):
+        self.length = length
+        self.alpha = 2 / (length + 1)
+        self.reset()
+
+    def reset(self):
+        self.value = math.nan
+        self._count = 0
+        self._seed_sum = 0.0
+        self._seed_count = 0
+
+    def evaluate(self, value: float) -> float:
+        if self._count + 1 < self.length:
+            return math.nan
+        if self._count + 1 == self.length:
+            seed_sum, seed_count = self._seed_sum, self._seed_count
+            if not math.isnan(value):
+                seed_sum, seed_count = seed_sum + value, seed_count + 1
+            return seed_sum / seed_count if seed_count > 0 else math.nan
+        return (1 - self.alpha) * self.value + self.alpha * value
+
+    def commit(self, value: float):
+        self.value = self.evaluate(value)
+        if self._count < self.length and not math.isnan(value):
+            self._seed_sum += value
+            self._seed_count += 1
+        self._count += 1
+
+    def extend(self, values: np.ndarray) -> np.ndarray:
+        result = np.full(len(values), math.nan)
+        seeded = min(max(self.length - self._count, 0), len(values))
+        for i in range(seeded):
+            self.commit(values[i])
+            result[i] = self.value
+        if seeded < len(values):
+            decay = 1 - self.alpha
+            result[seeded:], _ = signal.lfilter([self.alpha], [1, -decay], values[seeded:], zi=[decay * self.value])
+            self.value = float(result[-1])
+            self._count += len(values) - seeded
+        return result
+
+
+class WildersMovingAverage:
+    """
+    Wilder's moving average as pandas_ta's rma, that is the pandas ewm with alpha = 1 / length, adjust=True and
+    min_periods=length. The weighted sum and the sum of the weights are kept so every value is a constant update.
+    """
+
+    def __init__(self, length: int):
+        self.length = length
+        self.decay = 1 - 1 / length
+        self.reset()
+
+    def reset(self):
+        self._weighted_sum = 0.0
+        self._weights = 0.0
+        self._count = 0
+
+    def _next(self, value: float) -> Tuple[float, float, int]:
+        if math.isnan(value):
+            return self.decay * self._weighted_sum, self.decay * self._weights, self._count
+        return value + self.decay * self._weighted_sum, 1 + self.decay * self._weights, self._count + 1
+
+    def evaluate(self, value: float) -> float:
+        weighted_sum, weights, count = self._next(value)
+        return weighted_sum / weights if count >= self.length else math.nan
+
+    def commit(self, value: float):
+        self._weighted_sum, self._weights, self._count = self._next(value)
+
+    def extend(self, values: np.ndarray) -> np.ndarray:
+        is_valid = ~np.isnan(values)
+        weighted_sums, _ = signal.lfilter([1], [1, -self.decay], np.where(is_valid, values, 0.0),
+                                          zi=[self.decay * self._weighted_sum])
+        weights, _ = signal.lfilter([1], [1, -self.decay], is_valid.astype(float), zi=[self.decay * self._weights])
+        counts = self._count + np.cumsum(is_valid)
+        result = np.full(len(values), math.nan)
+        np.divide(weighted_sums, weights, out=result, where=counts >= self.length)
+        if len(values) > 0:
+            self._weighted_sum, self._weights, self._count = float(weighted_sums[-1]), float(weights[-1]), int(counts[-1])
+        return result
+
+
+class TrueRange:
+    """
+    True range as pandas_ta's true_range, the first value is NaN because there is no previous close.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self._previous_close = math.nan
+
+    def evaluate(self, high: float, low: float) -> float:
+        if math.isnan(self._previous_close):
+            return math.nan
+        return max(high - low, abs(high - self._previous_close), abs(self._previous_close - low))
+
+    def commit(self, close: float):
+        self._previous_close = close
+
+    def extend(self, high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+        previous_close = np.concatenate([[self._previous_close], close[:-1]])
+        self._previous_close = float(close[-1])
+        return np.maximum.reduce([high - low, np.abs(high - previous_close), np.abs(previous_close - low)])
+
+
+def non_zero(values: np.ndarray) -> np.ndarray:
+    return np.where(values == 0, sys.float_info.epsilon, values)
+
+
+class StreamingIndicator(ABC):
+    """
+    Indicator computed candle by candle with a constant amount of work per candle:
+    - `evaluate` returns the values for a candle that may still be open, without changing the state.
+    - `commit` adds a closed candle to the state.
+    - `extend` adds many closed candles at once with vectorized operations and returns their values.
+    The values and the column names follow pandas_ta, so they can replace the `df.ta` calls of the controllers.
+    """
+
+    @property
+    @abstractmethod
+    def columns(self) -> List[str]:
+        ...
+
+    @abstractmethod
+    def reset(self):
+        ...
+
+    @abstractmethod
+    def evaluate(self, high: float, low: float, close: float) -> np.ndarray:
+        ...
+
+    @abstractmethod
+    def commit(self, high: float, low: float, close: float):
+        ...
+
+    @abstractmethod
+    def extend(self, high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+        """
+        Returns an array with one row per candle and one column per indicator column.
+        """
+        ...
+
+
+class BollingerBands(StreamingIndicator):
+    def __init__(self, length: int = 5, std: float = 2.0, ddof: int = 0):
+        self.length = int(length)
+        self.std = float(std)
+        self._window = RollingWindow(self.length, ddof)
+
+    @property
+    def columns(self) -> List[str]:
+        return [f"{name}_{self.length}_{self.std}" for name in ("BBL", "BBM", "BBU", "BBB", "BBP")]
+
+    def reset(self):
+        self._window.reset()
+
+    def evaluate(self, high: float, low: float, close: float) -> np.ndarray:
+        mean, std = self._window.evaluate(close)
+        return self._bands(np.array([close]), np.array([mean]), np.array([std]))[0]
+
+    def commit(self, high: float, low: float, close: float):
+        self._window.commit(close)
+
+    def extend(self, high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+        return self._bands(close, *self._window.extend(close))
+
+    def _bands(self, close: np.ndarray, mean: np.ndarray, std: np.ndarray) -> np.ndarray:
+        deviations = self.std * std
+        lower = mean - deviations
+        upper = mean + deviations
+        width = non_zero(upper - lower)
+        return np.column_stack([lower, mean, upper, 100 * width / mean, non_zero(close - lower) / width])
+
+
+class MACD(StreamingIndicator):
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        self.fast, self.slow = (int(fast), int(slow)) if fast <= slow else (int(slow), int(fast))
+        self.signal = int(signal)
+        self._fast_ema = ExponentialMovingAverage(self.fast)
+        self._slow_ema = ExponentialMovingAverage(self.slow)
+        self._signal_ema = ExponentialMovingAverage(self.signal)
+
+    @property
+    def columns(self) -> List[str]:
+        return [f"{name}_{self.fast}_{self.slow}_{self.signal}" for name in ("MACD", "MACDh", "MACDs")]
+
+    def reset(self):
+        self._fast_ema.reset()
+        self._slow_ema.reset()
+        self._signal_ema.reset()
+
+    def evaluate(self, high: float, low: float, close: float) -> np.ndarray:
+        macd = self._fast_ema.evaluate(close) - self._slow_ema.evaluate(close)
+        signal = self._signal_ema.evaluate(macd) if not math.isnan(macd) else math.nan
+        return np.array([macd, macd - signal, signal])
+
+    def commit(self, high: float, low: float, close: float):
+        macd = self._fast_ema.evaluate(close) - self._slow_ema.evaluate(close)
+        self._fast_ema.commit(close)
+        self._slow_ema.commit(close)
+        # The signal line starts with the first valid MACD value
+        if not math.isnan(macd):
+            self._signal_ema.commit(macd)
+
+    def extend(self, high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+        macd = self._fast_ema.extend(close) - self._slow_ema.extend(close)
+        is_valid = ~np.isnan(macd)
+        signal = np.full(len(macd), math.nan)
+        signal[is_valid] = self._signal_ema.extend(macd[is_valid])
+        return np.column_stack([macd, macd - signal, signal])
+
+
+class NATR(StreamingIndicator):
+    """
+    Normalized average true range, with the exponential moving average of the true range as pandas_ta's natr does
+    by default.
+    """
+
+    def __init__(self, length: int = 14, scalar: float = 100):
+        self.length = int(length)
+        self.scalar = scalar
+        self._true_range = TrueRange()
+        self._ema = ExponentialMovingAverage(self.length)
+
+    @property
+    def columns(self) -> List[str]:
+        return [f"NATR_{self.length}"]
+
+    def reset(self):
+        self._true_range.reset()
+        self._ema.reset()
+
+    def evaluate(self, high: float, low: float, close: float) -> np.ndarray:
+        return np.array([self.scalar / close * self._ema.evaluate(self._true_range.evaluate(high, low))])
+
+    def commit(self, high: float, low: float, close: float):
+        self._ema.commit(self._true_range.evaluate(high, low))
+        self._true_range.commit(close)
+
+    def extend(self, high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+        atr = self._ema.extend(self._true_range.extend(high, low, close))
+        return (self.scalar / close * atr).reshape(-1, 1)
+
+
+class Supertrend(StreamingIndicator):
+    """
+    Supertrend as pandas_ta's supertrend, with the Wilder's average true range. The trend is NaN for the first candle
+    instead of 0.
+    """
+
+    def __init__(self, length: int = 7, multiplier: float = 3.0):
+        self.length = int(length)
+        self.multiplier = float(multiplier)
+        self._true_range = TrueRange()
+        self._atr = WildersMovingAverage(self.length)
+        self.reset()
+
+    @property
+    def columns(self) -> List[str]:
+        return [f"{name}_{self.length}_{self.multiplier}" for name in ("SUPERT", "SUPERTd", "SUPERTl", "SUPERTs")]
+
+    def reset(self):
+        self._true_range.reset()
+        self._atr.reset()
+        self._is_first = True
+        self._direction = 1
+        self._upper_band = math.nan
+        self._lower_band = math.nan
+
+    def _next(self, high: float, low: float, close: float, atr: float) -> Tuple[int, float, float]:
+        hl2 = 0.5 * (high + low)
+        upper_band = hl2 + self.multiplier * atr
+        lower_band = hl2 - self.multiplier * atr
+        if self._is_first:
+            return 1, upper_band, lower_band
+        if close > self._upper_band:
+            direction = 1
+        elif close < self._lower_band:
+            direction = -1
+        else:
+            direction = self._direction
+            if direction > 0 and lower_band < self._lower_band:
+                lower_band = self._lower_band
+            if direction < 0 and upper_band > self._upper_band:
+                upper_band = self._upper_band
+        return direction, upper_band, lower_band
+
+    def _values(self, direction: int, upper_band: float, lower_band: float) -> List[float]:
+        if self._is_first:
+            return [math.nan, direction, math.nan, math.nan]
+        if direction > 0:
+            return [lower_band, direction, lower_band, math.nan]
+        return [upper_band, direction, math.nan, upper_band]
+
+    def evaluate(self, high: float, low: float, close: float) -> np.ndarray:
+        atr = self._atr.evaluate(self._true_range.evaluate(high, low))
+        return np.array(self._values(*self._next(high, low, close, atr)))
+
+    def commit(self, high: float, low: float, close: float):
+        true_range = self._true_range.evaluate(high, low)
+        self._commit(high, low, close, self._atr.evaluate(true_range))
+        self._atr.commit(true_range)
+        self._true_range.commit(close)
+
+    def _commit(self, high: float, low: float, close: float, atr: float) -> List[float]:
+        direction, upper_band, lower_band = self._next(high, low, close, atr)
+        values = self._values(direction, upper_band, lower_band)
+        self._direction, self._upper_band, self._lower_band = direction, upper_band, lower_band
+        self._is_first = False
+        return values
+
+    def extend(self, high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+        atr = self._atr.extend(self._true_range.extend(high, low, close))
+        # The bands depend on the previous ones, so this part can't be vectorized
+        candles = zip(high.tolist(), low.tolist(), close.tolist(), atr.tolist())
+        return np.array([self._commit(*candle) for candle in candles]).reshape(-1, 4)
+
+
+class CandlesIndicators:
+    """
+    Keeps the values of a list of streaming indicators for the candles of a feed.
+
+    The values are the ones of pandas_ta over the candles received, so the moving averages are seeded from the first
+    candle of the window. While the window keeps its first candle, every call to `update` only processes the candles
+    that are new since the previous call. The last candle is evaluated without being added to the state because it
+    may still be open, and it's committed when a newer candle arrives. When the first candle of the window changes
+    (the window slides or the history was refilled), the whole window is recomputed with the vectorized `extend`,
+    which is also the path used by the backtesting, where the controllers receive all the candles at once.
+    """
+
+    def __init__(self, indicators: List[StreamingIndicator]):
+        self.indicators = indicators
+        self.columns = [column for indicator in indicators for column in indicator.columns]
+        self._values: Optional[CandlesRingBuffer] = None
+        self._first_timestamp: Optional[float] = None
+        self._last_timestamp: Optional[float] = None
+
+    @property
+    def values(self) -> Dict[str, float]:
+        """
+        Values of the indicators for the last candle received.
+        """
+        if self._values is None or len(self._values) == 0:
+            return {column: math.nan for column in self.columns}
+        return dict(zip(self.columns, self._values[-1].tolist()))
+
+    def reset(self):
+        for indicator in self.indicators:
+            indicator.reset()
+        self._values = None
+        self._first_timestamp = None
+        self._last_timestamp = None
+
+    def update(self, candles: pd.DataFrame) -> pd.DataFrame:
+        """
+        Processes the new candles and returns a copy of the candles with one column per indicator value.
+        """
+        if len(candles) == 0:
+            return self._features(candles)
+        timestamps = candles["timestamp"].values
+        high, low, close = (candles[column].values.astype(float) for column in ("high", "low", "close"))
+        pending_index = self._get_pending_index(timestamps)
+        if pending_index is None:
+            self._recompute(high, low, close)
+        else:
+            self._process_from(pending_index, high, low, close)
+        self._first_timestamp = timestamps[0]
+        self._last_timestamp = timestamps[-1]
+        return self._features(candles)
+
+    def _get_pending_index(self, timestamps: np.ndarray) -> Optional[int]:
+        # The moving averages are seeded from the first candle, so the state can't be continued in another window
+        if self._last_timestamp is None or timestamps[0] != self._first_timestamp:
+            return None
+        index = int(np.searchsorted(timestamps, self._last_timestamp))
+        if index == len(timestamps) or timestamps[index] != self._last_timestamp:
+            return None
+        return index
+
+    def _recompute(self, high: np.ndarray, low: np.ndarray, close: np.ndarray):
+        self.reset()
+        self._values = CandlesRingBuffer(maxlen=len(close), number_of_columns=len(self.columns))
+        if len(close) > 1:
+            self._values.extend(self._extend(high[:-1], low[:-1], close[:-1]))
+        self._values.append(self._evaluate(high[-1], low[-1], close[-1]))
+
+    def _process_from(self, pending_index: int, high: np.ndarray, low: np.ndarray, close: np.ndarray):
+        if len(close) > self._values.maxlen:
+            values = CandlesRingBuffer(maxlen=len(close), number_of_columns=len(self.columns))
+            values.extend(self._values.values)
+            self._values = values
+        if pending_index < len(close) - 1:
+            # The pending candle is closed now, it's committed with its final values together with the new ones
+            closed = self._extend(high[pending_index:-1], low[pending_index:-1], close[pending_index:-1])
+            self._values.update_last(closed[0])
+            self._values.extend(closed[1:])
+            self._values.append(self._evaluate(high[-1], low[-1], close[-1]))
+        else:
+            self._values.update_last(self._evaluate(high[-1], low[-1], close[-1]))
+
+    def _evaluate(self, high: float, low: float, close: float) -> np.ndarray:
+        return np.concatenate([indicator.evaluate(high, low, close) for indicator in self.indicators])
+
+    def _extend(self, high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+        return np.hstack([indicator.extend(high, low, close) for indicator in self.indicators])
+
+    def _features(self, candles: pd.DataFrame) -> pd.DataFrame:
+        values = np.full((len(candles), len(self.columns)), math.nan)
+        number_of_values = min(len(candles), len(self._values) if self._values is not None else 0)
+        if number_of_values > 0:
+            values[-number_of_values:] = self._values.values[-number_of_values:]
+        return pd.concat([candles, pd.DataFrame(values, columns=self.columns, index=candles.index)], axis=1)
@@ -0,0 +1,118 @@
+from typing import Iterable, Iterator
+
+import numpy as np
+
+
+class CandlesRingBuffer:
+    """
+    Fixed size buffer of candles stored in a preallocated float64 array, one column per candle field.
+
+    It keeps the interface of the deque used before (append, pop, extendleft, indexing...), so the candles feeds work
+    unchanged, while the candles are always kept contiguous and ordered. The storage has room for twice the maximum
+    number of records: appending moves the window to the right and only when the end of the storage is reached the
+    candles are moved back to the beginning, so the cost of an append is constant on average and `values` is always a
+    view without copies.
+
+    Every change increases `version`, which is used by the candles feeds to know when their cached views are stale.
+    """
+
+    def __init__(self, maxlen: int, number_of_columns: int):
+        self._maxlen = maxlen
+        self._number_of_columns = number_of_columns
+        self._storage = np.zeros((2 * maxlen + 1, number_of_columns), dtype=np.float64)
+        self._start = 0
+        self._end = 0
+        self.version = 0
+
+    @property
+    def maxlen(self) -> int:
+        return self._maxlen
+
+    @property
+    def values(self) -> np.ndarray:
+        """
+        Read only view of the candles, ordered from the oldest to the newest. The view is only valid until the next
+        change of the buffer, use `copy` to keep the values.
+        """
+        view = self._storage[self._start:self._end]
+        view.flags.writeable = False
+        return view
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        length = len(self)
+        if index < -length or index >= length:
+            raise IndexError("CandlesRingBuffer index out of range")
+        return self._storage[self._start + (index % length)].copy()
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        return iter(self.values.copy())
+
+    def append(self, candle: Iterable[float]):
+        if self._end == len(self._storage):
+            self._move_to(0)
+        self._storage[self._end] = candle
+        self._end += 1
+        if len(self) > self._maxlen:
+            self._start += 1
+        self.version += 1
+
+    def extend(self, candles: Iterable[Iterable[float]]):
+        for candle in candles:
+            self.append(candle)
+
+    def appendleft(self, candle: Iterable[float]):
+        self.extendleft([candle])
+
+    def extendleft(self, candles: Iterable[Iterable[float]]):
+        """
+        Adds the candles to the left one by one, as the deque does, so they end up in reverse order. The newest
+        candles are dropped if the maximum length is exceeded.
+        """
+        candles = np.asarray(candles, dtype=np.float64).reshape(-1, self._number_of_columns)[::-1]
+        if len(candles) == 0:
+            return
+        candles = candles[:self._maxlen]
+        kept = min(len(self), self._maxlen - len(candles))
+        if self._start < len(candles):
+            self._move_to(len(self._storage) - len(self))
+        self._end = self._start + kept
+        self._start -= len(candles)
+        self._storage[self._start:self._start + len(candles)] = candles
+        self.version += 1
+
+    def pop(self) -> np.ndarray:
+        if len(self) == 0:
+            raise IndexError("pop from an empty CandlesRingBuffer")
+        self._end -= 1
+        self.version += 1
+        return self._storage[self._end].copy()
+
+    def popleft(self) -> np.ndarray:
+        if len(self) == 0:
+            raise IndexError("pop from an empty CandlesRingBuffer")
+        self._start += 1
+        self.version += 1
+        return self._storage[self._start - 1].copy()
+
+    def update_last(self, candle: Iterable[float]):
+        """
+        Replaces the last candle, used when the exchange sends an update of the candle that is still open.
+        """
+        if len(self) == 0:
+            raise IndexError("update_last on an empty CandlesRingBuffer")
+        self._storage[self._end - 1] = candle
+        self.version += 1
+
+    def clear(self):
+        self._start = 0
+        self._end = 0
+        self.version += 1
+
+    def _move_to(self, start: int):
+        length = len(self)
+        self._storage[start:start + length] = self._storage[self._start:self._end].copy()
+        self._start = start
+        self._end = start + length
@@ -22,3 +22,16 @@ class HistoricalCandlesConfig(BaseModel):
     interval: str
     start_time: int
     end_time: int
+
+
+class CandlesFeedMetrics(BaseModel):
+    """
+    Reconnection metrics of a candles feed, durations are in seconds.
+    """
+    interruptions: int = 0
+    gap_fills: int = 0
+    full_refills: int = 0
+    last_gap_duration: float = 0
+    last_gap_records: int = 0
+    last_refill_latency: float = 0
+    max_refill_latency: float = 0
@@ -0,0 +1,180 @@
+import json
+import logging
+import os
+import time
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from hummingbot import data_path
+from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.data_types import HistoricalCandlesConfig
+from hummingbot.logger import HummingbotLogger
+
+
+class IncompleteCandlesError(Exception):
+    """
+    Raised when some ranges of the requested window of historical candles could not be downloaded.
+    """
+
+
+class HistoricalCandlesStore:
+    """
+    On disk store of historical candles. Each connector, trading pair and interval has its own directory with one NumPy
+    file per month and a coverage file with the time ranges already downloaded, so only the missing ranges are
+    requested to the exchange and the cached windows are served without network access.
+    Timestamps are in the units of the candles feed, given by its `timestamp_units_per_second`.
+    """
+    _logger: Optional[HummingbotLogger] = None
+    coverage_file_name = "coverage.json"
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, root_path: Optional[str] = None):
+        self._root_path = root_path
+
+    @property
+    def root_path(self) -> str:
+        if self._root_path is None:
+            self._root_path = os.path.join(data_path(), "candles")
+        return self._root_path
+
+    def get_path(self, connector_name: str, trading_pair: str, interval: str) -> str:
+        return os.path.join(self.root_path, connector_name, trading_pair, interval)
+
+    @staticmethod
+    def get_interval_length(interval: str, timestamp_units_per_second: int = 1000) -> int:
+        return CandlesBase.interval_to_seconds[interval] * timestamp_units_per_second
+
+    @staticmethod
+    def get_timestamp_months(timestamps: np.ndarray, timestamp_units_per_second: int = 1000) -> np.ndarray:
+        milliseconds = np.asarray(timestamps, dtype=float) * (1000 / timestamp_units_per_second)
+        return milliseconds.astype("datetime64[ms]").astype("datetime64[M]")
+
+    @classmethod
+    def get_months(cls, start_time: int, end_time: int, timestamp_units_per_second: int = 1000) -> List[str]:
+        start_month, end_month = cls.get_timestamp_months([start_time, end_time], timestamp_units_per_second)
+        return [str(month) for month in np.arange(start_month, end_month + 1)]
+
+    def get_covered_ranges(self, connector_name: str, trading_pair: str, interval: str) -> List[Tuple[int, int]]:
+        coverage_path = os.path.join(self.get_path(connector_name, trading_pair, interval), self.coverage_file_name)
+        if not os.path.exists(coverage_path):
+            return []
+        with open(coverage_path, "r") as file:
+            return [tuple(covered_range) for covered_range in json.load(file)]
+
+    def get_missing_ranges(self, connector_name: str, trading_pair: str, interval: str,
+                           start_time: int, end_time: int) -> List[Tuple[int, int]]:
+        """
+        Returns the ranges of the requested window that were never downloaded.
+        """
+        missing_ranges = []
+        cursor = start_time
+        for covered_start, covered_end in self.get_covered_ranges(connector_name, trading_pair, interval):
+            if covered_end < cursor:
+                continue
+            if covered_start > end_time:
+                break
+            if covered_start > cursor:
+                missing_ranges.append((cursor, covered_start))
+            cursor = max(cursor, covered_end)
+        if cursor < end_time:
+            missing_ranges.append((cursor, end_time))
+        return missing_ranges
+
+    def store(self, connector_name: str, trading_pair: str, interval: str, candles: np.ndarray,
+              start_time: int, end_time: int, timestamp_units_per_second: int = 1000):
+        """
+        Merges the candles downloaded for the range into the monthly files and marks the range as covered. The candles
+        that are not closed yet are not stored, so they are downloaded again in the next request.
+        """
+        path = self.get_path(connector_name, trading_pair, interval)
+        os.makedirs(path, exist_ok=True)
+        last_closed_timestamp = (int(time.time() * timestamp_units_per_second) -
+                                 self.get_interval_length(interval, timestamp_units_per_second))
+        if len(candles) > 0:
+            candles = candles[candles[:, 0] <= last_closed_timestamp]
+        if len(candles) > 0:
+            months = self.get_timestamp_months(candles[:, 0], timestamp_units_per_second)
+            for month in np.unique(months):
+                month_candles = candles[months == month]
+                month_path = os.path.join(path, f"{month}.npy")
+                if os.path.exists(month_path):
+                    month_candles = np.concatenate([np.load(month_path), month_candles])
+                _, unique_index = np.unique(month_candles[:, 0], return_index=True)
+                temporary_path = os.path.join(path, f"{month}.tmp.npy")
+                np.save(temporary_path, month_candles[unique_index])
+                os.replace(temporary_path, month_path)
+
+        covered_end = min(end_time, last_closed_timestamp)
+        if covered_end >= start_time:
+            covered_ranges = sorted(self.get_covered_ranges(connector_name, trading_pair, interval) +
+                                    [(start_time, covered_end)])
+            merged_ranges = [list(covered_ranges[0])]
+            for range_start, range_end in covered_ranges[1:]:
+                if range_start <= merged_ranges[-1][1]:
+                    merged_ranges[-1][1] = max(merged_ranges[-1][1], range_end)
+                else:
+                    merged_ranges.append([range_start, range_end])
+            coverage_path = os.path.join(path, self.coverage_file_name)
+            with open(f"{coverage_path}.tmp", "w") as file:
+                json.dump(merged_ranges, file)
+            os.replace(f"{coverage_path}.tmp", coverage_path)
+
+    def load(self, connector_name: str, trading_pair: str, interval: str, start_time: int, end_time: int,
+             timestamp_units_per_second: int = 1000) -> np.ndarray:
+        """
+        Reads the stored candles of the window from the memory mapped monthly files.
+        """
+        path = self.get_path(connector_name, trading_pair, interval)
+        windows = []
+        for month in self.get_months(start_time, end_time, timestamp_units_per_second):
+            month_path = os.path.join(path, f"{month}.npy")
+            if not os.path.exists(month_path):
+                continue
+            month_candles = np.load(month_path, mmap_mode="r")
+            first_index = np.searchsorted(month_candles[:, 0], start_time, side="left")
+            last_index = np.searchsorted(month_candles[:, 0], end_time, side="right")
+            windows.append(month_candles[first_index:last_index])
+        if not windows:
+            return np.empty((0, len(CandlesBase.columns)))
+        return np.concatenate(windows)
+
+    async def get_historical_candles(self, candles_feed: CandlesBase, config: HistoricalCandlesConfig) -> pd.DataFrame:
+        """
+        Returns the candles of the window, downloading concurrently only the ranges that are not stored yet. The
+        requests share the throttler of the candles feed, so the rate limits of the exchange are respected.
+        Raises IncompleteCandlesError when a range can't be downloaded, after storing the ranges that were, so the
+        backtests never run over a window with gaps.
+        """
+        key = (config.connector_name, config.trading_pair, config.interval)
+        units = candles_feed.timestamp_units_per_second
+        missing_ranges = self.get_missing_ranges(*key, config.start_time, config.end_time)
+        if len(missing_ranges) > 0:
+            results = await safe_gather(*[
+                candles_feed.get_historical_candles(config=HistoricalCandlesConfig(
+                    connector_name=config.connector_name,
+                    trading_pair=config.trading_pair,
+                    interval=config.interval,
+                    start_time=start_time,
+                    end_time=end_time,
+                ))
+                for start_time, end_time in missing_ranges
+            ], return_exceptions=True)
+            failed_ranges = []
+            for (start_time, end_time), candles_df in zip(missing_ranges, results):
+                if isinstance(candles_df, pd.DataFrame):
+                    self.store(*key, candles_df.to_numpy(dtype=float), start_time, end_time, units)
+                else:
+                    self.logger().error(f"Error fetching candles for {key} between {start_time} and {end_time}.")
+                    failed_ranges.append((start_time, end_time))
+            if len(failed_ranges) > 0:
+                raise IncompleteCandlesError(f"The candles of {key} could not be downloaded for the ranges "
+                                             f"{failed_ranges}.")
+        return pd.DataFrame(self.load(*key, config.start_time, config.end_time, units), columns=candles_feed.columns)
@@ -16,6 +16,7 @@ from hummingbot.logger import HummingbotLogger
 
 class KrakenSpotCandles(CandlesBase):
     _logger: Optional[HummingbotLogger] = None
+    timestamp_units_per_second = 1
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -56,9 +57,8 @@ class KrakenSpotCandles(CandlesBase):
     def intervals(self):
         return CONSTANTS.INTERVALS
 
-    @property
-    def candles_df(self) -> pd.DataFrame:
-        df = pd.DataFrame(self._candles, columns=self.columns, dtype=float)
+    def _build_candles_df(self, candles: Optional[np.ndarray] = None) -> pd.DataFrame:
+        df = super()._build_candles_df(candles)
         df["timestamp"] = df["timestamp"] * 1000
         return df.sort_values(by="timestamp", ascending=True)
 
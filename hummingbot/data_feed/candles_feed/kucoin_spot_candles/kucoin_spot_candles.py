@@ -61,9 +61,8 @@ class KucoinSpotCandles(CandlesBase):
     def intervals(self):
         return CONSTANTS.INTERVALS
 
-    @property
-    def candles_df(self) -> pd.DataFrame:
-        df = pd.DataFrame(self._candles, columns=self.columns, dtype=float)
+    def _build_candles_df(self, candles: Optional[np.ndarray] = None) -> pd.DataFrame:
+        df = super()._build_candles_df(candles)
         return df.sort_values(by="timestamp", ascending=True)
 
     async def check_network(self) -> NetworkStatus:
@@ -95,6 +94,11 @@ class KucoinSpotCandles(CandlesBase):
         candles[:, 0] = candles[:, 0] * 1000
         return candles[::-1]
 
+    async def fetch_latest_candles(self, limit: int) -> np.ndarray:
+        end_time = int(self._time() * 1000)
+        start_time = end_time - limit * self.get_seconds_from_interval(self.interval) * 1000
+        return await self.fetch_candles(start_time=start_time, end_time=end_time, limit=limit)
+
     async def fill_historical_candles(self):
         max_request_needed = (self._candles.maxlen // 1500) + 1
         requests_executed = 0
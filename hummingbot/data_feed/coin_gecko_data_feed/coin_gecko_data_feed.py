@@ -100,6 +100,21 @@ class CoinGeckoDataFeed(DataFeedBase):
         )
         return resp
 
+    async def get_prices_by_symbols(self, vs_currency: str, symbols: List[str]) -> List[Dict[str, Any]]:
+        """Fetches the prices of the tokens with the given symbols, ordered by market cap"""
+        rest_assistant = await self._api_factory.get_rest_assistant()
+        price_url: str = f"{CONSTANTS.BASE_URL}{CONSTANTS.PRICES_REST_ENDPOINT}"
+        params = {
+            "vs_currency": vs_currency,
+            "symbols": ",".join(map(str.lower, symbols)),
+            "order": "market_cap_desc",
+            "sparkline": "false",
+        }
+        resp = await rest_assistant.execute_request(
+            url=price_url, throttler_limit_id=CONSTANTS.REST_CALL_RATE_LIMIT_ID, params=params
+        )
+        return resp
+
     async def _fetch_data_loop(self):
         while True:
             try:
@@ -1,24 +1,39 @@
 import time
-from typing import Dict, List, Tuple
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
 
 import pandas as pd
 
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.core.data_type.common import PriceType
 from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
+from hummingbot.data_feed.candles_feed.aggregated_candles import AggregatedCandles
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesFactory
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
 
+if TYPE_CHECKING:
+    from hummingbot.strategy.market_snapshot import MarketSnapshot
+
 
 class MarketDataProvider:
-    def __init__(self, connectors: Dict[str, ConnectorBase]):
+    # Maximum records of a feed to aggregate coarser candles from, the coarser intervals that need more are native
+    max_base_feed_records = 5000
+
+    def __init__(self,
+                 connectors: Dict[str, ConnectorBase],
+                 market_snapshot_source: Optional[Callable[[], Optional["MarketSnapshot"]]] = None):
         self.candles_feeds = {}  # Stores instances of candle feeds
+        self._candles_configs: Dict[str, CandlesConfig] = {}  # Candles requested by key, with the most records
         self.connectors = connectors  # Stores instances of connectors
+        # Returns the markets snapshot of the tick the strategy is processing, or None outside of the tick. The prices
+        # are read from it when there is one, so the code of the tick gets the same prices and the loops get the live ones
+        self._market_snapshot_source = market_snapshot_source
 
     def stop(self):
         for candle_feed in self.candles_feeds.values():
             candle_feed.stop()
         self.candles_feeds.clear()
+        self._candles_configs.clear()
 
     @property
     def ready(self) -> bool:
@@ -48,23 +63,80 @@ class MarketDataProvider:
     def get_candles_feed(self, config: CandlesConfig):
         """
         Retrieves or creates and starts a candle feed based on the given configuration.
-        If an existing feed has a higher or equal max_records, it is reused.
+        If an existing feed has a higher or equal max_records, it is reused. Otherwise the feeds of the trading pair are
+        resolved again from all the candles requested for it, see _update_candles_feeds.
         :param config: CandlesConfig
         :return: Candle feed instance.
         """
         key = self._generate_candle_feed_key(config)
+        requested_config = self._candles_configs.get(key)
+        if requested_config is None or requested_config.max_records < config.max_records:
+            self._candles_configs[key] = config
         existing_feed = self.candles_feeds.get(key)
 
         if existing_feed and existing_feed.max_records >= config.max_records:
             # Existing feed is sufficient, return it
             return existing_feed
-        else:
-            # Create a new feed or restart the existing one with updated max_records
-            candle_feed = CandlesFactory.get_candle(config)
-            self.candles_feeds[key] = candle_feed
-            if hasattr(candle_feed, 'start'):
-                candle_feed.start()
-            return candle_feed
+        self._update_candles_feeds(config.connector, config.trading_pair)
+        return self.candles_feeds[key]
+
+    def _update_candles_feeds(self, connector: str, trading_pair: str):
+        """
+        Starts the feeds serving the candles requested for the trading pair. From the finest interval, every interval
+        is aggregated from the finest native feed it can be derived from with at most max_base_feed_records candles,
+        and gets a native feed otherwise. The records of a native feed are the most needed by its own interval and the
+        intervals aggregated from it. The feeds only depend on the candles requested and not on the order of the
+        requests, the running feeds that keep enough records are reused.
+        :param connector: str
+        :param trading_pair: str
+        """
+        configs = sorted((config for config in self._candles_configs.values()
+                          if config.connector == connector and config.trading_pair == trading_pair),
+                         key=lambda config: CandlesBase.interval_to_seconds[config.interval])
+        base_intervals: Dict[str, str] = {}
+        native_records: Dict[str, int] = {}
+        for config in configs:
+            for base_interval, records in native_records.items():
+                base_records = config.max_records * self._get_ratio(base_interval, config.interval)
+                if (AggregatedCandles.can_aggregate(base_interval, config.interval)
+                        and base_records <= self.max_base_feed_records):
+                    base_intervals[config.interval] = base_interval
+                    native_records[base_interval] = max(records, base_records)
+                    break
+            else:
+                native_records[config.interval] = config.max_records
+
+        native_feeds = {}
+        for interval, records in native_records.items():
+            native_config = CandlesConfig(connector=connector, trading_pair=trading_pair, interval=interval,
+                                          max_records=records)
+            key = self._generate_candle_feed_key(native_config)
+            candle_feed = self.candles_feeds.get(key)
+            if candle_feed is None or isinstance(candle_feed, AggregatedCandles) or candle_feed.max_records < records:
+                # Create a new feed or restart the existing one with updated max_records
+                if candle_feed is not None:
+                    candle_feed.stop()
+                candle_feed = CandlesFactory.get_candle(native_config)
+                self.candles_feeds[key] = candle_feed
+                if hasattr(candle_feed, 'start'):
+                    candle_feed.start()
+            native_feeds[interval] = candle_feed
+
+        for config in configs:
+            if config.interval not in base_intervals:
+                continue
+            key = self._generate_candle_feed_key(config)
+            base_feed = native_feeds[base_intervals[config.interval]]
+            candle_feed = self.candles_feeds.get(key)
+            if (not isinstance(candle_feed, AggregatedCandles) or candle_feed.base_feed is not base_feed
+                    or candle_feed.max_records != config.max_records):
+                if candle_feed is not None:
+                    candle_feed.stop()
+                self.candles_feeds[key] = AggregatedCandles(base_feed, config.interval, config.max_records)
+
+    @staticmethod
+    def _get_ratio(base_interval: str, interval: str) -> int:
+        return CandlesBase.interval_to_seconds[interval] // CandlesBase.interval_to_seconds[base_interval]
 
     @staticmethod
     def _generate_candle_feed_key(config: CandlesConfig) -> str:
@@ -85,6 +157,12 @@ class MarketDataProvider:
         if candle_feed and hasattr(candle_feed, 'stop'):
             candle_feed.stop()
             del self.candles_feeds[key]
+            self._candles_configs.pop(key, None)
+            # The candles aggregated from the feed can't be updated anymore
+            for aggregated_key, aggregated_feed in list(self.candles_feeds.items()):
+                if isinstance(aggregated_feed, AggregatedCandles) and aggregated_feed.base_feed is candle_feed:
+                    del self.candles_feeds[aggregated_key]
+                    self._candles_configs.pop(aggregated_key, None)
 
     def get_connector(self, connector_name: str) -> ConnectorBase:
         """
@@ -116,6 +194,9 @@ class MarketDataProvider:
         :return: Price instance.
         """
         connector = self.get_connector(connector_name)
+        market_snapshot = self._market_snapshot_source() if self._market_snapshot_source is not None else None
+        if market_snapshot is not None:
+            return market_snapshot.get_price_by_type(connector_name, trading_pair, price_type)
         return connector.get_price_by_type(trading_pair, price_type)
 
     def get_candles_df(self, connector_name: str, trading_pair: str, interval: str, max_records: int = 500):
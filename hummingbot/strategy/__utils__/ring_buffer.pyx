@@ -1,11 +1,18 @@
 import numpy as np
 import logging
 cimport numpy as np
+from libc.math cimport sqrt
 
 
 pmm_logger = None
 
 cdef class RingBuffer:
+    """
+    Fixed length buffer of floats. When `track_moments` is set the mean, the variance and the sum of the squared
+    differences between consecutive values are updated on every addition (with Welford's algorithm), so reading them
+    doesn't iterate over the buffer. The running values are recomputed from the buffer every time it wraps around, so
+    the rounding errors don't accumulate.
+    """
     @classmethod
     def logger(cls):
         global pmm_logger
@@ -13,68 +20,132 @@ cdef class RingBuffer:
             pmm_logger = logging.getLogger(__name__)
         return pmm_logger
 
-    def __cinit__(self, int length):
+    def __cinit__(self, int length, bint track_moments=False):
         self._length = length
         self._buffer = np.zeros(length, dtype=np.float64)
         self._delimiter = 0
         self._is_full = False
+        self._track_moments = track_moments
+        self.c_reset_moments()
 
     def __dealloc__(self):
         self._buffer = None
 
-    cdef void c_add_value(self, float val):
+    cdef void c_add_value(self, double val):
+        if self._track_moments:
+            self.c_update_moments(val)
         self._buffer[self._delimiter] = val
         self.c_increment_delimiter()
+        if self._track_moments and self._delimiter == 0:
+            self.c_anchor_moments()
 
     cdef void c_increment_delimiter(self):
         self._delimiter = (self._delimiter + 1) % self._length
         if not self._is_full and self._delimiter == 0:
             self._is_full = True
 
+    cdef void c_update_moments(self, double val):
+        cdef:
+            double old_value
+            double old_mean = self._mean
+            double second_oldest
+            int64_t size = self.c_size()
+
+        if size > 0 and self._length > 1:
+            self._sum_squared_diffs += (val - self.c_get_last_value()) ** 2
+        if self._is_full:
+            # The oldest value is replaced, the size of the window doesn't change
+            old_value = self._buffer[self._delimiter]
+            if self._length > 1:
+                second_oldest = self._buffer[(self._delimiter + 1) % self._length]
+                self._sum_squared_diffs -= (second_oldest - old_value) ** 2
+            self._mean += (val - old_value) / size
+            self._m2 += (val - old_value) * (val - self._mean + old_value - old_mean)
+        else:
+            self._mean += (val - old_mean) / (size + 1)
+            self._m2 += (val - old_mean) * (val - self._mean)
+
+    cdef void c_anchor_moments(self):
+        values = np.asarray(self._buffer)
+        self._mean = np.mean(values)
+        self._m2 = np.sum(np.square(values - self._mean))
+        self._sum_squared_diffs = np.sum(np.square(np.diff(values)))
+
+    cdef void c_reset_moments(self):
+        self._mean = 0
+        self._m2 = 0
+        self._sum_squared_diffs = 0
+
     cdef bint c_is_empty(self):
         return (not self._is_full) and (0==self._delimiter)
 
+    cdef int64_t c_size(self):
+        return self._length if self._is_full else self._delimiter
+
     cdef double c_get_last_value(self):
         if self.c_is_empty():
             return np.nan
         return self._buffer[self._delimiter-1]
 
+    cdef double c_get_first_value(self):
+        if self.c_is_empty():
+            return np.nan
+        return self._buffer[self._delimiter if self._is_full else 0]
+
     cdef bint c_is_full(self):
         return self._is_full
 
     cdef double c_mean_value(self):
         result = np.nan
         if self._is_full:
-            result=np.mean(self.c_get_as_numpy_array())
+            result = self._mean if self._track_moments else np.mean(self.c_get_as_numpy_array())
         return result
 
     cdef double c_variance(self):
         result = np.nan
         if self._is_full:
-            result = np.var(self.c_get_as_numpy_array())
+            result = max(self._m2, 0) / self._length if self._track_moments else np.var(self.c_get_as_numpy_array())
         return result
 
     cdef double c_std_dev(self):
         result = np.nan
         if self._is_full:
-            result = np.std(self.c_get_as_numpy_array())
+            result = sqrt(self.c_variance()) if self._track_moments else np.std(self.c_get_as_numpy_array())
         return result
 
-    cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
-        cdef np.ndarray[np.int16_t, ndim=1] indexes
+    cdef double c_sum_squared_diffs(self):
+        if self._track_moments:
+            return max(self._sum_squared_diffs, 0)
+        return np.sum(np.square(np.diff(self.c_get_as_numpy_array())))
 
-        if not self._is_full:
-            indexes = np.arange(0, stop=self._delimiter, dtype=np.int16)
-        else:
-            indexes = np.arange(self._delimiter, stop=self._delimiter + self._length,
-                                dtype=np.int16) % self._length
-        return np.asarray(self._buffer)[indexes]
+    cdef double c_diff_variance(self):
+        cdef int64_t number_of_diffs = self.c_size() - 1
+        if number_of_diffs < 1:
+            return np.nan
+        # The sum of the differences is the difference between the last and the first values
+        mean_diff = (self.c_get_last_value() - self.c_get_first_value()) / number_of_diffs
+        return max(self.c_sum_squared_diffs() / number_of_diffs - mean_diff ** 2, 0)
 
-    def __init__(self, length):
+    cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
+        """
+        The values ordered from the oldest to the newest. When the buffer hasn't wrapped around it's a read only view of
+        the buffer, only valid until the next addition, otherwise a copy.
+        """
+        cdef np.ndarray[np.double_t, ndim=1] values
+        buffer = np.asarray(self._buffer)
+        if self._is_full and self._delimiter > 0:
+            return np.concatenate((buffer[self._delimiter:], buffer[:self._delimiter]))
+        values = buffer[:self.c_size()]
+        values.flags.writeable = False
+        return values
+
+    def __init__(self, length, track_moments=False):
         self._length = length
         self._buffer = np.zeros(length, dtype=np.double)
         self._delimiter = 0
         self._is_full = False
+        self._track_moments = track_moments
+        self.c_reset_moments()
 
     def add_value(self, val):
         self.c_add_value(val)
@@ -89,6 +160,10 @@ cdef class RingBuffer:
     def is_full(self):
         return self.c_is_full()
 
+    @property
+    def size(self) -> int:
+        return self.c_size()
+
     @property
     def mean_value(self):
         return self.c_mean_value()
@@ -101,6 +176,24 @@ cdef class RingBuffer:
     def variance(self):
         return self.c_variance()
 
+    @property
+    def sum_squared_diffs(self) -> float:
+        """
+        Sum of the squared differences between consecutive values.
+        """
+        return self.c_sum_squared_diffs()
+
+    @property
+    def diff_variance(self) -> float:
+        """
+        Variance of the differences between consecutive values, nan when there are less than two values.
+        """
+        return self.c_diff_variance()
+
+    @property
+    def track_moments(self) -> bool:
+        return self._track_moments
+
     @property
     def length(self) -> int:
         return self._length
@@ -113,6 +206,7 @@ cdef class RingBuffer:
         self._buffer = np.zeros(value, dtype=np.float64)
         self._delimiter = 0
         self._is_full = False
+        self.c_reset_moments()
 
         for val in data[-value:]:
             self.add_value(val)
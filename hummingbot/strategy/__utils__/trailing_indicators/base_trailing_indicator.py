@@ -9,6 +9,9 @@ pmm_logger = None
 
 
 class BaseTrailingIndicator(ABC):
+    # Keep the running moments of the samples, for the indicators that are calculated from them
+    track_sampling_moments = False
+
     @classmethod
     def logger(cls):
         global pmm_logger
@@ -17,7 +20,7 @@ class BaseTrailingIndicator(ABC):
         return pmm_logger
 
     def __init__(self, sampling_length: int = 30, processing_length: int = 15):
-        self._sampling_buffer = RingBuffer(sampling_length)
+        self._sampling_buffer = RingBuffer(sampling_length, track_moments=self.track_sampling_moments)
         self._processing_buffer = RingBuffer(processing_length)
         self._samples_length = 0
 
@@ -51,7 +54,7 @@ class BaseTrailingIndicator(ABC):
 
     @property
     def is_sampling_buffer_changed(self) -> bool:
-        buffer_len = len(self._sampling_buffer.get_as_numpy_array())
+        buffer_len = self._sampling_buffer.size
         is_changed = self._samples_length != buffer_len
         self._samples_length = buffer_len
         return is_changed
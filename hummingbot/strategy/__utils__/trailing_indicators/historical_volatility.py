@@ -1,18 +1,32 @@
 from .base_trailing_indicator import BaseTrailingIndicator
+from ..ring_buffer import RingBuffer
 import numpy as np
 
 
 class HistoricalVolatilityIndicator(BaseTrailingIndicator):
     def __init__(self, sampling_length: int = 30, processing_length: int = 15):
+        # The log prices of the samples are kept in a second buffer, that keeps the variance of the log returns updated
+        self._log_price_buffer = RingBuffer(sampling_length, track_moments=True)
         super().__init__(sampling_length, processing_length)
 
+    def add_sample(self, value: float):
+        self._log_price_buffer.add_value(np.log(float(value)))
+        super().add_sample(value)
+
     def _indicator_calculation(self) -> float:
-        prices = self._sampling_buffer.get_as_numpy_array()
-        if prices.size > 0:
-            log_returns = np.diff(np.log(prices))
-            return np.var(log_returns)
+        if self._log_price_buffer.size > 0:
+            return self._log_price_buffer.diff_variance
 
     def _processing_calculation(self) -> float:
         processing_array = self._processing_buffer.get_as_numpy_array()
         if processing_array.size > 0:
             return np.sqrt(np.mean(np.nan_to_num(processing_array)))
+
+    @property
+    def sampling_length(self) -> int:
+        return self._sampling_buffer.length
+
+    @sampling_length.setter
+    def sampling_length(self, value):
+        self._sampling_buffer.length = value
+        self._log_price_buffer.length = value
@@ -12,17 +12,33 @@ cdef class TradingIntensityIndicator:
     cdef:
         double _alpha
         double _kappa
-        dict _trade_samples
         list _current_trade_sample
         object _trades_forwarder
         OrderBook _order_book
         object _price_delegate
-        list _last_quotes
         int _sampling_length
         int _samples_length
+        int _refit_interval
+        int _ticks_since_fit
+        bint _samples_changed
+        object _quote_timestamps
+        object _quote_prices
+        int _quotes_start
+        int _quotes_end
+        object _sample_timestamps
+        object _sample_price_levels
+        object _sample_amounts
+        object _sampled_timestamps
+        object _price_levels
+        object _level_volumes
+        object _level_counts
 
     cdef c_calculate(self, timestamp)
     cdef c_register_trade(self, object trade)
+    cdef c_add_quote(self, double timestamp, double price)
+    cdef c_process_trades(self)
+    cdef c_remove_old_samples(self)
+    cdef c_update_volume_by_price_level(self, object price_levels, object amounts, int sign)
     cdef c_estimate_intensity(self)
 
 cdef class TradesForwarder(EventListener):
@@ -1,13 +1,10 @@
 # distutils: language=c++
 # distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
 
-import warnings
-from decimal import Decimal
+import math
 from typing import Tuple
 
 import numpy as np
-from scipy.optimize import curve_fit
-from scipy.optimize import OptimizeWarning
 
 from hummingbot.core.data_type.common import (
     PriceType,
@@ -17,6 +14,80 @@ from hummingbot.core.event.event_listener cimport EventListener
 from hummingbot.core.event.events import OrderBookEvent
 from hummingbot.strategy.asset_price_delegate import AssetPriceDelegate
 
+# Initial capacity of the quotes buffer, it grows when the quotes are not consumed by the trades
+QUOTES_BUFFER_SIZE = 64
+
+
+def fit_intensity(price_levels: np.ndarray, lambdas: np.ndarray, alpha: float = 0, kappa: float = 0,
+                  max_iterations: int = 100) -> Tuple[float, float]:
+    """
+    Least squares fit of lambda = alpha * exp(-kappa * price_level) with alpha and kappa bounded to be non negative,
+    the same model curve_fit was used for. The previous parameters are used as the initial values, when there are none
+    the fit is initialized with the closed form log-linear regression. The Levenberg-Marquardt iterations solve the
+    2x2 normal equations in closed form, so every iteration costs a few vectorized operations over the price levels.
+    """
+    t = np.asarray(price_levels, dtype=np.float64)
+    y = np.asarray(lambdas, dtype=np.float64)
+    if len(t) < 2:
+        raise ValueError("At least two price levels are required to estimate the trading intensity")
+    if alpha <= 0:
+        alpha, kappa = _log_linear_fit(t, y)
+    cost = _squared_residuals(t, y, alpha, kappa)
+    damping = 1e-3
+    for _ in range(max_iterations):
+        decay = np.exp(-kappa * t)
+        weighted_decay = t * decay
+        residuals = alpha * decay - y
+        # Normal equations of the jacobian [decay, -alpha * t * decay]
+        h11 = decay @ decay
+        h12 = -alpha * (weighted_decay @ decay)
+        h22 = alpha * alpha * (weighted_decay @ weighted_decay)
+        g1 = decay @ residuals
+        g2 = -alpha * (weighted_decay @ residuals)
+        while True:
+            a11 = h11 * (1 + damping) + 1e-300
+            a22 = h22 * (1 + damping) + 1e-300
+            determinant = a11 * a22 - h12 * h12
+            new_alpha = max(alpha - (a22 * g1 - h12 * g2) / determinant, 0)
+            new_kappa = max(kappa - (a11 * g2 - h12 * g1) / determinant, 0)
+            if kappa == 0 and new_kappa == 0:
+                # The bound of kappa is active, only alpha can be improved
+                new_alpha = max(alpha - g1 / a11, 0)
+            new_cost = _squared_residuals(t, y, new_alpha, new_kappa)
+            if new_cost < cost:
+                break
+            damping *= 10
+            if damping > 1e16:
+                return float(alpha), float(kappa)
+        step = math.hypot(new_alpha - alpha, new_kappa - kappa)
+        converged = cost - new_cost <= 1e-15 * cost or step <= 1e-12 * (math.hypot(alpha, kappa) + 1e-12)
+        alpha, kappa, cost = new_alpha, new_kappa, new_cost
+        damping = max(damping / 10, 1e-12)
+        if converged:
+            break
+    if not (math.isfinite(alpha) and math.isfinite(kappa)):
+        raise RuntimeError("The trading intensity fit didn't converge")
+    return float(alpha), float(kappa)
+
+
+def _log_linear_fit(t: np.ndarray, y: np.ndarray) -> Tuple[float, float]:
+    # Weighting the log residuals by the lambdas approximates the least squares of the exponential
+    weights = y / y.sum()
+    log_y = np.log(y)
+    t_mean = weights @ t
+    log_y_mean = weights @ log_y
+    variance = weights @ (t - t_mean) ** 2
+    slope = weights @ ((t - t_mean) * (log_y - log_y_mean)) / variance if variance > 0 else 0
+    kappa = max(-slope, 0)
+    decay = np.exp(-kappa * t)
+    return max(float((y @ decay) / (decay @ decay)), 1e-10), float(kappa)
+
+
+def _squared_residuals(t: np.ndarray, y: np.ndarray, alpha: float, kappa: float) -> float:
+    residuals = alpha * np.exp(-kappa * t) - y
+    return float(residuals @ residuals)
+
+
 cdef class TradesForwarder(EventListener):
     def __init__(self, indicator: 'TradingIntensityIndicator'):
         self._indicator = indicator
@@ -26,11 +97,20 @@ cdef class TradesForwarder(EventListener):
 
 
 cdef class TradingIntensityIndicator:
-
-    def __init__(self, order_book: OrderBook, price_delegate: AssetPriceDelegate, sampling_length: int = 30):
+    """
+    Estimates the parameters of the trading intensity, lambda = alpha * exp(-kappa * price_level), from the volume
+    traded at every distance from the mid price.
+
+    The mid price quotes are kept in arrays ordered by timestamp, every trade is matched with the last quote before it
+    with a binary search. The traded volume of the samples is accumulated by price level in a histogram that is
+    updated incrementally when the samples are added and removed, and the fit is refreshed every `refit_interval`
+    ticks, starting from the previous estimation.
+    """
+
+    def __init__(self, order_book: OrderBook, price_delegate: AssetPriceDelegate, sampling_length: int = 30,
+                 refit_interval: int = 1):
         self._alpha = 0
         self._kappa = 0
-        self._trade_samples = {}
         self._current_trade_sample = []
         self._trades_forwarder = TradesForwarder(self)
         self._order_book = order_book
@@ -38,9 +118,20 @@ cdef class TradingIntensityIndicator:
         self._price_delegate = price_delegate
         self._sampling_length = sampling_length
         self._samples_length = 0
-        self._last_quotes = []
-
-        warnings.simplefilter("ignore", OptimizeWarning)
+        self._refit_interval = refit_interval
+        self._ticks_since_fit = 0
+        self._samples_changed = False
+        self._quote_timestamps = np.empty(QUOTES_BUFFER_SIZE, dtype=np.float64)
+        self._quote_prices = np.empty(QUOTES_BUFFER_SIZE, dtype=np.float64)
+        self._quotes_start = 0
+        self._quotes_end = 0
+        self._sample_timestamps = np.empty(0, dtype=np.float64)
+        self._sample_price_levels = np.empty(0, dtype=np.float64)
+        self._sample_amounts = np.empty(0, dtype=np.float64)
+        self._sampled_timestamps = np.empty(0, dtype=np.float64)
+        self._price_levels = np.empty(0, dtype=np.float64)
+        self._level_volumes = np.empty(0, dtype=np.float64)
+        self._level_counts = np.empty(0, dtype=np.int64)
 
     @property
     def current_value(self) -> Tuple[float, float]:
@@ -48,12 +139,12 @@ cdef class TradingIntensityIndicator:
 
     @property
     def is_sampling_buffer_full(self) -> bool:
-        return len(self._trade_samples.keys()) == self._sampling_length
+        return len(self._sampled_timestamps) == self._sampling_length
 
     @property
     def is_sampling_buffer_changed(self) -> bool:
-        is_changed = self._samples_length != len(self._trade_samples.keys())
-        self._samples_length = len(self._trade_samples.keys())
+        is_changed = self._samples_length != len(self._sampled_timestamps)
+        self._samples_length = len(self._sampled_timestamps)
         return is_changed
 
     @property
@@ -64,15 +155,29 @@ cdef class TradingIntensityIndicator:
     def sampling_length(self, new_len: int):
         self._sampling_length = new_len
 
+    @property
+    def refit_interval(self) -> int:
+        return self._refit_interval
+
+    @refit_interval.setter
+    def refit_interval(self, value: int):
+        self._refit_interval = value
+
     @property
     def last_quotes(self) -> list:
         """A helper method to be used in unit tests"""
-        return self._last_quotes
+        timestamps = self._quote_timestamps[self._quotes_start:self._quotes_end]
+        prices = self._quote_prices[self._quotes_start:self._quotes_end]
+        return [{"timestamp": timestamp, "price": price}
+                for timestamp, price in zip(timestamps[::-1].tolist(), prices[::-1].tolist())]
 
     @last_quotes.setter
     def last_quotes(self, value):
         """A helper method to be used in unit tests"""
-        self._last_quotes = value
+        self._quotes_start = 0
+        self._quotes_end = 0
+        for quote in reversed(value):
+            self.c_add_quote(quote["timestamp"], float(quote["price"]))
 
     def calculate(self, timestamp):
         """A helper method to be used in unit tests"""
@@ -80,41 +185,19 @@ cdef class TradingIntensityIndicator:
 
     cdef c_calculate(self, timestamp):
         price = self._price_delegate.get_price_by_type(PriceType.MidPrice)
-        # Descending order of price-timestamp quotes
-        self._last_quotes = [{'timestamp': timestamp, 'price': price}] + self._last_quotes
-
-        latest_processed_quote_idx = None
-        for trade in self._current_trade_sample:
-            for i, quote in enumerate(self._last_quotes):
-                if quote["timestamp"] < trade.timestamp:
-                    if latest_processed_quote_idx is None or i < latest_processed_quote_idx:
-                        latest_processed_quote_idx = i
-                    trade = {"price_level": abs(trade.price - float(quote["price"])), "amount": trade.amount}
+        self.c_add_quote(timestamp, float(price))
 
-                    if quote["timestamp"] + 1 not in self._trade_samples.keys():
-                        self._trade_samples[quote["timestamp"] + 1] = []
+        if len(self._current_trade_sample) > 0:
+            self.c_process_trades()
 
-                    self._trade_samples[quote["timestamp"] + 1] += [trade]
-                    break
+        if len(self._sampled_timestamps) > self._sampling_length:
+            self.c_remove_old_samples()
 
-        # THere are no trades left to process
-        self._current_trade_sample = []
-        # Store quotes that happened after the latest trade + one before
-        if latest_processed_quote_idx is not None:
-            self._last_quotes = self._last_quotes[0:latest_processed_quote_idx + 1]
-
-        if len(self._trade_samples.keys()) > self._sampling_length:
-            timestamps = list(self._trade_samples.keys())
-            timestamps.sort()
-            timestamps = timestamps[-self._sampling_length:]
-
-            trade_samples = {}
-            for timestamp in timestamps:
-                trade_samples[timestamp] = self._trade_samples[timestamp]
-            self._trade_samples = trade_samples
-
-        if self.is_sampling_buffer_full:
+        self._ticks_since_fit += 1
+        if self.is_sampling_buffer_full and self._samples_changed and self._ticks_since_fit >= self._refit_interval:
             self.c_estimate_intensity()
+            self._samples_changed = False
+            self._ticks_since_fit = 0
 
     def register_trade(self, trade):
         """A helper method to be used in unit tests"""
@@ -123,44 +206,92 @@ cdef class TradingIntensityIndicator:
     cdef c_register_trade(self, object trade):
         self._current_trade_sample.append(trade)
 
-    cdef c_estimate_intensity(self):
-        cdef:
-            dict trades_consolidated
-            list lambdas
-            list price_levels
-
-        # Calculate lambdas / trading intensities
-        lambdas = []
-
-        trades_consolidated = {}
-        price_levels = []
-        for timestamp in self._trade_samples.keys():
-            tick = self._trade_samples[timestamp]
-            for trade in tick:
-                if trade['price_level'] not in trades_consolidated.keys():
-                    trades_consolidated[trade['price_level']] = 0
-                    price_levels += [trade['price_level']]
+    cdef c_add_quote(self, double timestamp, double price):
+        cdef int length = self._quotes_end - self._quotes_start
+        if self._quotes_end == len(self._quote_timestamps):
+            capacity = len(self._quote_timestamps) * (2 if length >= len(self._quote_timestamps) // 2 else 1)
+            timestamps = np.empty(capacity, dtype=np.float64)
+            prices = np.empty(capacity, dtype=np.float64)
+            timestamps[:length] = self._quote_timestamps[self._quotes_start:self._quotes_end]
+            prices[:length] = self._quote_prices[self._quotes_start:self._quotes_end]
+            self._quote_timestamps = timestamps
+            self._quote_prices = prices
+            self._quotes_start = 0
+            self._quotes_end = length
+        self._quote_timestamps[self._quotes_end] = timestamp
+        self._quote_prices[self._quotes_end] = price
+        self._quotes_end += 1
+
+    cdef c_process_trades(self):
+        trades = self._current_trade_sample
+        # There are no trades left to process
+        self._current_trade_sample = []
 
-                trades_consolidated[trade['price_level']] += trade['amount']
+        trade_timestamps = np.fromiter((trade.timestamp for trade in trades), dtype=np.float64, count=len(trades))
+        trade_prices = np.fromiter((trade.price for trade in trades), dtype=np.float64, count=len(trades))
+        trade_amounts = np.fromiter((trade.amount for trade in trades), dtype=np.float64, count=len(trades))
+        quote_timestamps = self._quote_timestamps[self._quotes_start:self._quotes_end]
+        quote_prices = self._quote_prices[self._quotes_start:self._quotes_end]
+
+        # Index of the last quote before every trade
+        quote_indexes = np.searchsorted(quote_timestamps, trade_timestamps, side="left") - 1
+        matched = quote_indexes >= 0
+        if not matched.any():
+            return
+        quote_indexes = quote_indexes[matched]
+        price_levels = np.abs(trade_prices[matched] - quote_prices[quote_indexes])
+        amounts = trade_amounts[matched]
+        timestamps = quote_timestamps[quote_indexes] + 1
+
+        self._sample_timestamps = np.concatenate([self._sample_timestamps, timestamps])
+        self._sample_price_levels = np.concatenate([self._sample_price_levels, price_levels])
+        self._sample_amounts = np.concatenate([self._sample_amounts, amounts])
+        self._sampled_timestamps = np.union1d(self._sampled_timestamps, timestamps)
+        self.c_update_volume_by_price_level(price_levels, amounts, 1)
+        self._samples_changed = True
 
-        price_levels = sorted(price_levels, reverse=True)
+        # Store quotes that happened after the latest trade + one before
+        self._quotes_start += int(quote_indexes.max())
+
+    cdef c_remove_old_samples(self):
+        first_timestamp = self._sampled_timestamps[-self._sampling_length]
+        removed = self._sample_timestamps < first_timestamp
+        self.c_update_volume_by_price_level(self._sample_price_levels[removed], self._sample_amounts[removed], -1)
+        kept = ~removed
+        self._sample_timestamps = self._sample_timestamps[kept]
+        self._sample_price_levels = self._sample_price_levels[kept]
+        self._sample_amounts = self._sample_amounts[kept]
+        self._sampled_timestamps = self._sampled_timestamps[-self._sampling_length:]
+        self._samples_changed = True
+
+    cdef c_update_volume_by_price_level(self, object price_levels, object amounts, int sign):
+        levels, inverse = np.unique(price_levels, return_inverse=True)
+        volumes = sign * np.bincount(inverse, weights=amounts, minlength=len(levels))
+        counts = sign * np.bincount(inverse, minlength=len(levels))
+        indexes = np.searchsorted(self._price_levels, levels)
+        existing = indexes < len(self._price_levels)
+        existing[existing] = self._price_levels[indexes[existing]] == levels[existing]
+        self._level_volumes[indexes[existing]] += volumes[existing]
+        self._level_counts[indexes[existing]] += counts[existing]
+        if not existing.all():
+            new = ~existing
+            self._price_levels = np.insert(self._price_levels, indexes[new], levels[new])
+            self._level_volumes = np.insert(self._level_volumes, indexes[new], volumes[new])
+            self._level_counts = np.insert(self._level_counts, indexes[new], counts[new])
+        if sign < 0:
+            kept = self._level_counts > 0
+            self._price_levels = self._price_levels[kept]
+            self._level_volumes = self._level_volumes[kept]
+            self._level_counts = self._level_counts[kept]
 
-        for price_level in price_levels:
-            lambdas += [trades_consolidated[price_level]]
+    cdef c_estimate_intensity(self):
+        lambdas = self._level_volumes.copy()
 
         # Adjust to be able to calculate log
-        lambdas_adj = [10**-10 if x==0 else x for x in lambdas]
+        lambdas[lambdas == 0] = 10 ** -10
 
-        # Fit the probability density function; reuse previously calculated parameters as initial values
+        # Reuse previously calculated parameters as initial values
         try:
-            params = curve_fit(lambda t, a, b: a*np.exp(-b*t),
-                               price_levels,
-                               lambdas_adj,
-                               p0=(self._alpha, self._kappa),
-                               method='dogbox',
-                               bounds=([0, 0], [np.inf, np.inf]))
-
-            self._kappa = Decimal(str(params[0][1]))
-            self._alpha = Decimal(str(params[0][0]))
-        except (RuntimeError, ValueError) as e:
+            self._alpha, self._kappa = fit_intensity(self._price_levels, lambdas, self._alpha, self._kappa)
+        except (RuntimeError, ValueError, np.linalg.LinAlgError):
             pass
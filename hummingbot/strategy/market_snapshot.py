@@ -0,0 +1,110 @@
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+
+from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.core.data_type.common import PriceType
+from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.strategy.order_tracker import OrderTracker
+
+
+class MarketSnapshot:
+    """
+    Read only view of the markets of a strategy for one tick. Each price, balance and the active orders are read from
+    the connectors the first time they are requested, and the same values are returned for the rest of the tick, so
+    the executors and controllers that look them up in the same tick get consistent values without recomputing them.
+
+    The snapshot is never updated, the strategy replaces it when the tick changes or when its orders change.
+    """
+
+    def __init__(self, timestamp: float, connectors: Dict[str, ConnectorBase], order_tracker: OrderTracker):
+        """
+        :param timestamp: The timestamp of the tick.
+        :param connectors: A dictionary of connector names and their corresponding connector.
+        :param order_tracker: The order tracker of the strategy, the active orders are read from it.
+        """
+        self._timestamp = timestamp
+        self._connectors = connectors
+        self._order_tracker = order_tracker
+        self._prices: Dict[Tuple[str, str, PriceType], Decimal] = {}
+        self._balances: Dict[Tuple[str, str], Decimal] = {}
+        self._available_balances: Dict[Tuple[str, str], Decimal] = {}
+        self._active_orders: Optional[Dict[str, Dict[str, LimitOrder]]] = None
+
+    @property
+    def timestamp(self) -> float:
+        return self._timestamp
+
+    def get_price_by_type(self, connector_name: str, trading_pair: str, price_type: PriceType) -> Decimal:
+        """
+        :param connector_name: The name of the connector.
+        :param trading_pair: The trading pair.
+        :param price_type: The type of the price.
+        :return: The price of the trading pair at the tick.
+        """
+        key = (connector_name, trading_pair, price_type)
+        price = self._prices.get(key)
+        if price is None:
+            price = self._connectors[connector_name].get_price_by_type(trading_pair, price_type)
+            self._prices[key] = price
+        return price
+
+    def get_mid_price(self, connector_name: str, trading_pair: str) -> Decimal:
+        return self.get_price_by_type(connector_name, trading_pair, PriceType.MidPrice)
+
+    def get_best_bid(self, connector_name: str, trading_pair: str) -> Decimal:
+        return self.get_price_by_type(connector_name, trading_pair, PriceType.BestBid)
+
+    def get_best_ask(self, connector_name: str, trading_pair: str) -> Decimal:
+        return self.get_price_by_type(connector_name, trading_pair, PriceType.BestAsk)
+
+    def get_balance(self, connector_name: str, asset: str) -> Decimal:
+        """
+        :param connector_name: The name of the connector.
+        :param asset: The asset.
+        :return: The total balance of the asset at the tick.
+        """
+        key = (connector_name, asset)
+        balance = self._balances.get(key)
+        if balance is None:
+            balance = self._connectors[connector_name].get_balance(asset)
+            self._balances[key] = balance
+        return balance
+
+    def get_available_balance(self, connector_name: str, asset: str) -> Decimal:
+        """
+        :param connector_name: The name of the connector.
+        :param asset: The asset.
+        :return: The available balance of the asset at the tick.
+        """
+        key = (connector_name, asset)
+        balance = self._available_balances.get(key)
+        if balance is None:
+            balance = self._connectors[connector_name].get_available_balance(asset)
+            self._available_balances[key] = balance
+        return balance
+
+    def get_active_orders(self, connector_name: str) -> List[LimitOrder]:
+        """
+        :param connector_name: The name of the connector.
+        :return: A list of the active orders of the strategy in the connector.
+        """
+        return list(self._active_orders_by_id(connector_name).values())
+
+    def get_active_order(self, connector_name: str, order_id: str) -> Optional[LimitOrder]:
+        """
+        :param connector_name: The name of the connector.
+        :param order_id: The client order id.
+        :return: The active order with the id, or None if the order is not active.
+        """
+        return self._active_orders_by_id(connector_name).get(order_id)
+
+    def _active_orders_by_id(self, connector_name: str) -> Dict[str, LimitOrder]:
+        if self._active_orders is None:
+            # The active orders of all the connectors are indexed with a single pass over the tracked orders
+            connector_names = {id(connector): name for name, connector in self._connectors.items()}
+            self._active_orders = {name: {} for name in self._connectors}
+            for connector, order in self._order_tracker.active_limit_orders:
+                name = connector_names.get(id(connector))
+                if name is not None:
+                    self._active_orders[name][order.client_order_id] = order
+        return self._active_orders[connector_name]
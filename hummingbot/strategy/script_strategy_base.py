@@ -8,9 +8,12 @@ from pydantic import BaseModel
 
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.connector.utils import split_hb_trading_pair
+from hummingbot.core.clock import Clock
 from hummingbot.core.data_type.limit_order import LimitOrder
-from hummingbot.core.event.events import OrderType, PositionAction
+from hummingbot.core.event.event_forwarder import EventForwarder
+from hummingbot.core.event.events import MarketEvent, OrderType, PositionAction
 from hummingbot.logger import HummingbotLogger
+from hummingbot.strategy.market_snapshot import MarketSnapshot
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.strategy_py_base import StrategyPyBase
 
@@ -33,6 +36,18 @@ class ScriptStrategyBase(StrategyPyBase):
     # This class member defines connectors and their trading pairs needed for the strategy operation,
     markets: Dict[str, Set[str]]
 
+    # The events that change the active orders or the balances of the markets snapshot
+    MARKET_SNAPSHOT_EVENTS = [
+        MarketEvent.BuyOrderCreated,
+        MarketEvent.SellOrderCreated,
+        MarketEvent.OrderFilled,
+        MarketEvent.OrderCancelled,
+        MarketEvent.OrderExpired,
+        MarketEvent.OrderFailure,
+        MarketEvent.BuyOrderCompleted,
+        MarketEvent.SellOrderCompleted,
+    ]
+
     @classmethod
     def logger(cls) -> HummingbotLogger:
         global lsb_logger
@@ -57,6 +72,39 @@ class ScriptStrategyBase(StrategyPyBase):
         self.ready_to_trade: bool = False
         self.add_markets(list(connectors.values()))
         self.config = config
+        self._market_snapshot: Optional[MarketSnapshot] = None
+        self._processing_tick = False
+        self._market_snapshot_forwarder = EventForwarder(self._invalidate_market_snapshot)
+        for connector in connectors.values():
+            for event in self.MARKET_SNAPSHOT_EVENTS:
+                connector.add_listener(event, self._market_snapshot_forwarder)
+
+    @property
+    def market_snapshot(self) -> MarketSnapshot:
+        """
+        Returns the snapshot of the markets for the current tick. Prices, balances and active orders read from it are
+        computed once per tick, it is created again when the tick changes or when an order of the strategy changes.
+        """
+        if self._market_snapshot is None or self._market_snapshot.timestamp != self.current_timestamp:
+            self._market_snapshot = MarketSnapshot(self.current_timestamp, self.connectors, self.order_tracker)
+        return self._market_snapshot
+
+    @property
+    def tick_market_snapshot(self) -> Optional[MarketSnapshot]:
+        """
+        Returns the snapshot of the markets while the strategy processes a tick, or None outside of it. The code that
+        runs in its own loop, like the control tasks of the controllers, gets None and reads the live markets.
+        """
+        return self.market_snapshot if self._processing_tick else None
+
+    def _invalidate_market_snapshot(self, *_):
+        self._market_snapshot = None
+
+    def stop(self, clock: Clock):
+        for connector in self.connectors.values():
+            for event in self.MARKET_SNAPSHOT_EVENTS:
+                connector.remove_listener(event, self._market_snapshot_forwarder)
+        self._market_snapshot = None
 
     def tick(self, timestamp: float):
         """
@@ -72,7 +120,11 @@ class ScriptStrategyBase(StrategyPyBase):
                     self.logger().warning(f"{con.name} is not ready. Please wait...")
                 return
         else:
-            self.on_tick()
+            self._processing_tick = True
+            try:
+                self.on_tick()
+            finally:
+                self._processing_tick = False
 
     def on_tick(self):
         """
@@ -105,7 +157,9 @@ class ScriptStrategyBase(StrategyPyBase):
         """
         market_pair = self._market_trading_pair_tuple(connector_name, trading_pair)
         self.logger().info(f"Creating {trading_pair} buy order: price: {price} amount: {amount}.")
-        return self.buy_with_specific_market(market_pair, amount, order_type, price, position_action=position_action)
+        order_id = self.buy_with_specific_market(market_pair, amount, order_type, price, position_action=position_action)
+        self._invalidate_market_snapshot()
+        return order_id
 
     def sell(self,
              connector_name: str,
@@ -128,7 +182,9 @@ class ScriptStrategyBase(StrategyPyBase):
         """
         market_pair = self._market_trading_pair_tuple(connector_name, trading_pair)
         self.logger().info(f"Creating {trading_pair} sell order: price: {price} amount: {amount}.")
-        return self.sell_with_specific_market(market_pair, amount, order_type, price, position_action=position_action)
+        order_id = self.sell_with_specific_market(market_pair, amount, order_type, price, position_action=position_action)
+        self._invalidate_market_snapshot()
+        return order_id
 
     def cancel(self,
                connector_name: str,
@@ -143,6 +199,7 @@ class ScriptStrategyBase(StrategyPyBase):
         """
         market_pair = self._market_trading_pair_tuple(connector_name, trading_pair)
         self.cancel_order(market_trading_pair_tuple=market_pair, order_id=order_id)
+        self._invalidate_market_snapshot()
 
     def get_active_orders(self, connector_name: str) -> List[LimitOrder]:
         """
@@ -150,9 +207,7 @@ class ScriptStrategyBase(StrategyPyBase):
         :param connector_name: The name of the connector.
         :return: A list of active orders
         """
-        orders = self.order_tracker.active_limit_orders
-        connector = self.connectors[connector_name]
-        return [o[1] for o in orders if o[0] == connector]
+        return self.market_snapshot.get_active_orders(connector_name)
 
     def get_assets(self, connector_name: str) -> List[str]:
         """
@@ -23,7 +23,11 @@ from hummingbot.strategy_v2.controllers.controller_base import ControllerBase, C
 from hummingbot.strategy_v2.controllers.directional_trading_controller_base import (
     DirectionalTradingControllerConfigBase,
 )
+from hummingbot.strategy_v2.controllers.feature_computation_pool import FeatureComputationPool
 from hummingbot.strategy_v2.controllers.market_making_controller_base import MarketMakingControllerConfigBase
+from hummingbot.strategy_v2.controllers.multi_pair_directional_controller_base import (
+    MultiPairDirectionalControllerConfigBase,
+)
 from hummingbot.strategy_v2.executors.executor_orchestrator import ExecutorOrchestrator
 from hummingbot.strategy_v2.models.base import RunnableStatus
 from hummingbot.strategy_v2.models.executor_actions import (
@@ -104,7 +108,8 @@ class StrategyV2ConfigBase(BaseClientModel):
             config_class = next((member for member_name, member in inspect.getmembers(module)
                                  if inspect.isclass(member) and member not in [ControllerConfigBase,
                                                                                MarketMakingControllerConfigBase,
-                                                                               DirectionalTradingControllerConfigBase]
+                                                                               DirectionalTradingControllerConfigBase,
+                                                                               MultiPairDirectionalControllerConfigBase]
                                  and (issubclass(member, ControllerConfigBase))), None)
             if not config_class:
                 raise InvalidController(f"No configuration class found in the module {controller_name}.")
@@ -202,7 +207,7 @@ class StrategyV2Base(ScriptStrategyBase):
         self.listen_to_executor_actions_task: asyncio.Task = asyncio.create_task(self.listen_to_executor_actions())
 
         # Initialize the market data provider
-        self.market_data_provider = MarketDataProvider(connectors)
+        self.market_data_provider = MarketDataProvider(connectors, lambda: self.tick_market_snapshot)
         self.market_data_provider.initialize_candles_feed_list(config.candles_config)
         self.controllers: Dict[str, ControllerBase] = {}
         self.initialize_controllers()
@@ -278,6 +283,7 @@ class StrategyV2Base(ScriptStrategyBase):
         self.listen_to_executor_actions_task.cancel()
         for controller in self.controllers.values():
             controller.stop()
+        FeatureComputationPool.stop()
 
     def on_tick(self):
         self.update_executors_info()
@@ -369,6 +375,7 @@ class StrategyV2Base(ScriptStrategyBase):
         # Process each controller
         for controller_id, controller in self.controllers.items():
             extra_info.append(f"\n\nController: {controller_id}")
+            extra_info.append(controller.evaluation_scheduler.stats.to_format_status())
             # Append controller market data metrics
             extra_info.extend(controller.to_format_status())
             executors_list = self.get_executors_by_controller(controller_id)